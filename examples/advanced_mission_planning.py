@@ -10,10 +10,14 @@ This example demonstrates advanced mission planning capabilities including:
 """
 
 import logging
-import time
-from mspkit import connect, FlightController
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from mspkit import connect, FlightController, MSPCommands
+from mspkit.geo import geodetic_scales, ANGLES_LUT
 from mspkit.mission import Mission
 from mspkit.mission_simulator import MissionSimulator
+from mspkit.rt import realtime_priority
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,22 +38,21 @@ def create_search_and_rescue_mission():
     # Starting point
     mission.add_waypoint(*search_center, action=Mission.WAYPOINT_ACTION_WAYPOINT)
     
-    # Create expanding square pattern
-    angles = [0, 90, 180, 270]  # North, East, South, West
-    for radius in range(50, search_radius + 1, 50):
-        for angle in angles:
-            import math
-            lat_offset = radius * math.cos(math.radians(angle)) / 111320.0
-            lon_offset = radius * math.sin(math.radians(angle)) / (111320.0 * math.cos(math.radians(search_center[0])))
-            
-            new_lat = search_center[0] + lat_offset
-            new_lon = search_center[1] + lon_offset
-            
-            mission.add_waypoint(
-                new_lat, new_lon, search_center[2],
-                action=Mission.WAYPOINT_ACTION_WAYPOINT,
-                param1=300  # Slow speed for detailed observation
-            )
+    # Create expanding square pattern: one row per radius, one column per
+    # heading (North, East, South, West), computed in a single pass
+    center_lat, center_lon, altitude = search_center
+    lat_scale, lon_scale = geodetic_scales(center_lat)
+    cos_a, sin_a = np.array(ANGLES_LUT).T
+    radii = np.arange(50, search_radius + 1, 50)[:, np.newaxis]
+    lats = center_lat + radii * cos_a * lat_scale
+    lons = center_lon + radii * sin_a * lon_scale
+    
+    for new_lat, new_lon in zip(lats.ravel().tolist(), lons.ravel().tolist()):
+        mission.add_waypoint(
+            new_lat, new_lon, altitude,
+            action=Mission.WAYPOINT_ACTION_WAYPOINT,
+            param1=300  # Slow speed for detailed observation
+        )
     
     # Return to home
     mission.add_waypoint(*search_center, action=Mission.WAYPOINT_ACTION_RTH)
@@ -75,44 +78,90 @@ def create_search_and_rescue_mission():
             print(f"  - {error}")
         return False
     
-    # Upload mission if valid
+    # Upload mission if valid, saving it for future use while the
+    # serial transfer runs
     if validation['valid']:
         print("Uploading mission...")
-        if mission.upload_mission():
-            print("Mission uploaded successfully!")
-            
-            # Save mission for future use
-            mission.save_mission_to_file("search_rescue_mission.json")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            upload = executor.submit(mission.upload_mission)
+            save = executor.submit(mission.save_mission_to_file, "search_rescue_mission.json")
+            uploaded, saved = upload.result(), save.result()
+        
+        if saved:
             print("Mission saved to file")
+        if uploaded:
+            print("Mission uploaded successfully!")
             return True
     
     return False
 
+class TelemetrySnapshot:
+    """Latest telemetry published by the monitor's producer thread
+    
+    Each field is replaced with a fresh dict on every update, so readers
+    always see a complete value without taking a lock. The producer sets
+    `updated` after each refresh so the display can wake on new data.
+    """
+    __slots__ = ('attitude', 'gps', 'nav', 'updated')
+    
+    def __init__(self):
+        self.attitude = {}
+        self.gps = {}
+        self.nav = {}
+        self.updated = threading.Event()
+
+def _produce_telemetry(telem, snapshot, stop_event, period=0.2):
+    """Keep snapshot up to date until stop_event is set"""
+    codes = (MSPCommands.MSP_ATTITUDE, MSPCommands.MSP_RAW_GPS, MSPCommands.MSP_NAV_STATUS)
+    # Scheduling policy is per thread, so only the polling loop is raised;
+    # set MSPKIT_RT_CPU to pin it to an isolated core
+    with realtime_priority():
+        while not stop_event.is_set():
+            try:
+                bundle = telem.get_bundle(codes)
+                snapshot.attitude = bundle.get('attitude', snapshot.attitude)
+                snapshot.gps = bundle.get('gps', snapshot.gps)
+                snapshot.nav = bundle.get('navigation', snapshot.nav)
+                if bundle:
+                    snapshot.updated.set()
+            except Exception as e:
+                logger.warning("Telemetry read failed: %s", e)
+            stop_event.wait(period)
+
 def monitor_mission_execution(conn):
     """Monitor mission execution in real-time"""
     from mspkit import Telemetry
     
     telem = Telemetry(conn)
+    snapshot = TelemetrySnapshot()
+    stop_event = threading.Event()
+    producer = threading.Thread(target=_produce_telemetry,
+                                args=(telem, snapshot, stop_event), daemon=True)
+    producer.start()
     
     print("Monitoring mission execution...")
     print("Press Ctrl+C to stop monitoring")
     
     try:
         while True:
-            # Get current status
-            attitude = telem.get_attitude()
-            gps = telem.get_gps()
-            nav_status = telem.get_nav_status()
+            # Sleep until the producer publishes new data (or the link goes
+            # quiet for a second), then render the latest snapshot
+            if not snapshot.updated.wait(1.0):
+                continue
+            snapshot.updated.clear()
+            gps = snapshot.gps
+            nav_status = snapshot.nav
             
-            print(f"\rAlt: {gps.get('alt', 0):.1f}m | "
-                  f"GPS: {gps.get('lat', 0):.6f}, {gps.get('lon', 0):.6f} | "
+            print(f"\rAlt: {gps.get('altitude', 0):.1f}m | "
+                  f"GPS: {gps.get('latitude', 0):.6f}, {gps.get('longitude', 0):.6f} | "
                   f"WP: {nav_status.get('waypoint_number', 0)} | "
-                  f"Mode: {nav_status.get('nav_state', 'UNKNOWN')}", end='')
-            
-            time.sleep(1)
+                  f"Mode: {nav_status.get('nav_state', 'UNKNOWN')}", end='', flush=True)
             
     except KeyboardInterrupt:
         print("\nMonitoring stopped")
+    finally:
+        stop_event.set()
+        producer.join(timeout=2)
 
 if __name__ == "__main__":
     if create_search_and_rescue_mission():
@@ -6,14 +6,108 @@ This example demonstrates how to connect to a flight controller and read basic t
 Perfect for beginners getting started with MSPKit.
 """
 
-import time
+import argparse
+import asyncio
 import logging
+import sys
+from operator import itemgetter
 from mspkit import connect, FlightController, Telemetry
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Status line, filled from each telemetry frame tuple with the % operator:
+# (roll, pitch, yaw, lat, lon, alt, satellites, voltage, current, mah_drawn,
+#  throttle, armed)
+STATUS_TEMPLATE = (
+    "\r"
+    "Attitude: R%6.1f° P%6.1f° Y%6.1f° | "
+    "GPS: %9.6f,%10.6f Alt:%5.1fm Sats:%2d | "
+    "Battery: %4.2fV %6.1fA %5.0fmAh | "
+    "Throttle: %4d | "
+    "%s"
+)
+
+class StatusLine:
+    """Single-line status display written straight to stdout"""
+    
+    def __init__(self, template):
+        self.template = template
+        # Write bytes straight to the binary stream when there is one
+        self.out = getattr(sys.stdout, 'buffer', None)
+    
+    def write(self, frame):
+        """Render frame and write it out"""
+        line = self.template % frame
+        if self.out is None:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            return
+        
+        self.out.write(line.encode('utf-8', 'replace'))
+        self.out.flush()
+
+# Field extractors for the decoded telemetry sections, and the values shown
+# when a section is missing from the bundle
+ATTITUDE_FIELDS = itemgetter('roll', 'pitch', 'yaw')
+GPS_FIELDS = itemgetter('latitude', 'longitude', 'altitude', 'num_satellites')
+BATTERY_FIELDS = itemgetter('voltage', 'amperage', 'mah_drawn')
+DEFAULT_ATTITUDE = {'roll': 0, 'pitch': 0, 'yaw': 0}
+DEFAULT_GPS = {'latitude': 0, 'longitude': 0, 'altitude': 0, 'num_satellites': 0}
+DEFAULT_BATTERY = {'voltage': 0, 'amperage': 0, 'mah_drawn': 0}
+
+# Longest pause between retries after a failed read (seconds)
+MAX_BACKOFF = 1.0
+
+def read_once(telem):
+    """Read one telemetry frame (attitude, GPS, battery, RC, status)"""
+    # One pipelined burst: all five requests go out before any reply is read
+    bundle = telem.get_bundle()
+    roll, pitch, yaw = ATTITUDE_FIELDS(bundle.get('attitude', DEFAULT_ATTITUDE))
+    lat, lon, alt, satellites = GPS_FIELDS(bundle.get('gps', DEFAULT_GPS))
+    voltage, current, mah_drawn = BATTERY_FIELDS(bundle.get('analog', DEFAULT_BATTERY))
+    channels = bundle.get('rc', {}).get('channels', [])
+    armed = bundle.get('status', {}).get('armed', False)
+
+    # RC channels (AETR order, throttle is channel 4)
+    throttle = channels[3] if len(channels) > 3 else 1000
+
+    return (roll, pitch, yaw, lat, lon, alt, satellites,
+            voltage, current, mah_drawn, throttle,
+            'ARMED' if armed else 'DISARMED')
+
+async def stream_telemetry(telem, period=0.1):
+    """Poll telemetry on a fixed-rate schedule without blocking the event loop"""
+    loop = asyncio.get_event_loop()
+    deadline = loop.time()
+    backoff = period
+    status_line = StatusLine(STATUS_TEMPLATE)
+
+    while True:
+        try:
+            # The blocking serial burst runs in a worker thread while the
+            # event loop stays responsive.
+            frame = await loop.run_in_executor(None, read_once, telem)
+
+            # Display data in a formatted way
+            status_line.write(frame)
+
+            # Sleep only for what is left of this period; if the round-trip
+            # overran it, start the next cycle right away instead of drifting
+            backoff = period
+            deadline += period
+            now = loop.time()
+            if deadline < now:
+                deadline = now
+            await asyncio.sleep(deadline - now)
+
+        except Exception as e:
+            print(f"\n❌ Error reading telemetry: {e}")
+            backoff = min(MAX_BACKOFF, backoff * 2)
+            await asyncio.sleep(backoff)
+            deadline = loop.time()
+
 def main():
     """Main telemetry reading function"""
     
@@ -21,6 +115,13 @@ def main():
     SERIAL_PORT = '/dev/ttyUSB0'  # Change to your port (Windows: 'COM3', macOS: '/dev/tty.usbserial-*')
     FC_TYPE = FlightController.INAV  # or FlightController.BETAFLIGHT
     
+    parser = argparse.ArgumentParser(description="Read basic telemetry from a flight controller")
+    parser.add_argument('--port', default=SERIAL_PORT, help='Serial port')
+    parser.add_argument('--period', type=float, default=0.1,
+                        help='Polling period in seconds (default: 0.1 = 10Hz)')
+    args = parser.parse_args()
+    SERIAL_PORT = args.port
+    
     try:
         # Connect to flight controller
         print(f"Connecting to {FC_TYPE.name} on {SERIAL_PORT}...")
@@ -41,54 +142,10 @@ def main():
         print("Reading telemetry data (Press Ctrl+C to stop)...")
         print("=" * 80)
         
-        while True:
-            try:
-                # Get attitude data
-                attitude = telem.get_attitude()
-                roll = attitude.get('roll', 0)
-                pitch = attitude.get('pitch', 0)
-                yaw = attitude.get('yaw', 0)
-                
-                # Get GPS data
-                gps = telem.get_gps()
-                lat = gps.get('lat', 0)
-                lon = gps.get('lon', 0)
-                alt = gps.get('alt', 0)
-                satellites = gps.get('num_sat', 0)
-                fix_type = gps.get('fix_type', 0)
-                
-                # Get battery info
-                battery = telem.get_battery()
-                voltage = battery.get('voltage', 0)
-                current = battery.get('current', 0)
-                mah_drawn = battery.get('mah_drawn', 0)
-                
-                # Get RC channels
-                rc = telem.get_rc_channels()
-                throttle = rc.get('throttle', 1000) if rc else 1000
-                
-                # Get flight status
-                status = telem.get_status()
-                armed = status.get('armed', False)
-                flight_mode = status.get('flight_mode_flags', 0)
-                
-                # Display data in a formatted way
-                print(f"\r"
-                      f"Attitude: R{roll:6.1f}° P{pitch:6.1f}° Y{yaw:6.1f}° | "
-                      f"GPS: {lat:9.6f},{lon:10.6f} Alt:{alt:5.1f}m Sats:{satellites:2d} | "
-                      f"Battery: {voltage:4.2f}V {current:6.1f}A {mah_drawn:5.0f}mAh | "
-                      f"Throttle: {throttle:4d} | "
-                      f"{'ARMED' if armed else 'DISARMED'}", 
-                      end='', flush=True)
-                
-                time.sleep(0.1)  # 10Hz update rate
-                
-            except KeyboardInterrupt:
-                print("\n\n🛑 Telemetry reading stopped by user")
-                break
-            except Exception as e:
-                print(f"\n❌ Error reading telemetry: {e}")
-                time.sleep(1)
+        try:
+            asyncio.run(stream_telemetry(telem, args.period))
+        except KeyboardInterrupt:
+            print("\n\n🛑 Telemetry reading stopped by user")
                 
     except Exception as e:
         print(f"❌ Connection failed: {e}")
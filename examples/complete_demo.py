@@ -13,22 +13,102 @@ This comprehensive example demonstrates all major capabilities of MSPKit:
 Perfect for demonstrating the full capabilities of the SDK.
 """
 
+import argparse
+import math
+import sys
 import time
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, Any
 from mspkit import (
     connect, FlightController, Telemetry, Control, 
-    Mission, Config, Sensors
+    Mission, Config, Sensors, MSPCommands, GPSFixType
 )
+from mspkit.geo import geodetic_scales
+
+# Optional faster JSON encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional compact binary format for configuration backups
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# Optional JIT compiler for the sensor health checks
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        return lambda func: func
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Telemetry requested together on every monitoring cycle
+TELEMETRY_BUNDLE = (
+    MSPCommands.MSP_ATTITUDE,
+    MSPCommands.MSP_RAW_GPS,
+    MSPCommands.MSP_ANALOG,
+)
+
+# Field extractors for bundled telemetry, and defaults for missing sections
+ATTITUDE_FIELDS = itemgetter('roll', 'pitch', 'yaw')
+GPS_FIELDS = itemgetter('altitude', 'num_satellites')
+DEFAULT_ATTITUDE = {'roll': 0, 'pitch': 0, 'yaw': 0}
+DEFAULT_GPS = {'altitude': 0, 'num_satellites': 0}
+DEFAULT_BATTERY = {'voltage': 0}
+
+# Sensor health checks: (name, key in sensors_detected, bit set by check_sensors)
+# MSP_STATUS has no separate gyro flag; the gyro shares the IMU with the accelerometer
+SENSORS_TO_CHECK = (
+    ('Accelerometer', 'accelerometer', 1 << 0),
+    ('Gyroscope', 'accelerometer', 1 << 1),
+    ('Magnetometer', 'magnetometer', 1 << 2),
+    ('GPS', 'gps', 1 << 3),
+    ('Barometer', 'barometer', 1 << 4),
+)
+
+@njit(cache=True)
+def check_sensors(ax, ay, az, gx, gy, gz, mx, my, mz, fix, nsat, alt):
+    """Run every sensor health test, returning a bitmask of healthy sensors"""
+    healthy = 0
+    if 900 < math.sqrt(ax * ax + ay * ay + az * az) < 1100:  # ~1g at rest
+        healthy |= 1 << 0
+    if abs(gx) < 100 and abs(gy) < 100 and abs(gz) < 100:  # Low noise when still
+        healthy |= 1 << 1
+    if math.sqrt(mx * mx + my * my + mz * mz) > 100:
+        healthy |= 1 << 2
+    if fix >= 2 and nsat >= 4:
+        healthy |= 1 << 3
+    if -1000 < alt < 10000:
+        healthy |= 1 << 4
+    return healthy
+
+# One row of the telemetry monitoring table
+MONITOR_ROW_TEMPLATE = (
+    "{elapsed:4.1f} | {roll:5.1f} | {pitch:5.1f} | {yaw:5.1f} | "
+    "{alt:5.1f} | {voltage:7.2f} | {satellites:8d}\n"
+)
+# Rows buffered before each write/flush of the monitoring table
+MONITOR_FLUSH_EVERY = 10
+
 class MSPKitDemo:
     """Complete demonstration of MSPKit capabilities"""
     
-    def __init__(self, serial_port: str, fc_type: FlightController):
+    def __init__(self, serial_port: str, fc_type: FlightController,
+                 backup_format: str = 'json'):
         print(f"🚁 MSPKit SDK Complete Demo")
         print("=" * 50)
         print(f"Connecting to {fc_type.name} on {serial_port}...")
@@ -41,6 +121,7 @@ class MSPKitDemo:
         self.config = Config(self.conn)
         self.sensors = Sensors(self.conn)
         self.fc_type = fc_type
+        self.backup_format = backup_format
         
         print("✅ All modules initialized successfully!")
         
@@ -62,41 +143,61 @@ class MSPKitDemo:
         except Exception as e:
             print(f"   ⚠️  Could not read system info: {e}")
     
-    def demo_telemetry_monitoring(self, duration: int = 10):
+    def demo_telemetry_monitoring(self, duration: int = 10, period: float = 0.5):
         """Demonstrate real-time telemetry monitoring"""
         print(f"\n📡 Telemetry Monitoring Demo ({duration}s)")
         print("-" * 50)
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time
         sample_count = 0
         
         print("Real-time telemetry data:")
         print("Time | Roll  | Pitch | Yaw   | Alt   | Battery | GPS Sats")
         print("-" * 65)
         
+        out = sys.stdout
+        rows = []
+        
         try:
-            while time.time() - start_time < duration:
-                # Get telemetry data
-                attitude = self.telemetry.get_attitude()
-                gps = self.telemetry.get_gps()
-                battery = self.telemetry.get_battery()
+            while True:
+                elapsed = time.monotonic() - start_time
+                if elapsed >= duration:
+                    break
                 
-                elapsed = time.time() - start_time
-                roll = attitude.get('roll', 0)
-                pitch = attitude.get('pitch', 0)
-                yaw = attitude.get('yaw', 0)
-                alt = gps.get('alt', 0)
-                voltage = battery.get('voltage', 0)
-                satellites = gps.get('num_sat', 0)
+                # Get telemetry data in one pipelined burst
+                bundle = self.telemetry.get_bundle(TELEMETRY_BUNDLE)
+                roll, pitch, yaw = ATTITUDE_FIELDS(bundle.get('attitude', DEFAULT_ATTITUDE))
+                alt, satellites = GPS_FIELDS(bundle.get('gps', DEFAULT_GPS))
                 
-                print(f"{elapsed:4.1f} | {roll:5.1f} | {pitch:5.1f} | {yaw:5.1f} | {alt:5.1f} | {voltage:7.2f} | {satellites:8d}")
+                frame = {
+                    'elapsed': elapsed,
+                    'roll': roll,
+                    'pitch': pitch,
+                    'yaw': yaw,
+                    'alt': alt,
+                    'voltage': bundle.get('analog', DEFAULT_BATTERY)['voltage'],
+                    'satellites': satellites,
+                }
+                rows.append(MONITOR_ROW_TEMPLATE.format_map(frame))
+                if len(rows) >= MONITOR_FLUSH_EVERY:
+                    out.write(''.join(rows))
+                    out.flush()
+                    rows.clear()
                 
                 sample_count += 1
-                time.sleep(0.5)
+                
+                # Hold the sampling period regardless of round-trip time
+                deadline += period
+                time.sleep(max(0.0, deadline - time.monotonic()))
                 
         except KeyboardInterrupt:
+            out.write(''.join(rows))
+            rows.clear()
             print("\n🛑 Monitoring interrupted")
         
+        out.write(''.join(rows))
+        out.flush()
         print(f"\n✅ Collected {sample_count} telemetry samples")
     
     def demo_sensor_health_check(self):
@@ -106,46 +207,33 @@ class MSPKitDemo:
         
         try:
             # Get sensor status
-            sensor_status = self.sensors.get_sensor_status()
+            sensor_status = self.sensors.get_sensor_status() or {}
+            detected = sensor_status.get('sensors_detected', {})
             
             # Get raw sensor data
-            imu = self.telemetry.get_imu_raw()
-            gps = self.telemetry.get_gps()
-            
-            # Analyze sensor health
-            sensors_to_check = {
-                'Accelerometer': {
-                    'enabled': sensor_status.get('acc', False),
-                    'data': (imu.get('acc_x', 0), imu.get('acc_y', 0), imu.get('acc_z', 0)),
-                    'test': lambda data: 900 < (data[0]**2 + data[1]**2 + data[2]**2)**0.5 < 1100
-                },
-                'Gyroscope': {
-                    'enabled': sensor_status.get('gyro', False),
-                    'data': (imu.get('gyro_x', 0), imu.get('gyro_y', 0), imu.get('gyro_z', 0)),
-                    'test': lambda data: all(abs(x) < 100 for x in data)  # Low noise when still
-                },
-                'Magnetometer': {
-                    'enabled': sensor_status.get('mag', False),
-                    'data': (imu.get('mag_x', 0), imu.get('mag_y', 0), imu.get('mag_z', 0)),
-                    'test': lambda data: (data[0]**2 + data[1]**2 + data[2]**2)**0.5 > 100
-                },
-                'GPS': {
-                    'enabled': sensor_status.get('gps', False),
-                    'data': (gps.get('fix_type', 0), gps.get('num_sat', 0)),
-                    'test': lambda data: data[0] >= 2 and data[1] >= 4
-                },
-                'Barometer': {
-                    'enabled': sensor_status.get('baro', False),
-                    'data': gps.get('alt', 0),
-                    'test': lambda data: -1000 < data < 10000
-                }
+            imu = self.telemetry.get_raw_imu() or {}
+            gps = self.telemetry.get_gps() or {}
+            acc = imu.get('accelerometer', {})
+            gyro = imu.get('gyroscope', {})
+            mag = imu.get('magnetometer', {})
+            
+            samples = {
+                'Accelerometer': (acc.get('x', 0), acc.get('y', 0), acc.get('z', 0)),
+                'Gyroscope': (gyro.get('x', 0), gyro.get('y', 0), gyro.get('z', 0)),
+                'Magnetometer': (mag.get('x', 0), mag.get('y', 0), mag.get('z', 0)),
+                'GPS': (int(GPSFixType[gps.get('fix_type', 'NO_GPS')]), gps.get('num_satellites', 0)),
+                'Barometer': gps.get('altitude', 0),
             }
             
+            healthy_mask = check_sensors(
+                *samples['Accelerometer'], *samples['Gyroscope'], *samples['Magnetometer'],
+                *samples['GPS'], samples['Barometer'])
+            
             print("Sensor Health Report:")
-            for sensor_name, sensor_info in sensors_to_check.items():
-                enabled = sensor_info['enabled']
-                data = sensor_info['data']
-                healthy = sensor_info['test'](data) if enabled else False
+            for sensor_name, detected_key, bit in SENSORS_TO_CHECK:
+                enabled = detected.get(detected_key, False)
+                data = samples[sensor_name]
+                healthy = enabled and bool(healthy_mask & bit)
                 
                 status_icon = "✅" if enabled and healthy else "⚠️" if enabled else "❌"
                 print(f"   {status_icon} {sensor_name:12s}: {'Enabled' if enabled else 'Disabled':8s} - {'Healthy' if healthy else 'Check' if enabled else 'N/A'}")
@@ -169,28 +257,29 @@ class MSPKitDemo:
             # Create a simple square mission
             print("Creating a simple square mission...")
             
-            # Get current GPS position or use default
-            gps = self.telemetry.get_gps()
-            home_lat = gps.get('lat', 37.7749) if gps.get('fix_type', 0) >= 2 else 37.7749
-            home_lon = gps.get('lon', -122.4194) if gps.get('fix_type', 0) >= 2 else -122.4194
+            # Get current GPS position (one request) or use default
+            gps = self.telemetry.get_gps() or {}
+            has_fix = gps.get('fix_type') in ('FIX_2D', 'FIX_3D')
+            home_lat = gps['latitude'] if has_fix else 37.7749
+            home_lon = gps['longitude'] if has_fix else -122.4194
             
             print(f"   Home position: {home_lat:.6f}, {home_lon:.6f}")
             
             # Clear any existing mission
             self.mission.clear_mission()
             
-            # Create square waypoints (50m x 50m)
-            import math
-            lat_per_meter = 1 / 111320.0
-            lon_per_meter = 1 / (111320.0 * math.cos(math.radians(home_lat)))
-            
-            waypoints = [
-                (home_lat, home_lon, 30),  # Start
-                (home_lat + 50 * lat_per_meter, home_lon, 30),  # North
-                (home_lat + 50 * lat_per_meter, home_lon + 50 * lon_per_meter, 30),  # Northeast
-                (home_lat, home_lon + 50 * lon_per_meter, 30),  # East
-                (home_lat, home_lon, 30),  # Return home
+            # Create square waypoints (50m x 50m) from a table of offsets
+            lat_scale, lon_scale = geodetic_scales(home_lat)
+            dlat = 50 * lat_scale
+            dlon = 50 * lon_scale
+            offsets = [
+                (0, 0),        # Start
+                (dlat, 0),     # North
+                (dlat, dlon),  # Northeast
+                (0, dlon),     # East
+                (0, 0),        # Return home
             ]
+            waypoints = [(home_lat + d_lat, home_lon + d_lon, 30) for d_lat, d_lon in offsets]
             
             for i, (lat, lon, alt) in enumerate(waypoints):
                 action = Mission.WAYPOINT_ACTION_WAYPOINT if i < len(waypoints) - 1 else Mission.WAYPOINT_ACTION_RTH
@@ -209,22 +298,28 @@ class MSPKitDemo:
             print(f"   Total distance: {info['total_distance_m']:.0f}m")
             print(f"   Altitude range: {info['min_altitude_m']:.0f}m - {info['max_altitude_m']:.0f}m")
             
-            # Save mission to file
-            filename = "demo_mission.json"
-            if self.mission.save_mission_to_file(filename):
-                print(f"   ✅ Mission saved to {filename}")
-            
             # Optionally upload to FC (only if iNav)
+            upload = False
             if self.fc_type == FlightController.INAV:
-                upload = input("\n   Upload mission to flight controller? (yes/no): ")
-                if upload.lower() == 'yes':
+                upload = input("\n   Upload mission to flight controller? (yes/no): ").lower() == 'yes'
+            else:
+                print("   ⚠️  Mission upload requires iNav flight controller")
+            
+            # Save mission to file while the upload runs over serial
+            filename = "demo_mission.json"
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                save = executor.submit(self.mission.save_mission_to_file, filename)
+                if upload:
                     print("   📤 Uploading mission...")
-                    if self.mission.upload_mission():
+                    uploaded = executor.submit(self.mission.upload_mission)
+                
+                if save.result():
+                    print(f"   ✅ Mission saved to {filename}")
+                if upload:
+                    if uploaded.result():
                         print("   ✅ Mission uploaded successfully!")
                     else:
                         print("   ❌ Mission upload failed")
-            else:
-                print("   ⚠️  Mission upload requires iNav flight controller")
                 
         except Exception as e:
             print(f"❌ Mission demo failed: {e}")
@@ -237,11 +332,11 @@ class MSPKitDemo:
         try:
             # PID configuration
             print("Current PID Settings:")
-            pid_config = self.config.get_pid_config()
+            pid_config = self.config.get_pid_values()
             if pid_config:
-                print(f"   Roll:  P={pid_config.get('roll_p', 0):3.0f}  I={pid_config.get('roll_i', 0):3.0f}  D={pid_config.get('roll_d', 0):3.0f}")
-                print(f"   Pitch: P={pid_config.get('pitch_p', 0):3.0f}  I={pid_config.get('pitch_i', 0):3.0f}  D={pid_config.get('pitch_d', 0):3.0f}")
-                print(f"   Yaw:   P={pid_config.get('yaw_p', 0):3.0f}  I={pid_config.get('yaw_i', 0):3.0f}  D={pid_config.get('yaw_d', 0):3.0f}")
+                for axis, label in (('ROLL', 'Roll: '), ('PITCH', 'Pitch:'), ('YAW', 'Yaw:  ')):
+                    pid = pid_config.get(axis, {})
+                    print(f"   {label} P={pid.get('P', 0):3.0f}  I={pid.get('I', 0):3.0f}  D={pid.get('D', 0):3.0f}")
             
             # Feature status
             print("\nEnabled Features:")
@@ -328,10 +423,15 @@ class MSPKitDemo:
             
             # 2. Configuration backup
             print("\nStep 2: Configuration Backup")
-            backup_file = f"demo_backup_{int(time.time())}.json"
+            backup_format = self.backup_format
+            if backup_format == 'msgpack' and not HAS_MSGPACK:
+                print("⚠️  msgpack not installed - writing JSON backup instead")
+                backup_format = 'json'
+            backup_file = f"demo_backup_{int(time.time())}.{backup_format}"
             
             # Simple backup (just PID for demo)
-            pid_config = self.config.get_pid_config()
+            # Reuses the values read by the configuration demo while fresh
+            pid_config = self.config.get_pid_values()
             features = self.config.get_features()
             
             backup_data = {
@@ -341,8 +441,15 @@ class MSPKitDemo:
                 'features': features
             }
             
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            if backup_format == 'msgpack':
+                with open(backup_file, 'wb') as f:
+                    f.write(msgpack.packb(backup_data, use_bin_type=True))
+            elif HAS_ORJSON:
+                with open(backup_file, 'wb') as f:
+                    f.write(orjson.dumps(backup_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(backup_file, 'w') as f:
+                    json.dump(backup_data, f, indent=2)
             
             print(f"✅ Configuration backed up to {backup_file}")
             input("\nPress Enter to continue...")
@@ -363,61 +470,56 @@ class MSPKitDemo:
         except Exception as e:
             print(f"❌ Workflow demo failed: {e}")
 
+# Demo menu entries: (choice, label, MSPKitDemo method)
+DEMO_MENU = (
+    ('1', "Telemetry monitoring (10s)", 'demo_telemetry_monitoring'),
+    ('2', "Sensor health check", 'demo_sensor_health_check'),
+    ('3', "Mission planning demo", 'demo_simple_mission'),
+    ('4', "Configuration info", 'demo_configuration_info'),
+    ('5', "Flight control safety demo", 'demo_flight_control_safety'),
+    ('6', "Complete workflow demo", 'demo_complete_workflow'),
+    ('7', "System information", '_show_system_info'),
+)
+EXIT_CHOICE = '8'
+
+DEMO_MENU_TEXT = "\n🎯 Demo Menu:\n" + "\n".join(
+    [f"{key}. {label}" for key, label, _ in DEMO_MENU] + [f"{EXIT_CHOICE}. Exit"]
+)
+
+def _invalid_option():
+    print("❌ Invalid option")
+
 def main():
     """Main demonstration"""
     
     SERIAL_PORT = '/dev/ttyUSB0'  # Change as needed
     FC_TYPE = FlightController.INAV  # Change as needed
     
+    parser = argparse.ArgumentParser(description="MSPKit SDK complete demonstration")
+    parser.add_argument('--format', dest='backup_format', choices=('json', 'msgpack'),
+                        default='json', help='Configuration backup format (default: json)')
+    args = parser.parse_args()
+    
     print("🚁 MSPKit SDK Complete Demonstration")
     print("=" * 60)
     print("This example showcases all major capabilities of MSPKit")
     print()
     
     try:
-        demo = MSPKitDemo(SERIAL_PORT, FC_TYPE)
+        demo = MSPKitDemo(SERIAL_PORT, FC_TYPE, backup_format=args.backup_format)
+        handlers = {key: getattr(demo, method) for key, _, method in DEMO_MENU}
         
         while True:
-            print("\n🎯 Demo Menu:")
-            print("1. Telemetry monitoring (10s)")
-            print("2. Sensor health check")
-            print("3. Mission planning demo")
-            print("4. Configuration info")
-            print("5. Flight control safety demo")
-            print("6. Complete workflow demo")
-            print("7. System information")
-            print("8. Exit")
+            print(DEMO_MENU_TEXT)
             
             choice = input("\nSelect demo (1-8): ").strip()
             
-            if choice == '1':
-                demo.demo_telemetry_monitoring()
-                
-            elif choice == '2':
-                demo.demo_sensor_health_check()
-                
-            elif choice == '3':
-                demo.demo_simple_mission()
-                
-            elif choice == '4':
-                demo.demo_configuration_info()
-                
-            elif choice == '5':
-                demo.demo_flight_control_safety()
-                
-            elif choice == '6':
-                demo.demo_complete_workflow()
-                
-            elif choice == '7':
-                demo._show_system_info()
-                
-            elif choice == '8':
+            if choice == EXIT_CHOICE:
                 print("👋 Thank you for using MSPKit SDK!")
                 print("Visit the documentation for more examples and guides.")
                 break
                 
-            else:
-                print("❌ Invalid option")
+            handlers.get(choice, _invalid_option)()
     
     except KeyboardInterrupt:
         print("\n🛑 Demo interrupted")
@@ -6,8 +6,12 @@ This example demonstrates the enhanced capabilities of the MSPKit SDK
 including MSP v2 support, Betaflight compatibility, and safety features.
 """
 
+import io
+import sys
 import time
 import logging
+import functools
+from contextlib import redirect_stdout
 from typing import Optional
 
 # Configure logging
@@ -19,8 +23,8 @@ logger = logging.getLogger(__name__)
 
 try:
     from mspkit import (
-        ConnectionManager, FlightController, Telemetry, Control, 
-        Config, Mission, Sensors, connect, get_flight_data
+        ConnectionManager, FlightController, Control,
+        Mission, Sensors, TelemetrySection, connect, get_flight_data
     )
 except ImportError:
     print("Please install mspkit: pip install mspkit")
@@ -73,17 +77,31 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 Demo interrupted by user")
     except Exception as e:
-        logger.error(f"Demo error: {e}")
+        logger.error("Demo error: %s", e)
     finally:
         conn.close()
         print("🔌 Connection closed")
 
+def buffered_output(func):
+    """Collect a section's print() output and emit it in one write"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+@buffered_output
 def demo_fc_info(conn: ConnectionManager):
     """Demonstrate flight controller information retrieval"""
     print("\n📋 Flight Controller Information")
     print("-" * 40)
     
-    telem = Telemetry(conn)
+    telem = conn.telemetry
     
     # Get FC details
     api_version = telem.get_api_version()
@@ -100,13 +118,16 @@ def demo_fc_info(conn: ConnectionManager):
     if board_info:
         print(f"Board: {board_info['board_identifier']}")
 
+@buffered_output
 def demo_telemetry(conn: ConnectionManager):
     """Demonstrate comprehensive telemetry data"""
     print("\n📊 Telemetry Data")
     print("-" * 40)
     
-    # Get all telemetry in one call
-    flight_data = get_flight_data(conn)
+    # Get just the sections shown below in one call
+    flight_data = get_flight_data(conn, TelemetrySection.ATTITUDE | TelemetrySection.GPS |
+                                  TelemetrySection.ANALOG | TelemetrySection.STATUS |
+                                  TelemetrySection.IMU)
     
     # Display key telemetry
     if 'attitude' in flight_data:
@@ -126,10 +147,8 @@ def demo_telemetry(conn: ConnectionManager):
         print(f"Armed: {status['armed']}, Flight modes: {', '.join(status['flight_modes'])}")
     
     # Show raw IMU data
-    telem = Telemetry(conn)
-    imu = telem.get_raw_imu()
-    if imu:
-        acc = imu['accelerometer']
+    if 'imu' in flight_data:
+        acc = flight_data['imu']['accelerometer']
         print(f"Accelerometer: X={acc['x']} Y={acc['y']} Z={acc['z']}")
 
 def demo_sensors(conn: ConnectionManager):
@@ -150,22 +169,22 @@ def demo_sensors(conn: ConnectionManager):
     
     # Check if calibration is needed
     calibration_needed = sensors.is_calibration_needed()
-    needs_cal = any(calibration_needed.values())
+    uncalibrated = [sensor for sensor, needed in calibration_needed.items() if needed]
     
-    if needs_cal:
+    if uncalibrated:
         print("\n⚠️  Some sensors may need calibration:")
-        for sensor, needed in calibration_needed.items():
-            if needed:
-                print(f"  - {sensor}")
+        for sensor in uncalibrated:
+            print(f"  - {sensor}")
     else:
         print("✅ All sensors appear to be calibrated")
 
+@buffered_output
 def demo_configuration(conn: ConnectionManager):
     """Demonstrate configuration management"""
     print("\n⚙️  Configuration Management")
     print("-" * 40)
     
-    config = Config(conn)
+    config = conn.config
     
     # Get current PID values
     pids = config.get_pid_values()
@@ -232,7 +251,7 @@ def demo_flight_control(conn: ConnectionManager):
     print("✅ Safety checks enabled")
     
     # Check current armed state
-    telem = Telemetry(conn)
+    telem = conn.telemetry
     status = telem.get_status()
     is_armed = status['armed'] if status else False
     
@@ -253,6 +272,9 @@ def demo_flight_control(conn: ConnectionManager):
         print("- Demonstrate attitude control (0% inputs)")
         control.set_attitude(roll_percent=0, pitch_percent=0, yaw_percent=0, throttle_percent=0)
         
+        # RC updates above were fire-and-forget; collect their acks in one pass
+        print(f"- FC acknowledged {control.flush_acks()} RC updates")
+        
         # Show last RC values
         rc_values = control.get_last_rc_values()
         print(f"Current RC channels: {rc_values[:8]}")
@@ -268,8 +290,6 @@ def wait_for_user():
 
 if __name__ == "__main__":
     # Add interactive mode option
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == "--interactive":
         # Override wait function for interactive mode
         original_demo_fc_info = demo_fc_info
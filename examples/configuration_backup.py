@@ -11,15 +11,90 @@ This example demonstrates flight controller configuration management:
 Useful for tuning and maintaining flight controller settings.
 """
 
+import io
+import re
+import sys
 import json
 import time
 import logging
+import functools
+from contextlib import redirect_stdout
 from typing import Dict, Any, Optional
 from mspkit import connect, FlightController, Config, Telemetry
 
+# Optional fast JSON encoder (pip install mspkit[fast])
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional compression for .json.zst backups (pip install zstandard)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def buffered_output(func):
+    """Collect a section's print() output and emit it in one write"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+# Menu choice -> PID parameter for interactive tuning
+PID_PARAMS = {
+    '1': 'roll_p', '2': 'roll_i', '3': 'roll_d',
+    '4': 'pitch_p', '5': 'pitch_i', '6': 'pitch_d',
+    '7': 'yaw_p', '8': 'yaw_i', '9': 'yaw_d'
+}
+# Short names accepted in PID scripts ("rp" -> "roll_p")
+PID_ALIASES = {param[0] + param[-1]: param for param in PID_PARAMS.values()}
+PID_ASSIGNMENT = re.compile(r'([a-z_]+)=(\d+(?:\.\d+)?)')
+# MSP_PID carries each term as one unsigned byte
+PID_MAX = 255
+
+def flatten_pids(pids: Dict[str, Dict[str, int]]) -> Dict[str, float]:
+    """Turn Config.get_pid_values() output into flat 'roll_p'-style keys"""
+    return {param: pids[param.split('_')[0].upper()][param[-1].upper()]
+            for param in PID_PARAMS.values()
+            if param.split('_')[0].upper() in pids}
+
+def nest_pids(flat: Dict[str, float]) -> Dict[str, Dict[str, int]]:
+    """Turn flat 'roll_p'-style keys back into Config.set_pid_values() input"""
+    pids: Dict[str, Dict[str, int]] = {}
+    for param, value in flat.items():
+        axis, term = param.split('_')
+        pids.setdefault(axis.upper(), {})[term.upper()] = int(round(value))
+    return pids
+
+PID_MENU = "\n".join([
+    "PID Tuning Options:",
+    "1. Adjust Roll P",
+    "2. Adjust Roll I",
+    "3. Adjust Roll D",
+    "4. Adjust Pitch P",
+    "5. Adjust Pitch I",
+    "6. Adjust Pitch D",
+    "7. Adjust Yaw P",
+    "8. Adjust Yaw I",
+    "9. Adjust Yaw D",
+    "10. Apply changes",
+    "11. Reset to original",
+    "12. Exit without saving",
+    "Or type a script, e.g. 'rp=45 ri=60 rd=30 save'",
+])
+
 class ConfigurationManager:
     """Comprehensive configuration management"""
     
@@ -31,12 +106,21 @@ class ConfigurationManager:
         
         print(f"✅ Connected to {fc_type.name} flight controller")
     
+    def _read_pid_config(self) -> Optional[Dict[str, float]]:
+        """Current roll/pitch/yaw PIDs as flat 'roll_p'-style keys"""
+        pids = self.config.get_pid_values()
+        return flatten_pids(pids) if pids else None
+    
+    @buffered_output
     def display_current_config(self):
         """Display comprehensive current configuration"""
         print("\n📋 Current Configuration")
         print("=" * 60)
         
         try:
+            # Read every settings section up front in one burst
+            self.config.prefetch()
+            
             # Basic info
             print("🔧 BASIC INFO:")
             api_info = self.telemetry.get_api_version()
@@ -49,7 +133,7 @@ class ConfigurationManager:
             
             # PID settings
             print("\n🎛️  PID SETTINGS:")
-            pid_config = self.config.get_pid_config()
+            pid_config = self._read_pid_config()
             if pid_config:
                 print(f"   Roll:  P={pid_config.get('roll_p', 0):3.0f}  I={pid_config.get('roll_i', 0):3.0f}  D={pid_config.get('roll_d', 0):3.0f}")
                 print(f"   Pitch: P={pid_config.get('pitch_p', 0):3.0f}  I={pid_config.get('pitch_i', 0):3.0f}  D={pid_config.get('pitch_d', 0):3.0f}")
@@ -69,8 +153,9 @@ class ConfigurationManager:
             print("\n⚙️  FEATURES:")
             features = self.config.get_features()
             if features:
-                enabled_features = [name for name, enabled in features.items() if enabled]
-                disabled_features = [name for name, enabled in features.items() if not enabled]
+                enabled_features, disabled_features = [], []
+                for name, enabled in features.items():
+                    (enabled_features if enabled else disabled_features).append(name)
                 
                 print(f"   Enabled: {', '.join(enabled_features) if enabled_features else 'None'}")
                 print(f"   Disabled: {', '.join(disabled_features[:5]) if disabled_features else 'None'}")
@@ -98,11 +183,14 @@ class ConfigurationManager:
         except Exception as e:
             print(f"❌ Error reading configuration: {e}")
     
+    @buffered_output
     def backup_configuration(self, filename: Optional[str] = None) -> bool:
         """Create a complete backup of the configuration"""
         if not filename:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"fc_backup_{self.fc_type.name.lower()}_{timestamp}.json"
+            if HAS_ZSTD:
+                filename += ".zst"
         
         print(f"\n💾 Creating configuration backup...")
         
@@ -125,28 +213,29 @@ class ConfigurationManager:
                 'api_version': api_info.get('version', 'Unknown')
             }
             
-            # Collect all configuration sections
-            print("   Reading PID configuration...")
-            backup_data['configuration']['pid'] = self.config.get_pid_config()
-            
-            print("   Reading RC tuning...")
-            backup_data['configuration']['rc_tuning'] = self.config.get_rc_tuning()
-            
-            print("   Reading features...")
-            backup_data['configuration']['features'] = self.config.get_features()
-            
-            print("   Reading failsafe configuration...")
-            backup_data['configuration']['failsafe'] = self.config.get_failsafe_config()
-            
-            print("   Reading motor configuration...")
-            backup_data['configuration']['motor'] = self.config.get_motor_config()
-            
-            print("   Reading misc settings...")
-            backup_data['configuration']['misc'] = self.config.get_misc_config()
+            # Collect all configuration sections in one pipelined burst
+            print("   Reading configuration...")
+            settings = self.config.backup_settings()
+            if not settings:
+                print("❌ Could not read configuration")
+                return False
+            backup_data['configuration'] = settings
             
             # Save to file
-            with open(filename, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            if filename.endswith('.zst'):
+                if not HAS_ZSTD:
+                    print("❌ Compressed backups need zstandard (pip install zstandard)")
+                    return False
+                # Compact JSON, compressed while it is written
+                payload = orjson.dumps(backup_data) if HAS_ORJSON else json.dumps(backup_data).encode()
+                with open(filename, 'wb') as f, zstandard.ZstdCompressor(level=3).stream_writer(f) as writer:
+                    writer.write(payload)
+            elif HAS_ORJSON:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(backup_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(backup_data, f, indent=2)
             
             print(f"✅ Configuration backed up to {filename}")
             return True
@@ -161,8 +250,19 @@ class ConfigurationManager:
         
         try:
             # Load backup file
-            with open(filename, 'r') as f:
-                backup_data = json.load(f)
+            if filename.endswith('.zst'):
+                if not HAS_ZSTD:
+                    print("❌ Compressed backups need zstandard (pip install zstandard)")
+                    return False
+                with open(filename, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    payload = reader.read()
+                backup_data = orjson.loads(payload) if HAS_ORJSON else json.loads(payload)
+            elif HAS_ORJSON:
+                with open(filename, 'rb') as f:
+                    backup_data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    backup_data = json.load(f)
             
             # Verify compatibility
             backup_fc_type = backup_data.get('fc_type', 'Unknown')
@@ -174,38 +274,23 @@ class ConfigurationManager:
             
             config_data = backup_data.get('configuration', {})
             
-            # Restore PID settings
-            if 'pid' in config_data and config_data['pid']:
-                print("   Restoring PID configuration...")
-                if self.config.set_pid_config(config_data['pid']):
-                    print("   ✅ PID configuration restored")
-                else:
-                    print("   ❌ PID configuration failed")
-            
-            # Restore RC tuning
-            if 'rc_tuning' in config_data and config_data['rc_tuning']:
-                print("   Restoring RC tuning...")
-                if self.config.set_rc_tuning(config_data['rc_tuning']):
-                    print("   ✅ RC tuning restored")
-                else:
-                    print("   ❌ RC tuning failed")
-            
-            # Restore features
-            if 'features' in config_data and config_data['features']:
-                print("   Restoring features...")
-                if self.config.set_features(config_data['features']):
-                    print("   ✅ Features restored")
-                else:
-                    print("   ❌ Features failed")
+            # Write every section, then read them all back once
+            print("   Restoring settings...")
+            if not self.config.restore_settings(config_data):
+                print("❌ No settings were restored")
+                return False
             
             # Save to EEPROM
             print("   Saving to EEPROM...")
-            if self.config.save_config():
-                print("✅ Configuration restore completed and saved")
-                return True
-            else:
+            if not self.config.save_settings():
                 print("❌ Failed to save configuration to EEPROM")
                 return False
+            
+            mismatched = self.config.verify_settings(config_data)
+            if mismatched:
+                print(f"⚠️  Sections differ from backup: {', '.join(mismatched)}")
+            print("✅ Configuration restore completed and saved")
+            return True
                 
         except FileNotFoundError:
             print(f"❌ Backup file {filename} not found")
@@ -224,7 +309,7 @@ class ConfigurationManager:
         print()
         
         # Get current PID values
-        current_pid = self.config.get_pid_config()
+        current_pid = self._read_pid_config()
         if not current_pid:
             print("❌ Could not read current PID configuration")
             return
@@ -239,37 +324,23 @@ class ConfigurationManager:
         new_pid = current_pid.copy()
         
         while True:
-            print("PID Tuning Options:")
-            print("1. Adjust Roll P")
-            print("2. Adjust Roll I") 
-            print("3. Adjust Roll D")
-            print("4. Adjust Pitch P")
-            print("5. Adjust Pitch I")
-            print("6. Adjust Pitch D")
-            print("7. Adjust Yaw P")
-            print("8. Adjust Yaw I")
-            print("9. Adjust Yaw D")
-            print("10. Apply changes")
-            print("11. Reset to original")
-            print("12. Exit without saving")
+            print(PID_MENU)
             
-            choice = input("\nSelect option (1-12): ").strip()
+            choice = input("\nSelect option (1-12) or script: ").strip()
             
-            pid_map = {
-                '1': 'roll_p', '2': 'roll_i', '3': 'roll_d',
-                '4': 'pitch_p', '5': 'pitch_i', '6': 'pitch_d',
-                '7': 'yaw_p', '8': 'yaw_i', '9': 'yaw_d'
-            }
+            if '=' in choice:
+                if self._apply_pid_script(choice, new_pid):
+                    break
             
-            if choice in pid_map:
-                param = pid_map[choice]
+            elif choice in PID_PARAMS:
+                param = PID_PARAMS[choice]
                 current_value = new_pid.get(param, 0)
                 
                 try:
                     new_value = float(input(f"Enter new value for {param} (current: {current_value}): "))
                     
                     # Basic validation
-                    if 0 <= new_value <= 500:  # Reasonable PID limits
+                    if 0 <= new_value <= PID_MAX:
                         new_pid[param] = new_value
                         print(f"✅ {param} set to {new_value}")
                         
@@ -278,19 +349,19 @@ class ConfigurationManager:
                         print(f"Pitch: P={new_pid.get('pitch_p', 0):3.0f}  I={new_pid.get('pitch_i', 0):3.0f}  D={new_pid.get('pitch_d', 0):3.0f}")
                         print(f"Yaw:   P={new_pid.get('yaw_p', 0):3.0f}  I={new_pid.get('yaw_i', 0):3.0f}  D={new_pid.get('yaw_d', 0):3.0f}")
                     else:
-                        print("❌ Value out of range (0-500)")
+                        print(f"❌ Value out of range (0-{PID_MAX})")
                         
                 except ValueError:
                     print("❌ Invalid number")
             
             elif choice == '10':
                 print("🔧 Applying PID changes...")
-                if self.config.set_pid_config(new_pid):
+                if self.config.set_pid_values(nest_pids(new_pid)):
                     print("✅ PID values updated on flight controller")
                     
                     save = input("Save to EEPROM? (yes/no): ")
                     if save.lower() == 'yes':
-                        if self.config.save_config():
+                        if self.config.save_settings():
                             print("✅ PID values saved to EEPROM")
                         else:
                             print("❌ Failed to save to EEPROM")
@@ -309,6 +380,45 @@ class ConfigurationManager:
             else:
                 print("❌ Invalid option")
     
+    def _apply_pid_script(self, line: str, new_pid: Dict[str, Any]) -> bool:
+        """Apply a one-line PID script such as 'rp=45 ri=60 save'
+        
+        All assignments are validated before any is applied. 'apply' sends the
+        result to the FC in one call and 'save' also writes it to EEPROM.
+        Returns True once the changes have been sent.
+        """
+        line = line.lower()
+        updates = {}
+        for name, value in PID_ASSIGNMENT.findall(line):
+            param = PID_ALIASES.get(name, name)
+            if param not in PID_ALIASES.values():
+                print(f"❌ Unknown parameter: {name}")
+                return False
+            if not 0 <= float(value) <= PID_MAX:
+                print(f"❌ {param} out of range (0-{PID_MAX})")
+                return False
+            updates[param] = float(value)
+        
+        new_pid.update(updates)
+        print(f"✅ Set {', '.join(f'{param}={value:g}' for param, value in updates.items())}")
+        
+        words = line.split()
+        if 'apply' not in words and 'save' not in words:
+            return False
+        
+        print("🔧 Applying PID changes...")
+        if not self.config.set_pid_values(nest_pids(new_pid)):
+            print("❌ Failed to update PID values")
+            return False
+        print("✅ PID values updated on flight controller")
+        
+        if 'save' in words:
+            if self.config.save_settings():
+                print("✅ PID values saved to EEPROM")
+            else:
+                print("❌ Failed to save to EEPROM")
+        return True
+    
     def toggle_features(self):
         """Interactive feature toggle"""
         print("\n⚙️  Feature Management")
@@ -323,6 +433,9 @@ class ConfigurationManager:
             status = "✅ ENABLED " if enabled else "❌ DISABLED"
             print(f"{i:2d}. {name:20s} {status}")
         
+        # Toggling only changes values, so the name list stays valid
+        feature_names = list(features)
+        
         while True:
             try:
                 choice = input("\nEnter feature number to toggle (or 'q' to quit): ").strip()
@@ -330,7 +443,6 @@ class ConfigurationManager:
                     break
                 
                 feature_num = int(choice) - 1
-                feature_names = list(features.keys())
                 
                 if 0 <= feature_num < len(feature_names):
                     feature_name = feature_names[feature_num]
@@ -348,7 +460,7 @@ class ConfigurationManager:
                             
                             save = input("Save to EEPROM? (yes/no): ")
                             if save.lower() == 'yes':
-                                self.config.save_config()
+                                self.config.save_settings()
                         else:
                             print(f"❌ Failed to toggle {feature_name}")
                             features[feature_name] = current_state  # Revert
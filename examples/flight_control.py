@@ -11,13 +11,78 @@ This example demonstrates safe flight control operations including:
 ⚠️  SAFETY WARNING: Only run this with propellers removed or in a simulator!
 """
 
+import os
+import sys
 import time
 import logging
-from mspkit import connect, FlightController, Control, Telemetry
+import threading
+from mspkit import connect, FlightController, Control, Telemetry, TelemetrySection
+from mspkit.rt import ticks, realtime_priority, lock_memory, precise_sleep
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Status lines redrawn in place by the control loops; they are written
+# straight to the stdout descriptor to keep print()'s locking and flushing
+# out of the loop
+HOVER_LINE = "\r   Hovering... {:.1f}s remaining".format
+MONITOR_LINE = "\r{} | Roll: {:6.1f}° | Pitch: {:6.1f}° | Battery: {:4.2f}V".format
+
+# Refresh period of each monitored section in seconds: attitude is the only
+# fast-changing one, status and battery voltage move far more slowly
+MONITOR_RATES = {
+    TelemetrySection.ATTITUDE: 0.1,
+    TelemetrySection.STATUS: 0.5,
+    TelemetrySection.ANALOG: 1.0,
+}
+
+class TelemetryCache:
+    """Latest telemetry sections, shared between a poller and the display"""
+    __slots__ = ('_lock', '_sections', 'updated_ns')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sections = {}
+        self.updated_ns = {}  # Section key -> time.monotonic_ns() of last update
+    
+    def update(self, sections: dict):
+        """Store freshly read sections"""
+        now = time.monotonic_ns()
+        with self._lock:
+            self._sections.update(sections)
+            for key in sections:
+                self.updated_ns[key] = now
+    
+    def snapshot(self) -> dict:
+        """Get a consistent copy of the latest sections"""
+        with self._lock:
+            return dict(self._sections)
+
+def _poll_telemetry(telemetry, cache, stop_event, rates=MONITOR_RATES, paused=None):
+    """Refresh each section in cache at its own rate until stop_event is set
+    
+    While the optional paused event is set, the link is left to the caller.
+    """
+    deadlines = dict.fromkeys(rates, time.monotonic())
+    while not stop_event.is_set():
+        if paused is not None and paused.is_set():
+            stop_event.wait(0.05)
+            continue
+        now = time.monotonic()
+        due = TelemetrySection(0)
+        for section, deadline in deadlines.items():
+            if now >= deadline:
+                due |= section
+                deadlines[section] = now + rates[section]
+        
+        # Sections falling due together still share one pipelined burst
+        if due:
+            try:
+                cache.update(telemetry.get_sections(due))
+            except Exception as e:
+                logger.warning("Telemetry read failed: %s", e)
+        stop_event.wait(max(0.0, min(deadlines.values()) - time.monotonic()))
+
 class SafeFlightController:
     """Safe wrapper for flight control operations"""
     
@@ -27,27 +92,55 @@ class SafeFlightController:
         self.telemetry = Telemetry(self.conn)
         self.armed = False
         
+        # Keep the control loops free of page-fault stalls
+        lock_memory()
+        
+        # Telemetry keeps flowing in the background, including while the
+        # menu is blocked in input(), so the link never builds a backlog
+        self.telemetry_cache = TelemetryCache()
+        self._poller_stop = threading.Event()
+        # Set from arming until disarmed: the poller stays off the link so
+        # RC frames never queue behind a telemetry burst
+        self._link_reserved = threading.Event()
+        self._poller = threading.Thread(target=_poll_telemetry,
+                                        args=(self.telemetry, self.telemetry_cache,
+                                              self._poller_stop, MONITOR_RATES,
+                                              self._link_reserved),
+                                        daemon=True)
+        self._poller.start()
+    
+    def _release_link(self):
+        """Hand the link back to the poller once the aircraft is disarmed"""
+        if not self.armed:
+            self._link_reserved.clear()
+    
+    def close(self):
+        """Stop the telemetry poller and close the connection"""
+        self._poller_stop.set()
+        self._poller.join(timeout=2)
+        self.conn.close()
+        
     def safety_check(self) -> bool:
         """Perform pre-flight safety checks"""
         print("🔍 Performing safety checks...")
         
         try:
             # Check connection
-            status = self.telemetry.get_status()
+            status = self.telemetry.read_status()
             if not status:
                 print("❌ Cannot communicate with flight controller")
                 return False
             
             # Check if already armed
-            if status.get('armed', False):
+            if status.armed:
                 print("⚠️  Flight controller is already ARMED!")
                 response = input("Continue anyway? (yes/no): ")
                 if response.lower() != 'yes':
                     return False
             
             # Check battery voltage
-            battery = self.telemetry.get_battery()
-            voltage = battery.get('voltage', 0)
+            battery = self.telemetry.read_analog()
+            voltage = battery.voltage if battery else 0
             if voltage < 10.5:  # Typical 3S minimum
                 print(f"⚠️  Low battery voltage: {voltage:.2f}V")
                 response = input("Continue anyway? (yes/no): ")
@@ -55,8 +148,8 @@ class SafeFlightController:
                     return False
             
             # Check GPS if using GPS modes
-            gps = self.telemetry.get_gps()
-            satellites = gps.get('num_sat', 0)
+            gps = self.telemetry.read_gps()
+            satellites = gps.num_satellites if gps else 0
             if satellites < 6:
                 print(f"⚠️  Low GPS satellite count: {satellites}")
                 print("GPS-dependent modes may not work properly")
@@ -74,10 +167,11 @@ class SafeFlightController:
             return False
         
         print("🔧 Attempting to arm aircraft...")
+        self._link_reserved.set()
         
         # Ensure throttle is low
         self.control.set_rc_override(throttle=1000)
-        time.sleep(0.5)
+        precise_sleep(0.5)
         
         # Arm the aircraft
         if self.control.arm():
@@ -90,19 +184,22 @@ class SafeFlightController:
             print("- Throttle is at minimum")
             print("- All sensors are calibrated")
             print("- No failsafe conditions active")
+            self._release_link()
             return False
     
     def disarm_aircraft(self) -> bool:
         """Safely disarm the aircraft"""
         print("🔧 Disarming aircraft...")
+        self._link_reserved.set()
         
-        # Cut throttle first
+        # Cut throttle first; the disarm must follow exactly 0.2s later
         self.control.set_rc_override(throttle=1000)
-        time.sleep(0.2)
+        precise_sleep(0.2)
         
         if self.control.disarm():
             print("✅ Aircraft DISARMED successfully")
             self.armed = False
+            self._release_link()
             return True
         else:
             print("❌ Failed to disarm aircraft")
@@ -122,8 +219,8 @@ class SafeFlightController:
         throttle_increment = (hover_throttle - 1000) // steps
         
         try:
-            # Gradually increase throttle
-            for step in range(steps):
+            # Gradually increase throttle, one step every 0.5s
+            for step, _ in zip(range(steps), ticks(0.5)):
                 current_throttle = 1000 + (throttle_increment * step)
                 self.control.set_rc_override(throttle=current_throttle)
                 
@@ -131,33 +228,33 @@ class SafeFlightController:
                 attitude = self.telemetry.get_attitude()
                 print(f"   Step {step+1}/{steps}: Throttle={current_throttle}, "
                       f"Alt={attitude.get('alt', 0):.1f}m")
-                
-                time.sleep(0.5)
             
             # Maintain hover
-            print(f"🏃 Maintaining hover for {duration} seconds...")
-            start_time = time.time()
-            
-            while time.time() - start_time < duration:
-                # Monitor attitude and make small corrections
-                attitude = self.telemetry.get_attitude()
-                roll = attitude.get('roll', 0)
-                pitch = attitude.get('pitch', 0)
-                
-                # Simple stabilization (very basic)
-                roll_correction = max(-200, min(200, -roll * 10))
-                pitch_correction = max(-200, min(200, -pitch * 10))
-                
-                self.control.set_rc_override(
-                    throttle=hover_throttle,
-                    roll=1500 + int(roll_correction),
-                    pitch=1500 + int(pitch_correction),
-                    yaw=1500
-                )
-                
-                remaining = duration - (time.time() - start_time)
-                print(f"\r   Hovering... {remaining:.1f}s remaining", end='', flush=True)
-                time.sleep(0.1)
+            print(f"🏃 Maintaining hover for {duration} seconds...", flush=True)
+            stdout = sys.stdout.fileno()
+            # 10 Hz on absolute deadlines so the cadence does not drift;
+            # set MSPKIT_RT_CPU to pin the loop to an isolated core
+            with realtime_priority():
+                for elapsed in ticks(0.1, duration):
+                    # Monitor attitude and make small corrections; the view
+                    # is updated in place, so the loop allocates no dicts
+                    attitude = self.telemetry.read_attitude()
+                    roll = attitude.roll if attitude else 0
+                    pitch = attitude.pitch if attitude else 0
+                    
+                    # Simple stabilization (very basic)
+                    roll_correction = max(-200, min(200, -roll * 10))
+                    pitch_correction = max(-200, min(200, -pitch * 10))
+                    
+                    self.control.set_rc_override(
+                        throttle=hover_throttle,
+                        roll=1500 + int(roll_correction),
+                        pitch=1500 + int(pitch_correction),
+                        yaw=1500
+                    )
+                    
+                    remaining = duration - elapsed
+                    os.write(stdout, HOVER_LINE(remaining).encode())
             
             print("\n✅ Hover test completed")
             
@@ -174,14 +271,19 @@ class SafeFlightController:
         """Emergency stop procedure"""
         print("🚨 EMERGENCY STOP ACTIVATED!")
         
-        # Immediate throttle cut
-        self.control.set_rc_override(throttle=1000)
-        
-        # Clear RC overrides
-        self.control.clear_rc_override()
-        
-        # Disarm
-        self.disarm_aircraft()
+        # Keep telemetry polling off the link until the aircraft is safe
+        self._link_reserved.set()
+        try:
+            # Immediate throttle cut
+            self.control.set_rc_override(throttle=1000)
+            
+            # Clear RC overrides
+            self.control.clear_rc_override()
+            
+            # Disarm
+            self.disarm_aircraft()
+        finally:
+            self._release_link()
         
         print("✅ Emergency stop completed")
 
@@ -238,19 +340,23 @@ def main():
                 flight_controller.emergency_stop()
                 
             elif choice == '5':
-                print("📊 Monitoring telemetry (Press Ctrl+C to stop)...")
+                print("📊 Monitoring telemetry (Press Ctrl+C to stop)...", flush=True)
+                if flight_controller.armed:
+                    print("⚠️  Polling is paused while armed; values are from before arming")
+                stdout = sys.stdout.fileno()
+                cache = flight_controller.telemetry_cache
                 try:
-                    while True:
-                        status = flight_controller.telemetry.get_status()
-                        attitude = flight_controller.telemetry.get_attitude()
-                        battery = flight_controller.telemetry.get_battery()
+                    for _ in ticks(0.1):
+                        data = cache.snapshot()
+                        status = data.get('status', {})
+                        attitude = data.get('attitude', {})
+                        battery = data.get('analog', {})
                         
-                        print(f"\r{'ARMED' if status.get('armed') else 'DISARMED'} | "
-                              f"Roll: {attitude.get('roll', 0):6.1f}° | "
-                              f"Pitch: {attitude.get('pitch', 0):6.1f}° | "
-                              f"Battery: {battery.get('voltage', 0):4.2f}V", 
-                              end='', flush=True)
-                        time.sleep(0.1)
+                        os.write(stdout, MONITOR_LINE(
+                            'ARMED' if status.get('armed') else 'DISARMED',
+                            attitude.get('roll', 0),
+                            attitude.get('pitch', 0),
+                            battery.get('voltage', 0)).encode())
                 except KeyboardInterrupt:
                     print("\n📊 Telemetry monitoring stopped")
                     
@@ -272,6 +378,9 @@ def main():
         print(f"❌ Error: {e}")
         if 'flight_controller' in locals() and flight_controller.armed:
             flight_controller.emergency_stop()
+    finally:
+        if 'flight_controller' in locals():
+            flight_controller.close()
 
 if __name__ == "__main__":
     main()
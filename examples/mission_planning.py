@@ -11,16 +11,30 @@ This example demonstrates comprehensive mission planning capabilities:
 Supports iNav flight controllers with waypoint navigation.
 """
 
+import os
+import sys
 import time
 import math
 import json
 import logging
 from typing import List, Tuple
-from mspkit import connect, FlightController, Mission, Telemetry
+from mspkit import connect, FlightController, Mission, Telemetry, TelemetrySection
+from mspkit.geo import ENUFrame, spiral_offsets
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Monitor status line, redrawn in place with one write to the stdout
+# descriptor per refresh
+MONITOR_LINE = ("\rWP: {wp:2d} | State: {state:12s} | Pos: {lat:9.6f},{lon:10.6f} | "
+                "Alt: {alt:5.1f}m | Heading: {yaw:5.1f}°").format_map
+
 class MissionPlanner:
     """Advanced mission planning and management"""
     
@@ -49,17 +63,16 @@ class MissionPlanner:
         # Create rectangular mission (100m x 100m)
         self.mission.clear_mission()
         
-        # Convert meters to degrees (approximate)
-        lat_per_meter = 1 / 111320.0
-        lon_per_meter = 1 / (111320.0 * math.cos(math.radians(home_lat)))
-        
-        waypoints = [
-            (home_lat, home_lon, altitude),  # Home/Start
-            (home_lat + 100 * lat_per_meter, home_lon, altitude),  # North
-            (home_lat + 100 * lat_per_meter, home_lon + 100 * lon_per_meter, altitude),  # Northeast
-            (home_lat, home_lon + 100 * lon_per_meter, altitude),  # East
-            (home_lat, home_lon, altitude),  # Return to start
+        # Corners as (east, north) offsets in meters from home
+        frame = ENUFrame(home_lat, home_lon)
+        corners = [
+            (0, 0),  # Home/Start
+            (0, 100),  # North
+            (100, 100),  # Northeast
+            (100, 0),  # East
+            (0, 0),  # Return to start
         ]
+        waypoints = [frame.to_geodetic(east, north) + (altitude,) for east, north in corners]
         
         for i, (lat, lon, alt) in enumerate(waypoints):
             action = Mission.WAYPOINT_ACTION_WAYPOINT
@@ -113,40 +126,33 @@ class MissionPlanner:
         # Search parameters
         center_lat = 37.7749
         center_lon = -122.4194
-        max_radius = 150  # meters
+        max_radius = 80  # meters (keeps the spiral within iNav's 60 waypoints)
         altitude = 40
         speed = 300  # 3 m/s for detailed observation
         
         self.mission.clear_mission()
         
-        # Convert meters to degrees
-        lat_per_meter = 1 / 111320.0
-        lon_per_meter = 1 / (111320.0 * math.cos(math.radians(center_lat)))
-        
-        # Create expanding spiral
-        angles = []
-        radii = []
-        
-        for radius in range(20, max_radius + 1, 20):  # Expand by 20m each loop
-            for angle in range(0, 360, 30):  # 30-degree increments
-                angles.append(angle)
-                radii.append(radius)
+        # The spiral is generated in meters and converted in one step
+        frame = ENUFrame(center_lat, center_lon)
         
         # Add center point first
         self.mission.add_waypoint(center_lat, center_lon, altitude, 
                                 action=Mission.WAYPOINT_ACTION_WAYPOINT, param1=speed)
         
-        # Add spiral waypoints
-        for angle, radius in zip(angles, radii):
-            lat_offset = radius * math.cos(math.radians(angle)) * lat_per_meter
-            lon_offset = radius * math.sin(math.radians(angle)) * lon_per_meter
-            
-            wp_lat = center_lat + lat_offset
-            wp_lon = center_lon + lon_offset
-            
-            self.mission.add_waypoint(wp_lat, wp_lon, altitude,
-                                    action=Mission.WAYPOINT_ACTION_WAYPOINT,
-                                    param1=speed)
+        # Create expanding spiral: 20m steps outwards, 30-degree increments
+        offsets = spiral_offsets(max_radius, radius_step=20, angle_step=30)
+        if HAS_NUMPY:
+            offsets = np.asarray(offsets)
+            lats, lons = frame.to_geodetic(offsets[:, 0], offsets[:, 1])
+            spiral = np.column_stack((lats, lons)).tolist()
+        else:
+            spiral = [frame.to_geodetic(east, north) for east, north in offsets]
+        
+        if not self.mission.add_waypoints(spiral, altitude,
+                                          action=Mission.WAYPOINT_ACTION_WAYPOINT,
+                                          param1=speed):
+            print("❌ Search pattern does not fit in the mission")
+            return False
         
         # Return to center and land
         self.mission.add_waypoint(center_lat, center_lon, altitude,
@@ -194,8 +200,17 @@ class MissionPlanner:
         if estimated_time > 1200:  # 20 minutes
             warnings.append(f"Estimated flight time {estimated_time/60:.1f}min may exceed battery life")
         
-        # Check for valid coordinates
-        for i, wp in enumerate(waypoints):
+        # Check for valid coordinates; with numpy one masked scan picks out
+        # the (usually no) waypoints that need an error message
+        if HAS_NUMPY:
+            coords = np.array([(wp['lat'], wp['lon'], wp['alt']) for wp in waypoints])
+            bad = (np.abs(coords[:, 0]) > 90) | (np.abs(coords[:, 1]) > 180) | (coords[:, 2] < 0)
+            suspects = np.flatnonzero(bad).tolist()
+        else:
+            suspects = range(len(waypoints))
+        
+        for i in suspects:
+            wp = waypoints[i]
             if not (-90 <= wp['lat'] <= 90):
                 errors.append(f"Waypoint {i}: Invalid latitude {wp['lat']}")
             if not (-180 <= wp['lon'] <= 180):
@@ -277,17 +292,20 @@ class MissionPlanner:
         """Monitor mission execution in real-time"""
         print("\n📡 Starting mission execution monitoring...")
         print("Press Ctrl+C to stop monitoring")
-        print("=" * 80)
+        print("=" * 80, flush=True)
         
         try:
+            stdout = sys.stdout.fileno()
             last_waypoint = -1
             start_time = time.time()
             
+            sections = TelemetrySection.NAVIGATION | TelemetrySection.GPS | TelemetrySection.ATTITUDE
             while True:
-                # Get navigation status
-                nav_status = self.telemetry.get_nav_status()
-                gps = self.telemetry.get_gps()
-                attitude = self.telemetry.get_attitude()
+                # Get navigation status, position and heading in one burst
+                data = self.telemetry.get_sections(sections)
+                nav_status = data.get('navigation', {})
+                gps = data.get('gps', {})
+                attitude = data.get('attitude', {})
                 
                 current_wp = nav_status.get('waypoint_number', 0)
                 nav_state = nav_status.get('nav_state', 'UNKNOWN')
@@ -295,17 +313,18 @@ class MissionPlanner:
                 # Check for waypoint progress
                 if current_wp != last_waypoint:
                     elapsed = time.time() - start_time
-                    print(f"\n🎯 Reached waypoint {current_wp} after {elapsed:.1f}s")
+                    print(f"\n🎯 Reached waypoint {current_wp} after {elapsed:.1f}s", flush=True)
                     last_waypoint = current_wp
                 
                 # Display current status
-                print(f"\r"
-                      f"WP: {current_wp:2d} | "
-                      f"State: {nav_state:12s} | "
-                      f"Pos: {gps.get('lat', 0):9.6f},{gps.get('lon', 0):10.6f} | "
-                      f"Alt: {gps.get('alt', 0):5.1f}m | "
-                      f"Heading: {attitude.get('yaw', 0):5.1f}°",
-                      end='', flush=True)
+                os.write(stdout, MONITOR_LINE({
+                    'wp': current_wp,
+                    'state': str(nav_state),
+                    'lat': gps.get('latitude', 0),
+                    'lon': gps.get('longitude', 0),
+                    'alt': gps.get('altitude', 0),
+                    'yaw': attitude.get('yaw', 0),
+                }).encode())
                 
                 time.sleep(0.5)
                 
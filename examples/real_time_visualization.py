@@ -8,17 +8,20 @@ This example demonstrates real-time visualization of flight controller data:
 - Battery monitoring
 - Sensor data graphs
 
-Requires matplotlib and optionally folium for map visualization.
+Requires matplotlib and optionally folium for map visualization. With
+pyqtgraph installed, the attitude graphs are drawn with it instead.
 """
 
 import time
 import math
 import threading
-from collections import deque
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable
+import numpy as np  # Always present: matplotlib depends on it
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from mspkit import connect, FlightController, Telemetry
+from mspkit import (
+    connect, FlightController, Telemetry, TelemetrySection, AttitudeView, GPSView, AnalogView
+)
 
 # Optional imports
 try:
@@ -29,11 +32,160 @@ except ImportError:
     print("⚠️  folium not installed - GPS map visualization disabled")
 
 try:
-    import numpy as np
-    HAS_NUMPY = True
+    import pyqtgraph as pg
+    HAS_PYQTGRAPH = True
 except ImportError:
-    HAS_NUMPY = False
-    print("⚠️  numpy not installed - some visualizations may be limited")
+    HAS_PYQTGRAPH = False
+
+# Sections sampled by the collector thread
+COLLECTED_SECTIONS = TelemetrySection.ATTITUDE | TelemetrySection.GPS | TelemetrySection.ANALOG
+
+class SampleRing:
+    """Fixed-length telemetry history kept in one preallocated array
+    
+    Each field is a row of the array, so every series is contiguous. Samples
+    are written at a moving head index and mirrored max_samples columns
+    further on, which keeps the history, oldest first, in one contiguous
+    slice: appending never allocates and snapshot() is a single copy.
+    
+    One thread appends and any number of threads read, without a lock: the
+    writer publishes each sample by bumping a sequence number after writing
+    it, and readers copy the columns the writer is not about to touch and
+    retry if it moved on meanwhile.
+    """
+    
+    def __init__(self, fields: Iterable[str], max_samples: int):
+        self.fields = tuple(fields)
+        self.max_samples = max_samples
+        self._buf = np.zeros((len(self.fields), 2 * max_samples))
+        self._seq = 0  # Samples written so far
+    
+    def __len__(self) -> int:
+        return min(self._seq, self.max_samples)
+    
+    def append(self, values: Iterable[float]):
+        """Store one sample, given in fields order (single writer only)"""
+        seq = self._seq
+        head = seq % self.max_samples
+        self._buf[:, head] = values
+        self._buf[:, head + self.max_samples] = self._buf[:, head]
+        self._seq = seq + 1
+    
+    def latest(self) -> Dict[str, float]:
+        """Get the newest sample"""
+        while True:
+            seq = self._seq
+            values = self._buf[:, (seq - 1) % self.max_samples].tolist()
+            if self._seq == seq:
+                return dict(zip(self.fields, values))
+    
+    def snapshot(self) -> Dict[str, 'np.ndarray']:
+        """Get a copy of every series, oldest sample first
+        
+        Holds up to max_samples - 1 samples: the oldest slot is the one the
+        next append overwrites, so it is left out.
+        """
+        while True:
+            seq = self._seq
+            count = min(seq, self.max_samples - 1)
+            end = seq % self.max_samples + self.max_samples
+            ordered = self._buf[:, end - count:end].copy()
+            if self._seq == seq:
+                return dict(zip(self.fields, ordered))
+
+def decimate_minmax(x: 'np.ndarray', y: 'np.ndarray', buckets: int):
+    """Thin a series to about 2 * buckets points for plotting
+    
+    The samples are split into equal buckets and only each bucket's minimum
+    and maximum are kept, so spikes survive where plain striding would drop
+    them. Series already that short are returned unchanged.
+    """
+    n = len(x)
+    if buckets < 1 or n <= 2 * buckets:
+        return x, y
+        
+    size = n // buckets
+    used = size * buckets
+    grouped = y[:used].reshape(buckets, size)
+    starts = np.arange(0, used, size)
+    keep = np.concatenate((starts + grouped.argmin(axis=1),
+                           starts + grouped.argmax(axis=1),
+                           np.arange(used, n)))  # Leftover tail as-is
+    keep.sort()
+    return x[keep], y[keep]
+
+def simplify_track(points: 'np.ndarray', tolerance: float = 1e-5) -> 'np.ndarray':
+    """Ramer-Douglas-Peucker simplification of an (N, 2) polyline
+    
+    Drops points that lie within tolerance (in the points' units; 1e-5
+    degrees is about 1 m) of the line through their kept neighbours. Each
+    segment's distances are computed in one vectorized pass.
+    """
+    n = len(points)
+    if n < 3:
+        return points
+        
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = points[first], points[last]
+        inner = points[first + 1:last]
+        dx, dy = end - start
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(*(inner - start).T)
+        else:
+            dist = np.abs(dx * (inner[:, 1] - start[1]) - dy * (inner[:, 0] - start[0])) / length
+        split = int(dist.argmax())
+        if dist[split] > tolerance:
+            split += first + 1
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return points[keep]
+
+class BlitManager:
+    """Redraw only animated artists over a cached copy of the static figure
+    
+    Axes, ticks, grids and legends are rendered once into a background;
+    update() restores it and draws the registered artists on top. Call
+    redraw() after changing anything static, such as axis limits.
+    """
+    
+    def __init__(self, canvas, artists: Iterable):
+        self.canvas = canvas
+        self._background = None
+        self._artists = list(artists)
+        for artist in self._artists:
+            artist.set_animated(True)
+        # Every full draw (first show, resize, redraw()) refreshes the background
+        canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        for artist in self._artists:
+            self.canvas.figure.draw_artist(artist)
+    
+    def update(self):
+        """Blit the animated artists over the cached background"""
+        if self._background is None:
+            self._on_draw(None)
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
+    
+    def redraw(self):
+        """Render the whole figure again and cache the new background"""
+        self.canvas.draw()
 
 class RealTimeVisualizer:
     """Real-time data visualization for flight controller telemetry"""
@@ -44,29 +196,26 @@ class RealTimeVisualizer:
         
         # Data storage
         self.max_samples = 500  # 50 seconds at 10Hz
-        self.data = {
-            'time': deque(maxlen=self.max_samples),
-            'roll': deque(maxlen=self.max_samples),
-            'pitch': deque(maxlen=self.max_samples),
-            'yaw': deque(maxlen=self.max_samples),
-            'altitude': deque(maxlen=self.max_samples),
-            'battery_voltage': deque(maxlen=self.max_samples),
-            'battery_current': deque(maxlen=self.max_samples),
-            'gps_lat': deque(maxlen=self.max_samples),
-            'gps_lon': deque(maxlen=self.max_samples),
-            'satellites': deque(maxlen=self.max_samples),
-        }
+        self.data = SampleRing(('time', 'roll', 'pitch', 'yaw', 'altitude',
+                                'battery_voltage', 'battery_current',
+                                'gps_lat', 'gps_lon', 'satellites'),
+                               self.max_samples)
+        
+        # All-zero readings stored for sections that did not answer
+        self._empty_attitude = AttitudeView()
+        self._empty_gps = GPSView()
+        self._empty_analog = AnalogView()
         
         # Threading
-        self.running = False
+        self.stop_event = threading.Event()
         self.data_thread = None
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         print(f"✅ Connected to {fc_type.name} flight controller")
     
     def start_data_collection(self):
         """Start background data collection thread"""
-        self.running = True
+        self.stop_event.clear()
         self.data_thread = threading.Thread(target=self._collect_data)
         self.data_thread.daemon = True
         self.data_thread.start()
@@ -74,42 +223,65 @@ class RealTimeVisualizer:
     
     def stop_data_collection(self):
         """Stop data collection"""
-        self.running = False
+        self.stop_event.set()
         if self.data_thread:
             self.data_thread.join()
         print("🛑 Data collection stopped")
     
     def _collect_data(self):
-        """Background data collection loop"""
-        while self.running:
+        """Background data collection loop
+        
+        Samples are due on absolute 100 ms deadlines, so the rate does not
+        drift with request time. After an error the retry is backed off
+        exponentially (up to 2 s), and stop_data_collection() cuts any
+        wait short.
+        """
+        period = 0.1  # 10Hz data collection
+        backoff = period
+        next_sample = time.monotonic()
+        while not self.stop_event.is_set():
             try:
-                current_time = time.time() - self.start_time
+                current_time = time.monotonic() - self.start_time
                 
-                # Get telemetry data
-                attitude = self.telemetry.get_attitude()
-                gps = self.telemetry.get_gps()
-                battery = self.telemetry.get_battery()
+                # Get telemetry data in one pipelined burst, decoded into
+                # reused view records (attribute reads, no dicts)
+                self.telemetry.prefetch(COLLECTED_SECTIONS)
+                attitude = self.telemetry.read_attitude() or self._empty_attitude
+                gps = self.telemetry.read_gps() or self._empty_gps
+                battery = self.telemetry.read_analog() or self._empty_analog
                 
                 # Store data
-                self.data['time'].append(current_time)
-                self.data['roll'].append(attitude.get('roll', 0))
-                self.data['pitch'].append(attitude.get('pitch', 0))
-                self.data['yaw'].append(attitude.get('yaw', 0))
-                self.data['altitude'].append(gps.get('alt', 0))
-                self.data['battery_voltage'].append(battery.get('voltage', 0))
-                self.data['battery_current'].append(battery.get('current', 0))
-                self.data['gps_lat'].append(gps.get('lat', 0))
-                self.data['gps_lon'].append(gps.get('lon', 0))
-                self.data['satellites'].append(gps.get('num_sat', 0))
+                self.data.append((
+                    current_time,
+                    attitude.roll,
+                    attitude.pitch,
+                    attitude.yaw,
+                    gps.altitude,
+                    battery.voltage,
+                    battery.amperage,
+                    gps.latitude,
+                    gps.longitude,
+                    gps.num_satellites,
+                ))
                 
-                time.sleep(0.1)  # 10Hz data collection
+                backoff = period
+                # Drop slots missed while the link was slow
+                next_sample = max(next_sample + period, time.monotonic())
                 
             except Exception as e:
                 print(f"⚠️  Data collection error: {e}")
-                time.sleep(1)
+                backoff = min(backoff * 2, 2.0)
+                next_sample = time.monotonic() + backoff
+                
+            self.stop_event.wait(max(0.0, next_sample - time.monotonic()))
     
     def create_attitude_visualization(self):
-        """Create real-time attitude visualization"""
+        """Create real-time attitude visualization
+        
+        Drawn with PyQtGraph when it is installed, otherwise with matplotlib.
+        """
+        if HAS_PYQTGRAPH:
+            return self._create_pyqtgraph_attitude()
         print("🎯 Starting attitude visualization...")
         
         # Set up the plot
@@ -150,49 +322,122 @@ class RealTimeVisualizer:
         line_voltage, = ax3.plot([], [], 'orange', linewidth=2)
         line_sats, = ax4.plot([], [], 'brown', linewidth=2, marker='o', markersize=3)
         
-        def animate(frame):
+        blit = BlitManager(fig.canvas, (line_roll, line_pitch, line_yaw,
+                                        line_alt, line_voltage, line_sats))
+        last_rescale = [None]  # Sample time of the last axis rescale
+        
+        def animate():
             """Animation update function"""
-            if not self.data['time']:
-                return line_roll, line_pitch, line_yaw, line_alt, line_voltage, line_sats
+            if not self.data:
+                return
             
-            # Convert deques to lists for plotting
-            times = list(self.data['time'])
-            rolls = list(self.data['roll'])
-            pitches = list(self.data['pitch'])
-            yaws = list(self.data['yaw'])
-            altitudes = list(self.data['altitude'])
-            voltages = list(self.data['battery_voltage'])
-            satellites = list(self.data['satellites'])
+            # One ordered copy of the history; the arrays go to set_data as-is
+            data = self.data.snapshot()
+            times = data['time']
+            altitudes = data['altitude']
             
-            # Update attitude plot
-            line_roll.set_data(times, rolls)
-            line_pitch.set_data(times, pitches)
-            line_yaw.set_data(times, yaws)
+            # Keep corrupt attitude samples inside the fixed ±180° axis. The
+            # snapshot is a private copy, so this works in place. Yaw is a
+            # 0-360° heading and is wrapped rather than clipped.
+            np.clip(data['roll'], -180, 180, out=data['roll'])
+            np.clip(data['pitch'], -90, 90, out=data['pitch'])
+            yaw = data['yaw']
+            np.add(yaw, 180, out=yaw)
+            np.mod(yaw, 360, out=yaw)
+            np.subtract(yaw, 180, out=yaw)
             
-            # Update other plots
-            line_alt.set_data(times, altitudes)
-            line_voltage.set_data(times, voltages)
-            line_sats.set_data(times, satellites)
+            # Update all plots, with no more points than two per pixel column
+            for line, series in ((line_roll, data['roll']),
+                                 (line_pitch, data['pitch']),
+                                 (line_yaw, data['yaw']),
+                                 (line_alt, altitudes),
+                                 (line_voltage, data['battery_voltage']),
+                                 (line_sats, data['satellites'])):
+                line.set_data(*decimate_minmax(times, series, int(line.axes.bbox.width)))
             
-            # Auto-scale x-axis
-            if times:
-                for ax in [ax1, ax2, ax3, ax4]:
-                    ax.set_xlim(max(0, times[-1] - 30), times[-1] + 1)  # Show last 30 seconds
+            # Fast path: only the lines are redrawn. Limits move at most once
+            # a second, with headroom for the samples until the next move,
+            # and only then is the static background rendered again.
+            now = times[-1]
+            if last_rescale[0] is not None and now - last_rescale[0] < 1.0:
+                blit.update()
+                return
+            last_rescale[0] = now
             
-            # Auto-scale altitude
-            if altitudes:
-                alt_min, alt_max = min(altitudes), max(altitudes)
-                margin = max(10, (alt_max - alt_min) * 0.1)
-                ax2.set_ylim(alt_min - margin, alt_max + margin)
+            # Auto-scale x-axis
+            for ax in [ax1, ax2, ax3, ax4]:
+                ax.set_xlim(max(0, now - 30), now + 2)  # Show last 30 seconds
             
-            return line_roll, line_pitch, line_yaw, line_alt, line_voltage, line_sats
+            # Auto-scale altitude to the samples on screen; times are sorted,
+            # so the window starts at a binary-searched index
+            visible = altitudes[times.searchsorted(now - 30):]
+            alt_min, alt_max = visible.min(), visible.max()
+            margin = max(10, (alt_max - alt_min) * 0.1)
+            ax2.set_ylim(alt_min - margin, alt_max + margin)
+            blit.redraw()
         
         # Start animation
-        ani = animation.FuncAnimation(fig, animate, interval=100, blit=True)
+        timer = fig.canvas.new_timer(interval=100)
+        timer.add_callback(animate)
+        timer.start()
         plt.tight_layout()
         plt.show()
         
-        return ani
+        return timer
+    
+    def _create_pyqtgraph_attitude(self):
+        """Attitude panel drawn by PyQtGraph, which only repaints changed curves"""
+        print("🎯 Starting attitude visualization (PyQtGraph)...")
+        
+        app = pg.mkQApp('MSPKit Visualization')
+        win = pg.GraphicsLayoutWidget(title='Real-time Flight Controller Data')
+        win.resize(1200, 800)
+        
+        ax1 = win.addPlot(title='Attitude (Roll, Pitch, Yaw)', labels={'left': 'Degrees', 'bottom': 'Time (s)'})
+        ax1.addLegend()
+        ax1.setYRange(-180, 180)
+        ax2 = win.addPlot(title='Altitude', labels={'left': 'Meters', 'bottom': 'Time (s)'})
+        win.nextRow()
+        ax3 = win.addPlot(title='Battery Voltage', labels={'left': 'Volts', 'bottom': 'Time (s)'})
+        ax3.setYRange(10, 17)  # Typical 4S LiPo range
+        ax4 = win.addPlot(title='GPS Satellites', labels={'left': 'Count', 'bottom': 'Time (s)'})
+        ax4.setYRange(0, 20)
+        
+        for ax in (ax1, ax2, ax3, ax4):
+            ax.showGrid(x=True, y=True)
+            # Draw only the visible window, thinned to the pixel width
+            ax.setClipToView(True)
+            ax.setDownsampling(auto=True, mode='peak')
+            if ax is not ax1:
+                ax.setXLink(ax1)
+        
+        curves = {
+            'roll': ax1.plot(pen=pg.mkPen('r', width=2), name='Roll'),
+            'pitch': ax1.plot(pen=pg.mkPen('g', width=2), name='Pitch'),
+            'yaw': ax1.plot(pen=pg.mkPen('b', width=2), name='Yaw'),
+            'altitude': ax2.plot(pen=pg.mkPen((128, 0, 128), width=2)),
+            'battery_voltage': ax3.plot(pen=pg.mkPen((255, 165, 0), width=2)),
+            'satellites': ax4.plot(pen=pg.mkPen((165, 42, 42), width=2), symbol='o', symbolSize=3),
+        }
+        
+        def update():
+            """Timer callback"""
+            if not self.data:
+                return
+            data = self.data.snapshot()
+            times = data['time']
+            for name, curve in curves.items():
+                curve.setData(times, data[name], skipFiniteCheck=True)
+            ax1.setXRange(max(0, times[-1] - 30), times[-1] + 1, padding=0)  # Show last 30 seconds
+        
+        timer = pg.QtCore.QTimer()
+        timer.timeout.connect(update)
+        timer.start(100)
+        win.show()
+        pg.exec()
+        timer.stop()
+        
+        return timer
     
     def create_artificial_horizon(self):
         """Create an artificial horizon display"""
@@ -209,38 +454,45 @@ class RealTimeVisualizer:
         ax.set_yticklabels(['30°', '60°', '90°'])
         ax.grid(True)
         
+        # Artists are created once and updated in place each frame
+        horizon_angles = np.linspace(0, 2*np.pi, 100)
+        # Outline of the filled region: out along the horizon, back along r=0
+        outline = np.zeros((2 * horizon_angles.size, 2))
+        outline[:, 0] = np.concatenate((horizon_angles, horizon_angles[::-1]))
+        horizon_radius = outline[:horizon_angles.size, 1]
+        
+        horizon = ax.fill_between(horizon_angles, 0, 0, alpha=0.3, color='skyblue', animated=True)
+        
+        # Aircraft symbol (fixed in center)
+        ax.plot([0, np.pi], [45, 45], 'k-', linewidth=3, label='Horizon')
+        ax.plot([np.pi/2, 3*np.pi/2], [45, 45], 'r-', linewidth=5, label='Aircraft')
+        
+        # Attitude text, inside the axes box so blitting covers it
+        attitude_text = ax.text(0.0, 1.0, '', transform=ax.transAxes, ha='left', va='top',
+                                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
+                                animated=True)
+        
         def animate_horizon(frame):
             """Update artificial horizon"""
-            ax.clear()
-            ax.set_theta_zero_location('N')
-            ax.set_theta_direction(-1)
-            ax.set_ylim(0, 90)
-            
-            if self.data['roll'] and self.data['pitch']:
-                roll = self.data['roll'][-1]
-                pitch = self.data['pitch'][-1]
-                yaw = self.data['yaw'][-1]
+            if self.data:
+                latest = self.data.latest()
+                roll = latest['roll']
+                pitch = latest['pitch']
+                yaw = latest['yaw']
                 
                 # Draw horizon line
-                horizon_angles = np.linspace(0, 2*np.pi, 100)
-                horizon_radius = np.full_like(horizon_angles, 90 - abs(pitch))
+                horizon_radius[:] = 90 - abs(pitch)
+                horizon.set_verts([outline])
                 
                 # Color based on pitch (blue for sky, brown for ground)
-                color = 'skyblue' if pitch >= 0 else 'brown'
-                ax.fill_between(horizon_angles, 0, horizon_radius, alpha=0.3, color=color)
-                
-                # Aircraft symbol (fixed in center)
-                ax.plot([0, np.pi], [45, 45], 'k-', linewidth=3, label='Horizon')
-                ax.plot([np.pi/2, 3*np.pi/2], [45, 45], 'r-', linewidth=5, label='Aircraft')
+                horizon.set_color('skyblue' if pitch >= 0 else 'brown')
                 
                 # Add attitude text
-                ax.text(0, 100, f'Roll: {roll:.1f}°\nPitch: {pitch:.1f}°\nYaw: {yaw:.1f}°',
-                       transform=ax.transData, ha='center', va='bottom',
-                       bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+                attitude_text.set_text(f'Roll: {roll:.1f}°\nPitch: {pitch:.1f}°\nYaw: {yaw:.1f}°')
             
-            return ax,
+            return horizon, attitude_text
         
-        ani = animation.FuncAnimation(fig, animate_horizon, interval=100)
+        ani = animation.FuncAnimation(fig, animate_horizon, interval=100, blit=True)
         plt.show()
         
         return ani
@@ -254,21 +506,21 @@ class RealTimeVisualizer:
         print("🗺️  Creating GPS track map...")
         
         # Get GPS coordinates
-        lats = [lat for lat in self.data['gps_lat'] if lat != 0]
-        lons = [lon for lon in self.data['gps_lon'] if lon != 0]
+        data = self.data.snapshot()
+        has_fix = (data['gps_lat'] != 0) & (data['gps_lon'] != 0)
+        track = np.column_stack((data['gps_lat'][has_fix], data['gps_lon'][has_fix]))
         
-        if not lats or not lons:
+        if not track.size:
             print("⚠️  No GPS data available")
             return ""
         
         # Create map centered on track
-        center_lat = sum(lats) / len(lats)
-        center_lon = sum(lons) / len(lons)
+        center_lat, center_lon = track.mean(axis=0).tolist()
         
         m = folium.Map(location=[center_lat, center_lon], zoom_start=15)
         
-        # Add GPS track
-        gps_points = list(zip(lats, lons))
+        # Add GPS track, without points that do not change its shape
+        gps_points = simplify_track(track).tolist()
         folium.PolyLine(gps_points, color='red', weight=3, opacity=0.8).add_to(m)
         
         # Add start and end markers
@@ -292,66 +544,81 @@ class RealTimeVisualizer:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
         fig.suptitle('Battery Status', fontsize=16)
         
-        def animate_battery(frame):
+        # Voltage gauge
+        ax1.set_title('Battery Voltage')
+        ax1.set_xlim(-1, 1)
+        ax1.set_ylim(-1, 1)
+        ax1.set_aspect('equal')
+        ax1.axis('off')
+        
+        angles = np.linspace(np.pi, 0, 100)
+        radius = 0.8
+        arc_x = radius * np.cos(angles)
+        arc_y = radius * np.sin(angles)
+        
+        # Background arc
+        ax1.plot(arc_x, arc_y, 'lightgray', linewidth=10)
+        
+        # Artists updated in place on each change
+        voltage_arc, = ax1.plot([], [], 'green', linewidth=10)
+        voltage_text = ax1.text(0, -0.3, '', ha='center', va='center', fontsize=14, weight='bold')
+        
+        # Current graph
+        ax2.set_title('Battery Current')
+        ax2.set_ylabel('Current (A)')
+        ax2.set_xlabel('Time (s)')
+        ax2.grid(True)
+        current_line, = ax2.plot([], [], 'blue', linewidth=2)
+        current_text = ax2.text(0.02, 0.98, '', transform=ax2.transAxes, va='top',
+                                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        
+        last_shown = [None]  # (voltage, current) currently drawn
+        
+        def animate_battery():
             """Update battery display"""
-            ax1.clear()
-            ax2.clear()
+            if not self.data:
+                return
             
-            if self.data['battery_voltage'] and self.data['battery_current']:
-                voltage = self.data['battery_voltage'][-1]
-                current = self.data['battery_current'][-1]
-                
-                # Voltage gauge
-                ax1.set_title('Battery Voltage')
-                ax1.set_xlim(-1, 1)
-                ax1.set_ylim(-1, 1)
+            latest = self.data.latest()
+            voltage = latest['battery_voltage']
+            current = latest['battery_current']
+            
+            # The gauge and readouts are only redrawn when the reading moves
+            shown = last_shown[0]
+            if shown is None or abs(voltage - shown[0]) >= 0.01 or abs(current - shown[1]) >= 0.05:
+                last_shown[0] = (voltage, current)
                 
                 # Calculate voltage percentage (assuming 4S LiPo: 12.8V-16.8V)
                 voltage_percent = max(0, min(100, (voltage - 12.8) / (16.8 - 12.8) * 100))
                 
-                # Draw voltage arc
-                angles = np.linspace(np.pi, 0, 100)
-                radius = 0.8
-                
-                # Background arc
-                ax1.plot(radius * np.cos(angles), radius * np.sin(angles), 'lightgray', linewidth=10)
-                
                 # Voltage arc
-                voltage_angles = angles[:int(voltage_percent)]
-                color = 'green' if voltage_percent > 50 else 'orange' if voltage_percent > 25 else 'red'
-                ax1.plot(radius * np.cos(voltage_angles), radius * np.sin(voltage_angles), 
-                        color, linewidth=10)
-                
-                # Voltage text
-                ax1.text(0, -0.3, f'{voltage:.2f}V\n{voltage_percent:.0f}%', 
-                        ha='center', va='center', fontsize=14, weight='bold')
-                
-                ax1.set_aspect('equal')
-                ax1.axis('off')
-                
-                # Current graph
-                ax2.set_title('Battery Current')
-                if len(self.data['time']) > 1:
-                    times = list(self.data['time'])
-                    currents = list(self.data['battery_current'])
-                    ax2.plot(times, currents, 'blue', linewidth=2)
-                    ax2.set_xlim(max(0, times[-1] - 30), times[-1] + 1)
-                    ax2.set_ylabel('Current (A)')
-                    ax2.set_xlabel('Time (s)')
-                    ax2.grid(True)
+                filled = int(voltage_percent)
+                voltage_arc.set_data(arc_x[:filled], arc_y[:filled])
+                voltage_arc.set_color('green' if voltage_percent > 50 else 'orange' if voltage_percent > 25 else 'red')
+                voltage_text.set_text(f'{voltage:.2f}V\n{voltage_percent:.0f}%')
                 
                 # Current value
-                ax2.text(0.02, 0.98, f'Current: {current:.2f}A', 
-                        transform=ax2.transAxes, va='top',
-                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+                current_text.set_text(f'Current: {current:.2f}A')
+            
+            # Current graph keeps scrolling every tick
+            if len(self.data) > 1:
+                data = self.data.snapshot()
+                times = data['time']
+                currents = data['battery_current']
+                current_line.set_data(times, currents)
+                ax2.set_xlim(max(0, times[-1] - 30), times[-1] + 1)
+                ax2.relim()
+                ax2.autoscale_view(scalex=False)
             
-            return ax1, ax2
+            fig.canvas.draw_idle()
         
-        ani = animation.FuncAnimation(fig, animate_battery, interval=500)
+        timer = fig.canvas.new_timer(interval=500)
+        timer.add_callback(animate_battery)
+        timer.start()
         plt.tight_layout()
         plt.show()
         
-        return ani
+        return timer
 
 def main():
     """Main visualization demonstration"""
@@ -405,16 +672,17 @@ def main():
                 
             elif choice == '5':
                 # Show current status
-                if visualizer.data['time']:
+                if visualizer.data:
+                    latest = visualizer.data.latest()
                     print(f"\n📊 Current Status:")
-                    print(f"   Data points: {len(visualizer.data['time'])}")
-                    print(f"   Runtime: {visualizer.data['time'][-1]:.1f}s")
-                    print(f"   Roll: {visualizer.data['roll'][-1]:.1f}°")
-                    print(f"   Pitch: {visualizer.data['pitch'][-1]:.1f}°")
-                    print(f"   Yaw: {visualizer.data['yaw'][-1]:.1f}°")
-                    print(f"   Altitude: {visualizer.data['altitude'][-1]:.1f}m")
-                    print(f"   Battery: {visualizer.data['battery_voltage'][-1]:.2f}V")
-                    print(f"   GPS Sats: {visualizer.data['satellites'][-1]}")
+                    print(f"   Data points: {len(visualizer.data)}")
+                    print(f"   Runtime: {latest['time']:.1f}s")
+                    print(f"   Roll: {latest['roll']:.1f}°")
+                    print(f"   Pitch: {latest['pitch']:.1f}°")
+                    print(f"   Yaw: {latest['yaw']:.1f}°")
+                    print(f"   Altitude: {latest['altitude']:.1f}m")
+                    print(f"   Battery: {latest['battery_voltage']:.2f}V")
+                    print(f"   GPS Sats: {latest['satellites']:.0f}")
                 else:
                     print("⚠️  No data collected yet")
                 
@@ -11,13 +11,187 @@ This example demonstrates sensor calibration procedures including:
 Essential for accurate flight performance and navigation.
 """
 
+import sys
+import math
 import time
 import logging
+import threading
+import numpy as np
 from mspkit import connect, FlightController, Sensors, Telemetry
+from mspkit.rt import ticks
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Progress lines redraw in place on a terminal; redirected output gets a
+# plain line per second instead of a stream of emoji-laden redraws
+_INTERACTIVE = sys.stdout.isatty()
+
+_MAG_PROGRESS = ("Calibrating... {:.0f}s remaining | "
+                 "Mag: X={:5.0f} Y={:5.0f} Z={:5.0f} |{:5.0f}|")
+_MAG_WAITING = "Calibrating... {:.0f}s remaining"
+_GYRO_PROGRESS = "Calibrating... {:.0f}s | Gyro noise: {:.0f} (max: {:.0f})"
+_GYRO_WAITING = "Calibrating... {:.0f}s"
+
+class ProgressLine:
+    """Countdown line written straight to stdout"""
+    
+    def __init__(self, icon: str):
+        self.prefix = f"\r{icon} "
+        self._shown = None
+    
+    def update(self, remaining: float, template: str, *values) -> None:
+        """Show template formatted with remaining and values"""
+        if _INTERACTIVE:
+            sys.stdout.write(self.prefix + template.format(remaining, *values))
+        else:
+            second = int(remaining)
+            if second == self._shown:
+                return  # Skip the formatting too
+            self._shown = second
+            sys.stdout.write(template.format(remaining, *values) + "\n")
+        sys.stdout.flush()
+
+def _mag3(x: float, y: float, z: float) -> float:
+    """Length of a 3-axis sensor reading"""
+    return math.sqrt(x * x + y * y + z * z)
+
+# Display names for get_gps()'s fix_type
+_FIX_LABELS = {
+    'NO_GPS': "No GPS",
+    'NO_FIX': "No Fix",
+    'FIX_2D': "2D Fix",
+    'FIX_3D': "3D Fix",
+}
+
+# Accelerometer capture positions, in ACCEL_REFERENCE order
+_POSITIONS = (
+    "level (top up)",
+    "upside down (bottom up)",
+    "left side down",
+    "right side down",
+    "nose down",
+    "nose up",
+)
+
+_MENU = "\n".join((
+    "\n🔧 Sensor Calibration Menu:",
+    "1. Check sensor health",
+    "2. Calibrate accelerometer",
+    "3. Calibrate magnetometer/compass",
+    "4. Calibrate gyroscope",
+    "5. Save calibration to EEPROM",
+    "6. Full calibration sequence",
+    "7. Exit",
+))
+
+# Reference reading for each capture position, in raw counts (1 g = 1000)
+ACCEL_REFERENCE = np.array([
+    [0, 0, 1000],    # Level (top up)
+    [0, 0, -1000],   # Upside down
+    [0, -1000, 0],   # Left side down
+    [0, 1000, 0],    # Right side down
+    [-1000, 0, 0],   # Nose down
+    [1000, 0, 0],    # Nose up
+], dtype=np.float64)
+
+def fit_accelerometer(means):
+    """Least-squares scale matrix and bias from the six orientation averages
+    
+    Solves reference = [means 1] @ params, whose top three rows are the
+    transposed correction matrix and last row its offset. Returns
+    (correction, bias, residual): a reading is corrected as
+    correction @ (raw - bias), and residual is the fit error in counts.
+    Returns None when the averages do not pin down a fit (the craft was not
+    re-oriented between captures, or the sensor reads a constant).
+    """
+    measured = np.asarray(means, dtype=np.float64)
+    design = np.hstack([measured, np.ones((len(measured), 1))])
+    params, _, rank, _ = np.linalg.lstsq(design, ACCEL_REFERENCE, rcond=None)
+    if rank < design.shape[1]:
+        return None
+    
+    correction = params[:3].T
+    try:
+        bias = -np.linalg.solve(correction, params[3])
+    except np.linalg.LinAlgError:
+        return None
+    residual = float(np.linalg.norm(design @ params - ACCEL_REFERENCE))
+    return correction, bias, residual
+
+def fit_magnetometer(samples):
+    """Hard- and soft-iron estimate from magnetometer samples taken while rotating
+    
+    Fits the ellipsoid ax² + by² + cz² + 2dxy + 2exz + 2fyz + gx + hy + iz = 1
+    by least squares. Returns (offset, radii): the hard-iron offset in raw
+    counts and the ellipsoid's semi-axis lengths, which differ from one
+    another as soft-iron distortion grows. Returns None when the samples do
+    not describe an ellipsoid (too few, or not rotated through enough axes).
+    """
+    points = np.asarray(samples, dtype=np.float64)
+    if len(points) < 9:
+        return None
+    
+    x, y, z = points.T
+    design = np.column_stack([x * x, y * y, z * z,
+                              2 * x * y, 2 * x * z, 2 * y * z,
+                              x, y, z])
+    (a, b, c, d, e, f, g, h, i), *_ = np.linalg.lstsq(design, np.ones(len(points)),
+                                                      rcond=None)
+    
+    quadric = np.array([[a, d, e], [d, b, f], [e, f, c]])
+    linear = np.array([g, h, i])
+    try:
+        offset = -0.5 * np.linalg.solve(quadric, linear)
+    except np.linalg.LinAlgError:
+        return None
+    
+    # Centred on the offset the surface is u·Q·u = scale
+    scale = 1 - offset @ quadric @ offset - linear @ offset
+    eigenvalues = np.linalg.eigvalsh(quadric / scale)
+    if np.any(eigenvalues <= 0):
+        return None
+    return offset, 1 / np.sqrt(eigenvalues)
+
+class LatestIMU:
+    """Background reader that keeps the newest raw IMU frame
+    
+    A daemon thread reads MSP_RAW_IMU back-to-back and publishes each result
+    as a single (seq, imu) reference, so a consumer sampling on its own
+    schedule gets the freshest frame without waiting for a round-trip.
+    seq counts frames received; compare it to skip repeats.
+    """
+    
+    def __init__(self, conn):
+        self._telemetry = Telemetry(conn, cache_ttl=0)  # Every read goes to the FC
+        self.frame = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        seq = 0
+        while not self._stop.is_set():
+            try:
+                imu = self._telemetry.get_raw_imu()
+            except Exception as e:
+                logger.debug("IMU read failed: %s", e)
+                self._stop.wait(0.1)
+                continue
+            if imu:
+                seq += 1
+                self.frame = (seq, imu)
+    
+    def stop(self):
+        """Stop the reader thread"""
+        self._stop.set()
+        self._thread.join(timeout=1)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+
 class SensorCalibrator:
     """Comprehensive sensor calibration and monitoring"""
     
@@ -38,33 +212,21 @@ class SensorCalibrator:
         
         # Get sensor readings
         try:
-            imu = self.telemetry.get_imu_raw()
-            sensor_data['accelerometer'] = {
-                'x': imu.get('acc_x', 0),
-                'y': imu.get('acc_y', 0),
-                'z': imu.get('acc_z', 0),
-                'enabled': sensor_status.get('acc', False)
-            }
+            imu = self.telemetry.get_raw_imu()
+            sensor_data['accelerometer'] = dict(imu['accelerometer'],
+                                                enabled=sensor_status.get('acc', False))
             
-            sensor_data['gyroscope'] = {
-                'x': imu.get('gyro_x', 0),
-                'y': imu.get('gyro_y', 0),
-                'z': imu.get('gyro_z', 0),
-                'enabled': sensor_status.get('gyro', False)
-            }
+            sensor_data['gyroscope'] = dict(imu['gyroscope'],
+                                            enabled=sensor_status.get('gyro', False))
             
-            sensor_data['magnetometer'] = {
-                'x': imu.get('mag_x', 0),
-                'y': imu.get('mag_y', 0),
-                'z': imu.get('mag_z', 0),
-                'enabled': sensor_status.get('mag', False)
-            }
+            sensor_data['magnetometer'] = dict(imu['magnetometer'],
+                                               enabled=sensor_status.get('mag', False))
             
             # GPS status
             gps = self.telemetry.get_gps()
             sensor_data['gps'] = {
-                'fix_type': gps.get('fix_type', 0),
-                'satellites': gps.get('num_sat', 0),
+                'fix_type': gps.get('fix_type', 'NO_GPS'),
+                'satellites': gps.get('num_satellites', 0),
                 'hdop': gps.get('hdop', 0),
                 'enabled': sensor_status.get('gps', False)
             }
@@ -88,7 +250,7 @@ class SensorCalibrator:
             print(f"{sensor.upper():12s}: {status}")
             
             if sensor == 'accelerometer':
-                acc_magnitude = (data['x']**2 + data['y']**2 + data['z']**2) ** 0.5
+                acc_magnitude = _mag3(data['x'], data['y'], data['z'])
                 print(f"              Magnitude: {acc_magnitude:.0f} (expected ~1000)")
                 
             elif sensor == 'gyroscope':
@@ -96,12 +258,11 @@ class SensorCalibrator:
                 print(f"              Max noise: {gyro_noise:.0f} (should be <50)")
                 
             elif sensor == 'magnetometer':
-                mag_magnitude = (data['x']**2 + data['y']**2 + data['z']**2) ** 0.5
+                mag_magnitude = _mag3(data['x'], data['y'], data['z'])
                 print(f"              Magnitude: {mag_magnitude:.0f}")
                 
             elif sensor == 'gps':
-                fix_types = ["No Fix", "Dead Reckoning", "2D Fix", "3D Fix", "GPS+Dead Reckoning", "Time Only"]
-                fix_type_str = fix_types[min(data['fix_type'], len(fix_types)-1)]
+                fix_type_str = _FIX_LABELS.get(data['fix_type'], "No Fix")
                 print(f"              Fix: {fix_type_str}, Sats: {data['satellites']}, HDOP: {data['hdop']/100:.1f}")
         
         return sensor_data
@@ -110,60 +271,61 @@ class SensorCalibrator:
         """Calibrate accelerometer (6-point calibration)"""
         print("\n📐 Accelerometer Calibration")
         print("This requires positioning the aircraft in 6 orientations:")
-        print("1. Level (top up)")
-        print("2. Upside down (bottom up)") 
-        print("3. Left side down")
-        print("4. Right side down")
-        print("5. Nose down")
-        print("6. Nose up")
+        for i, position in enumerate(_POSITIONS, 1):
+            print(f"{i}. {position.capitalize()}")
         print()
         
-        positions = [
-            "level (top up)",
-            "upside down (bottom up)",
-            "left side down", 
-            "right side down",
-            "nose down",
-            "nose up"
-        ]
-        
         print("⚠️  Ensure the aircraft is stable and not moving during calibration!")
         input("Press Enter when ready to start...")
         
         calibration_data = []
         
-        for i, position in enumerate(positions):
+        for i, position in enumerate(_POSITIONS):
             print(f"\n📍 Position {i+1}/6: Place aircraft {position}")
             input("Position aircraft and press Enter to capture...")
             
             # Capture accelerometer data
             print("📊 Capturing data...")
-            samples = []
+            # 50 samples over 1 second, kept as the int16 counts MSP_RAW_IMU carries
+            samples = np.empty((50, 3), dtype=np.int16)
+            count = 0
             
-            for _ in range(50):  # 50 samples over 1 second
-                try:
-                    imu = self.telemetry.get_imu_raw()
-                    samples.append([
-                        imu.get('acc_x', 0),
-                        imu.get('acc_y', 0), 
-                        imu.get('acc_z', 0)
-                    ])
-                    time.sleep(0.02)
-                except:
-                    continue
+            # Fixed 50 Hz cadence on absolute deadlines; the serial reads run
+            # on the reader thread, so each deadline just takes the newest frame
+            with LatestIMU(self.conn) as reader:
+                last_seq = 0
+                for _ in zip(range(len(samples)), ticks(0.02)):
+                    frame = reader.frame
+                    if frame is None or frame[0] == last_seq:
+                        continue  # Nothing new since the last deadline
+                    last_seq, imu = frame
+                    acc = imu['accelerometer']
+                    samples[count] = (acc['x'], acc['y'], acc['z'])
+                    count += 1
             
-            if samples:
-                # Average the samples
-                avg_x = sum(s[0] for s in samples) / len(samples)
-                avg_y = sum(s[1] for s in samples) / len(samples)
-                avg_z = sum(s[2] for s in samples) / len(samples)
+            if count:
+                # Average the samples (accumulated in float64, so no int16 overflow)
+                avg = samples[:count].mean(axis=0, dtype=np.float64)
+                avg_x, avg_y, avg_z = avg.tolist()
                 
-                calibration_data.append([avg_x, avg_y, avg_z])
+                calibration_data.append(avg)
                 print(f"✅ Captured: X={avg_x:.0f}, Y={avg_y:.0f}, Z={avg_z:.0f}")
             else:
                 print("❌ Failed to capture data")
                 return False
         
+        # Fit scale and bias from the six positions
+        fit = fit_accelerometer(calibration_data)
+        if fit:
+            correction, bias, residual = fit
+            scale_x, scale_y, scale_z = np.diag(correction).tolist()
+            bias_x, bias_y, bias_z = bias.tolist()
+            print(f"\n📐 Fitted scale: X={scale_x:.3f}, Y={scale_y:.3f}, Z={scale_z:.3f}")
+            print(f"📐 Fitted bias: X={bias_x:.0f}, Y={bias_y:.0f}, Z={bias_z:.0f} "
+                  f"(residual {residual:.1f})")
+        else:
+            print("\n⚠️  Captures too similar for a client-side fit - was the craft re-oriented?")
+        
         # Start calibration on flight controller
         print("\n🔧 Starting accelerometer calibration on flight controller...")
         
@@ -175,8 +337,8 @@ class SensorCalibrator:
             time.sleep(2)
             
             # Check if calibration improved
-            imu = self.telemetry.get_imu_raw()
-            acc_magnitude = (imu.get('acc_x', 0)**2 + imu.get('acc_y', 0)**2 + imu.get('acc_z', 0)**2) ** 0.5
+            acc = self.telemetry.get_raw_imu()['accelerometer']
+            acc_magnitude = _mag3(acc['x'], acc['y'], acc['z'])
             
             if 950 <= acc_magnitude <= 1050:  # Should be close to 1000 when level
                 print(f"✅ Calibration verified: magnitude = {acc_magnitude:.0f}")
@@ -212,43 +374,54 @@ class SensorCalibrator:
             print("Rotate the aircraft slowly in all orientations for 60 seconds")
             
             # Monitor calibration progress
-            start_time = time.time()
             calibration_time = 60  # seconds
             
-            while time.time() - start_time < calibration_time:
-                remaining = calibration_time - (time.time() - start_time)
+            # Every reading is kept for a client-side fit afterwards
+            mag_samples = np.empty((int(calibration_time / 0.2) + 1, 3), dtype=np.float32)
+            count = 0
+            
+            # Bound once; the loop body runs 300 times
+            read_imu = self.telemetry.get_raw_imu
+            show = ProgressLine("🧭").update
+            
+            for elapsed in ticks(0.2, calibration_time):
+                remaining = calibration_time - elapsed
                 
                 # Get magnetometer readings to show activity
                 try:
-                    imu = self.telemetry.get_imu_raw()
-                    mag_x = imu.get('mag_x', 0)
-                    mag_y = imu.get('mag_y', 0) 
-                    mag_z = imu.get('mag_z', 0)
-                    magnitude = (mag_x**2 + mag_y**2 + mag_z**2) ** 0.5
-                    
-                    print(f"\r🧭 Calibrating... {remaining:.0f}s remaining | "
-                          f"Mag: X={mag_x:5.0f} Y={mag_y:5.0f} Z={mag_z:5.0f} |{magnitude:5.0f}|",
-                          end='', flush=True)
+                    mag = read_imu()['magnetometer']
+                    mag_x, mag_y, mag_z = mag['x'], mag['y'], mag['z']
+                    if count < len(mag_samples):
+                        mag_samples[count] = (mag_x, mag_y, mag_z)
+                        count += 1
+                    show(remaining, _MAG_PROGRESS, mag_x, mag_y, mag_z,
+                         _mag3(mag_x, mag_y, mag_z))
                 except:
-                    print(f"\r🧭 Calibrating... {remaining:.0f}s remaining", end='', flush=True)
-                
-                time.sleep(0.2)
+                    show(remaining, _MAG_WAITING)
             
             print("\n✅ Magnetometer calibration time completed")
+            
+            fit = fit_magnetometer(mag_samples[:count])
+            if fit:
+                offset, radii = fit
+                off_x, off_y, off_z = offset.tolist()
+                print(f"🧲 Hard-iron offset: X={off_x:.0f}, Y={off_y:.0f}, Z={off_z:.0f}")
+                print(f"🧲 Soft-iron axis ratio: {radii.max() / radii.min():.2f} (1.00 is ideal)")
+            else:
+                print("⚠️  Not enough rotation captured for a client-side fit")
             print("🔧 Verifying calibration...")
             
             # The FC should automatically save the calibration
             time.sleep(2)
             
             # Check compass heading stability
-            headings = []
-            for _ in range(10):
-                attitude = self.telemetry.get_attitude()
-                headings.append(attitude.get('yaw', 0))
-                time.sleep(0.1)
+            headings = np.empty(10, dtype=np.float32)
+            for i, _ in zip(range(len(headings)), ticks(0.1)):
+                attitude = self.telemetry.get_attitude() or {}
+                headings[i] = attitude.get('yaw', 0)
             
-            if headings:
-                heading_std = (sum((h - sum(headings)/len(headings))**2 for h in headings) / len(headings)) ** 0.5
+            if headings.size:
+                heading_std = float(np.std(headings))
                 if heading_std < 5:  # Less than 5 degrees variation
                     print(f"✅ Calibration verified: heading stable (±{heading_std:.1f}°)")
                     return True
@@ -276,28 +449,26 @@ class SensorCalibrator:
             print("✅ Gyroscope calibration command sent")
             
             # Monitor gyro noise during calibration
-            start_time = time.time()
             calibration_time = 10
             
             max_noise = 0
-            while time.time() - start_time < calibration_time:
-                remaining = calibration_time - (time.time() - start_time)
-                
-                try:
-                    imu = self.telemetry.get_imu_raw()
-                    gyro_x = abs(imu.get('gyro_x', 0))
-                    gyro_y = abs(imu.get('gyro_y', 0))
-                    gyro_z = abs(imu.get('gyro_z', 0))
-                    current_noise = max(gyro_x, gyro_y, gyro_z)
+            gyro_sample = np.empty(3, dtype=np.float32)
+            show = ProgressLine("🌀").update
+            with LatestIMU(self.conn) as reader:
+                for elapsed in ticks(0.1, calibration_time):
+                    remaining = calibration_time - elapsed
+                    
+                    frame = reader.frame
+                    if frame is None:
+                        show(remaining, _GYRO_WAITING)
+                        continue
+                    
+                    gyro = frame[1]['gyroscope']
+                    gyro_sample[:] = (gyro['x'], gyro['y'], gyro['z'])
+                    current_noise = float(np.max(np.abs(gyro_sample)))
                     max_noise = max(max_noise, current_noise)
                     
-                    print(f"\r🌀 Calibrating... {remaining:.0f}s | "
-                          f"Gyro noise: {current_noise:.0f} (max: {max_noise:.0f})",
-                          end='', flush=True)
-                except:
-                    print(f"\r🌀 Calibrating... {remaining:.0f}s", end='', flush=True)
-                
-                time.sleep(0.1)
+                    show(remaining, _GYRO_PROGRESS, current_noise, max_noise)
             
             print(f"\n✅ Gyroscope calibration completed")
             
@@ -325,6 +496,8 @@ class SensorCalibrator:
 def main():
     """Main sensor calibration demonstration"""
     
+    logging.basicConfig(level=logging.INFO)
+    
     SERIAL_PORT = '/dev/ttyUSB0'
     FC_TYPE = FlightController.INAV  # Change as needed
     
@@ -338,14 +511,7 @@ def main():
         calibrator = SensorCalibrator(SERIAL_PORT, FC_TYPE)
         
         while True:
-            print("\n🔧 Sensor Calibration Menu:")
-            print("1. Check sensor health")
-            print("2. Calibrate accelerometer")
-            print("3. Calibrate magnetometer/compass")
-            print("4. Calibrate gyroscope")
-            print("5. Save calibration to EEPROM")
-            print("6. Full calibration sequence")
-            print("7. Exit")
+            print(_MENU)
             
             choice = input("\nSelect option (1-7): ").strip()
             
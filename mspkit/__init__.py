@@ -29,20 +29,54 @@ Basic Usage:
     control.set_throttle(20)  # 20% throttle
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Core connection and protocol
 from .core import ConnectionManager, INavConnection, MSPException, FlightController
 
-# Main modules
-from .telemetry import Telemetry
-from .control import Control  
-from .config import Config
-from .mission import Mission, Waypoint
-from .sensors import Sensors
+# Main modules, imported on first access (PEP 562) so a short-lived CLI
+# command only loads the modules it actually uses
+_LAZY_IMPORTS = {
+    'Telemetry': '.telemetry',
+    'TelemetryView': '.telemetry',
+    'AttitudeView': '.telemetry',
+    'StatusView': '.telemetry',
+    'AnalogView': '.telemetry',
+    'GPSView': '.telemetry',
+    'NavStatusView': '.telemetry',
+    'Control': '.control',
+    'Config': '.config',
+    'Mission': '.mission',
+    'Waypoint': '.mission',
+    'Sensors': '.sensors',
+}
+
+if TYPE_CHECKING:
+    from .telemetry import (
+        Telemetry, TelemetryView, AttitudeView, StatusView, AnalogView, GPSView, NavStatusView
+    )
+    from .control import Control
+    from .config import Config
+    from .mission import Mission, Waypoint
+    from .sensors import Sensors
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Constants and enums
 from .msp_constants import (
     MSPCommands, MSPv2Commands, FlightModes, SensorStatus, 
-    GPSFixType, NavState, FailsafePhase, RC_CHANNELS, PWM_VALUES
+    GPSFixType, NavState, FailsafePhase, RC_CHANNELS, PWM_VALUES,
+    TelemetrySection
 )
 
 # Version info
@@ -73,18 +107,22 @@ def connect(port: str, baudrate: int = 115200, fc_type: FlightController = Fligh
     """
     return ConnectionManager(port, baudrate, timeout, fc_type)
 
-def get_flight_data(conn: ConnectionManager) -> dict:
+def get_flight_data(conn: ConnectionManager,
+                    sections: TelemetrySection = TelemetrySection.ALL) -> dict:
     """
     Get comprehensive flight data in one call
     
     Args:
         conn: Connection manager instance
+        sections: TelemetrySection flags to fetch (default: TelemetrySection.ALL)
         
     Returns:
-        Dictionary containing all available telemetry data
+        Dictionary containing the selected telemetry data
+    
+    Example:
+        data = mspkit.get_flight_data(conn, TelemetrySection.ATTITUDE | TelemetrySection.STATUS)
     """
-    telem = Telemetry(conn)
-    return telem.get_all_telemetry()
+    return conn.telemetry.get_sections(sections)
 
 # Module-level exports
 __all__ = [
@@ -93,10 +131,12 @@ __all__ = [
     
     # Main modules
     'Telemetry', 'Control', 'Config', 'Mission', 'Waypoint', 'Sensors',
+    'TelemetryView', 'AttitudeView', 'StatusView', 'AnalogView', 'GPSView', 'NavStatusView',
     
     # Constants
     'MSPCommands', 'MSPv2Commands', 'FlightModes', 'SensorStatus',
     'GPSFixType', 'NavState', 'FailsafePhase', 'RC_CHANNELS', 'PWM_VALUES',
+    'TelemetrySection',
     
     # Helper functions
     'connect', 'get_flight_data',
@@ -0,0 +1,24 @@
+"""
+Numba-compiled mission geometry kernels, used by mspkit.geo when numba is installed
+"""
+import math
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True)
+def spiral_offsets(max_radius, radius_step, angle_step):
+    """Get (east, north) offsets in meters of an expanding spiral as an (N, 2) array"""
+    loops = int(max_radius // radius_step)
+    per_loop = int(math.ceil(360.0 / angle_step))
+    out = np.empty((loops * per_loop, 2))
+    k = 0
+    for i in range(1, loops + 1):
+        radius = i * radius_step
+        for j in range(per_loop):
+            angle = math.radians(j * angle_step)
+            out[k, 0] = radius * math.sin(angle)
+            out[k, 1] = radius * math.cos(angle)
+            k += 1
+    return out
@@ -6,12 +6,33 @@ Provides easy command-line access to MSPKit functionality.
 """
 
 import argparse
+import functools
 import json
+import math
 import sys
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
-from mspkit import connect, FlightController, Telemetry, Mission, Config
+# Mission and Config are imported inside their commands; the package loads
+# them lazily, so other commands never pay for their imports
+from mspkit import connect, FlightController, Telemetry, TelemetrySection
+from mspkit.rt import ticks
+
+# --fc-type choices and the controller each one selects
+FC_TYPES = {
+    'INAV': FlightController.INAV,
+    'BETAFLIGHT': FlightController.BETAFLIGHT,
+}
+
+def positive_rate(value: str) -> float:
+    """argparse type for --rate: a number of updates per second above zero"""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {value!r}")
+    if not (rate > 0 and math.isfinite(rate)):
+        raise argparse.ArgumentTypeError(f"rate must be a finite number above 0, got {value}")
+    return rate
 
 def setup_logging(verbose: bool):
     """Setup logging configuration"""
@@ -21,23 +42,31 @@ def setup_logging(verbose: bool):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-def connect_to_fc(port: str, fc_type: str) -> Optional[object]:
+def connect_to_fc(port: str, fc_type: FlightController) -> Optional[object]:
     """Connect to flight controller"""
     try:
-        fc_enum = FlightController.INAV if fc_type.upper() == 'INAV' else FlightController.BETAFLIGHT
-        return connect(port, fc_type=fc_enum)
+        return connect(port, fc_type=fc_type)
     except Exception as e:
         print(f"Failed to connect to {port}: {e}")
         return None
 
-def cmd_info(args):
+def with_connection(command: Callable) -> Callable:
+    """Connect before running command(conn, args) and close the port afterwards"""
+    @functools.wraps(command)
+    def run(args):
+        conn = connect_to_fc(args.port, args.fc_enum)
+        if not conn:
+            return 1
+        try:
+            return command(conn, args)
+        finally:
+            conn.close()
+    return run
+
+@with_connection
+def cmd_info(conn, args):
     """Get flight controller information"""
-    conn = connect_to_fc(args.port, args.fc_type)
-    if not conn:
-        return 1
-    
-    telem = Telemetry(conn)
-    info = telem.get_api_version()
+    info = conn.telemetry.get_api_version()
     
     print(f"Flight Controller Info:")
     print(f"  Type: {args.fc_type}")
@@ -46,37 +75,33 @@ def cmd_info(args):
     
     return 0
 
-def cmd_telemetry(args):
+@with_connection
+def cmd_telemetry(conn, args):
     """Stream telemetry data"""
-    conn = connect_to_fc(args.port, args.fc_type)
-    if not conn:
-        return 1
-    
-    telem = Telemetry(conn)
+    # Keep cached responses shorter-lived than one refresh so every tick is fresh
+    telem = Telemetry(conn, cache_ttl=min(0.05, 0.5 / args.rate))
     
     try:
-        import time
-        while True:
+        # Deadline pacing: the round-trip overlaps the wait instead of adding to it
+        for _ in ticks(1.0 / args.rate):
+            # One pipelined burst: both requests go out before either response is read
+            telem.prefetch(TelemetrySection.ATTITUDE | TelemetrySection.GPS)
             attitude = telem.get_attitude()
             gps = telem.get_gps()
             
             print(f"\rRoll: {attitude.get('roll', 0):6.1f}° | "
                   f"Pitch: {attitude.get('pitch', 0):6.1f}° | "
                   f"Yaw: {attitude.get('yaw', 0):6.1f}° | "
-                  f"Alt: {gps.get('alt', 0):6.1f}m", end='')
-            
-            time.sleep(0.1)
+                  f"Alt: {gps.get('altitude', 0):6.1f}m", end='')
             
     except KeyboardInterrupt:
         print("\nTelemetry stopped")
         return 0
 
-def cmd_mission_upload(args):
+@with_connection
+def cmd_mission_upload(conn, args):
     """Upload mission from file"""
-    conn = connect_to_fc(args.port, args.fc_type)
-    if not conn:
-        return 1
-    
+    from mspkit import Mission
     mission = Mission(conn)
     
     if mission.load_mission_from_file(args.file):
@@ -92,12 +117,10 @@ def cmd_mission_upload(args):
         print(f"Failed to load mission from {args.file}")
         return 1
 
-def cmd_mission_download(args):
+@with_connection
+def cmd_mission_download(conn, args):
     """Download mission to file"""
-    conn = connect_to_fc(args.port, args.fc_type)
-    if not conn:
-        return 1
-    
+    from mspkit import Mission
     mission = Mission(conn)
     
     if mission.download_mission():
@@ -111,12 +134,10 @@ def cmd_mission_download(args):
         print("Failed to download mission")
         return 1
 
-def cmd_config_backup(args):
+@with_connection
+def cmd_config_backup(conn, args):
     """Backup flight controller configuration"""
-    conn = connect_to_fc(args.port, args.fc_type)
-    if not conn:
-        return 1
-    
+    from mspkit import Config
     config = Config(conn)
     
     if config.backup_config(args.file):
@@ -140,7 +161,7 @@ def main():
     
     parser.add_argument(
         '-t', '--fc-type',
-        choices=['INAV', 'BETAFLIGHT'],
+        choices=list(FC_TYPES),
         default='INAV',
         help='Flight controller type (default: INAV)'
     )
@@ -157,7 +178,13 @@ def main():
     subparsers.add_parser('info', help='Get flight controller information')
     
     # Telemetry command
-    subparsers.add_parser('telemetry', help='Stream telemetry data')
+    telemetry = subparsers.add_parser('telemetry', help='Stream telemetry data')
+    telemetry.add_argument(
+        '-r', '--rate',
+        type=positive_rate,
+        default=10.0,
+        help='Display updates per second (default: 10)'
+    )
     
     # Mission commands
     mission_upload = subparsers.add_parser('mission-upload', help='Upload mission from file')
@@ -176,6 +203,7 @@ def main():
         parser.print_help()
         return 1
     
+    args.fc_enum = FC_TYPES[args.fc_type]
     setup_logging(args.verbose)
     
     # Route to appropriate command handler
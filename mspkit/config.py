@@ -1,17 +1,80 @@
 import struct
 import time
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from .msp_constants import MSPCommands, FlightController
 
 logger = logging.getLogger(__name__)
 
+# Precompiled layouts of the fixed-size settings payloads
+_U8 = struct.Struct('<B')
+_U32 = struct.Struct('<I')
+_MISC = struct.Struct('<5H6Bh4B')
+_SET_MISC = struct.Struct('<5H6Bh3B')
+_FAILSAFE = struct.Struct('<BBHB')
+_FAILSAFE_LOW = struct.Struct('<HB')
+_MOTOR_CONFIG = struct.Struct('<HHH')
+
 class Config:
     """Enhanced configuration management for flight controllers"""
     
-    def __init__(self, conn):
+    # Settings read by backup_settings()
+    BACKUP_CODES = (
+        MSPCommands.MSP_PID,
+        MSPCommands.MSP_RC_TUNING,
+        MSPCommands.MSP_FEATURE,
+        MSPCommands.MSP_MISC,
+        MSPCommands.MSP_FAILSAFE_CONFIG,
+        MSPCommands.MSP_MOTOR_CONFIG,
+        MSPCommands.MSP_BOXNAMES,
+        MSPCommands.MSP_BOXIDS,
+    )
+    
+    def __init__(self, conn, cache_ttl: float = 5.0):
         self.conn = conn
         self.fc_type = conn.fc_type
+        self.cache_ttl = cache_ttl
+        # Raw response payloads keyed by MSP code: (read time, payload)
+        self._cache: Dict[int, Tuple[float, bytes]] = {}
+
+    def _read(self, code: int) -> Optional[bytes]:
+        """Read a settings payload, reusing a cached copy younger than cache_ttl"""
+        cached = self._cache.get(code)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+            
+        data = self.conn.request(code)
+        if data:
+            self._cache[code] = (time.monotonic(), data)
+        return data
+
+    def prefetch(self, codes: Iterable[int] = BACKUP_CODES) -> None:
+        """Read several settings payloads in one batch
+        
+        Payloads missing from the cache are requested with request_multiple()
+        (a single MSP_MULTIPLE_MSP exchange on Betaflight, a pipelined burst
+        elsewhere), so the getters that follow are answered from the cache
+        instead of costing a round-trip each.
+        """
+        now = time.monotonic()
+        stale = [code for code in codes
+                 if code not in self._cache or now - self._cache[code][0] >= self.cache_ttl]
+        if not stale:
+            return
+            
+        responses = self.conn.request_multiple(stale)
+        now = time.monotonic()
+        for code, data in responses.items():
+            if data:
+                self._cache[code] = (now, data)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached settings so the next read goes to the flight controller"""
+        self._cache.clear()
+
+    def _store(self, code: int, data: bytes) -> None:
+        """Cache a payload just written to the FC so reading it back is free"""
+        self._cache[code] = (time.monotonic(), data)
     
     def save_settings(self) -> bool:
         """Save current settings to EEPROM"""
@@ -20,17 +83,18 @@ class Config:
             logger.info("Settings saved to EEPROM")
             return True
         except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings: %s", e)
             return False
 
     def reset_settings(self) -> bool:
         """Reset all settings to defaults"""
         try:
             self.conn.send_msp(MSPCommands.MSP_RESET_CONF)
+            self.invalidate_cache()
             logger.warning("Settings reset to defaults")
             return True
         except Exception as e:
-            logger.error(f"Failed to reset settings: {e}")
+            logger.error("Failed to reset settings: %s", e)
             return False
 
     def select_profile(self, profile_id: int) -> bool:
@@ -40,19 +104,19 @@ class Config:
             return False
             
         try:
-            data = struct.pack('<B', profile_id)
+            data = _U8.pack(profile_id)
             self.conn.send_msp(MSPCommands.MSP_SELECT_SETTING, data)
-            logger.info(f"Selected profile {profile_id}")
+            self.invalidate_cache()
+            logger.info("Selected profile %s", profile_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to select profile: {e}")
+            logger.error("Failed to select profile: %s", e)
             return False
 
     def get_pid_values(self) -> Optional[Dict[str, Any]]:
         """Get PID controller values"""
-        self.conn.send_msp(MSPCommands.MSP_PID)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_PID and data:
+        data = self._read(MSPCommands.MSP_PID)
+        if data:
             pids = {}
             pid_names = ['ROLL', 'PITCH', 'YAW', 'ALT', 'Pos', 'PosR', 'NavR', 'LEVEL', 'MAG', 'VEL']
             
@@ -99,18 +163,18 @@ class Config:
                     data.extend([0, 0, 0])  # Default values
             
             self.conn.send_msp(MSPCommands.MSP_SET_PID, bytes(data))
+            self._store(MSPCommands.MSP_PID, bytes(data))
             logger.info("PID values updated")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set PID values: {e}")
+            logger.error("Failed to set PID values: %s", e)
             return False
 
     def get_rc_tuning(self) -> Optional[Dict[str, Any]]:
         """Get RC tuning parameters (rates, expo, etc.)"""
-        self.conn.send_msp(MSPCommands.MSP_RC_TUNING)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_RC_TUNING and data:
+        data = self._read(MSPCommands.MSP_RC_TUNING)
+        if data:
             if len(data) >= 7:
                 result = {
                     'rc_rate': data[0] / 100.0,
@@ -149,39 +213,39 @@ class Config:
             
             # Pack data
             data = [
-                int(current['rc_rate'] * 100),
-                int(current['rc_expo'] * 100),
-                int(current['roll_pitch_rate'] * 100),
-                int(current['yaw_rate'] * 100),
-                int(current['dyn_thr_pid'] * 100),
-                int(current['throttle_mid'] * 100),
-                int(current['throttle_expo'] * 100)
+                round(current['rc_rate'] * 100),
+                round(current['rc_expo'] * 100),
+                round(current['roll_pitch_rate'] * 100),
+                round(current['yaw_rate'] * 100),
+                round(current['dyn_thr_pid'] * 100),
+                round(current['throttle_mid'] * 100),
+                round(current['throttle_expo'] * 100)
             ]
             
             # Extended parameters if supported
             if 'thr_pid_attenuation' in current:
                 data.extend([
-                    int(current['thr_pid_attenuation'] * 100),
-                    int(current['rc_yaw_expo'] * 100),
-                    int(current['rc_yaw_rate'] * 100),
-                    int(current['rc_pitch_rate'] * 100)
+                    round(current['thr_pid_attenuation'] * 100),
+                    round(current['rc_yaw_expo'] * 100),
+                    round(current['rc_yaw_rate'] * 100),
+                    round(current['rc_pitch_rate'] * 100)
                 ])
             
             self.conn.send_msp(MSPCommands.MSP_SET_RC_TUNING, bytes(data))
+            self._store(MSPCommands.MSP_RC_TUNING, bytes(data))
             logger.info("RC tuning updated")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set RC tuning: {e}")
+            logger.error("Failed to set RC tuning: %s", e)
             return False
 
     def get_features(self) -> Optional[Dict[str, bool]]:
         """Get enabled features"""
-        self.conn.send_msp(MSPCommands.MSP_FEATURE)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_FEATURE and data:
+        data = self._read(MSPCommands.MSP_FEATURE)
+        if data:
             if len(data) >= 4:
-                feature_mask = struct.unpack('<I', data[:4])[0]
+                feature_mask = _U32.unpack_from(data)[0]
                 
                 # Common features
                 features = {
@@ -226,66 +290,74 @@ class Config:
                 return features
         return None
 
+    def _feature_bits(self) -> Dict[str, int]:
+        """Map feature names to their bit in the MSP_FEATURE mask"""
+        feature_bits = {
+            'RX_PPM': 0, 'VBAT': 1, 'INFLIGHT_ACC_CAL': 2, 'RX_SERIAL': 3,
+            'MOTOR_STOP': 4, 'SERVO_TILT': 5, 'SOFTSERIAL': 6, 'GPS': 7,
+            'FAILSAFE': 8, 'SONAR': 9, 'TELEMETRY': 10, 'CURRENT_METER': 11,
+            '3D': 12, 'RX_PARALLEL_PWM': 13, 'RX_MSP': 14, 'RSSI_ADC': 15,
+            'LED_STRIP': 16, 'DISPLAY': 17, 'OSD': 18, 'BLACKBOX': 19,
+            'CHANNEL_FORWARDING': 20, 'TRANSPONDER': 21, 'AIRMODE': 22
+        }
+        
+        # FC-specific features
+        if self.fc_type == FlightController.INAV:
+            feature_bits.update({'NAV': 23, 'FW_LAUNCH': 24, 'FW_AUTOTRIM': 25})
+        elif self.fc_type == FlightController.BETAFLIGHT:
+            feature_bits.update({'ANTI_GRAVITY': 23, 'ESC_SENSOR': 24})
+        return feature_bits
+
     def set_feature(self, feature_name: str, enabled: bool) -> bool:
         """Enable/disable a specific feature"""
+        if self.set_features({feature_name: enabled}):
+            logger.info("Feature %s %s", feature_name, 'enabled' if enabled else 'disabled')
+            return True
+        return False
+
+    def set_features(self, features: Dict[str, bool]) -> bool:
+        """Enable/disable several features with a single write
+        
+        The current mask is read once and the given features are overlaid on
+        it, so features not named, including bits this library has no name
+        for, keep their state.
+        """
         try:
-            current_features = self.get_features()
-            if not current_features:
-                logger.error("Could not retrieve current features")
-                return False
+            feature_bits = self._feature_bits()
+            for feature_name in features:
+                if feature_name not in feature_bits:
+                    logger.error("Unknown feature: %s", feature_name)
+                    return False
             
-            if feature_name not in current_features:
-                logger.error(f"Unknown feature: {feature_name}")
+            current = self._read(MSPCommands.MSP_FEATURE)
+            if not current or len(current) < 4:
+                logger.error("Could not retrieve current features")
                 return False
+            feature_mask = _U32.unpack_from(current)[0]
             
-            # Update feature
-            current_features[feature_name] = enabled
+            for feature_name, enabled in features.items():
+                bit = 1 << feature_bits[feature_name]
+                feature_mask = feature_mask | bit if enabled else feature_mask & ~bit
             
-            # Build feature mask
-            feature_mask = 0
-            feature_bits = {
-                'RX_PPM': 0, 'VBAT': 1, 'INFLIGHT_ACC_CAL': 2, 'RX_SERIAL': 3,
-                'MOTOR_STOP': 4, 'SERVO_TILT': 5, 'SOFTSERIAL': 6, 'GPS': 7,
-                'FAILSAFE': 8, 'SONAR': 9, 'TELEMETRY': 10, 'CURRENT_METER': 11,
-                '3D': 12, 'RX_PARALLEL_PWM': 13, 'RX_MSP': 14, 'RSSI_ADC': 15,
-                'LED_STRIP': 16, 'DISPLAY': 17, 'OSD': 18, 'BLACKBOX': 19,
-                'CHANNEL_FORWARDING': 20, 'TRANSPONDER': 21, 'AIRMODE': 22
-            }
-            
-            # FC-specific features
-            if self.fc_type == FlightController.INAV:
-                feature_bits.update({'NAV': 23, 'FW_LAUNCH': 24, 'FW_AUTOTRIM': 25})
-            elif self.fc_type == FlightController.BETAFLIGHT:
-                feature_bits.update({'ANTI_GRAVITY': 23, 'ESC_SENSOR': 24})
-            
-            for feature, bit in feature_bits.items():
-                if feature in current_features and current_features[feature]:
-                    feature_mask |= (1 << bit)
-            
-            data = struct.pack('<I', feature_mask)
+            data = _U32.pack(feature_mask)
             self.conn.send_msp(MSPCommands.MSP_SET_FEATURE, data)
-            logger.info(f"Feature {feature_name} {'enabled' if enabled else 'disabled'}")
+            self._store(MSPCommands.MSP_FEATURE, data)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set feature: {e}")
+            logger.error("Failed to set feature: %s", e)
             return False
 
     def get_misc_settings(self) -> Optional[Dict[str, Any]]:
         """Get miscellaneous settings"""
-        self.conn.send_msp(MSPCommands.MSP_MISC)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_MISC and data:
-            if len(data) >= 22:
-                mid_rc, min_throttle, max_throttle, min_command = struct.unpack('<HHHH', data[0:8])
-                failsafe_throttle = struct.unpack('<H', data[8:10])[0]
-                gps_provider, gps_baudrate, gps_ubx_sbas = struct.unpack('<BBB', data[10:13])
-                multiwii_current_meter_output = data[13]
-                rssi_channel = data[14]
-                placeholder1 = data[15]
-                mag_declination = struct.unpack('<h', data[16:18])[0] / 10.0
-                vbat_scale, vbat_min, vbat_max = struct.unpack('<BBB', data[18:21])
-                vbat_warning = data[21]
+        data = self._read(MSPCommands.MSP_MISC)
+        if data:
+            if len(data) >= _MISC.size:
+                (mid_rc, min_throttle, max_throttle, min_command, failsafe_throttle,
+                 gps_provider, gps_baudrate, gps_ubx_sbas,
+                 multiwii_current_meter_output, rssi_channel, _placeholder,
+                 mag_declination, vbat_scale, vbat_min, vbat_max,
+                 vbat_warning) = _MISC.unpack_from(data)
                 
                 return {
                     'mid_rc': mid_rc,
@@ -298,7 +370,7 @@ class Config:
                     'gps_ubx_sbas': gps_ubx_sbas,
                     'multiwii_current_meter_output': multiwii_current_meter_output,
                     'rssi_channel': rssi_channel,
-                    'mag_declination': mag_declination,
+                    'mag_declination': mag_declination / 10.0,
                     'vbat_scale': vbat_scale,
                     'vbat_min': vbat_min,
                     'vbat_max': vbat_max,
@@ -306,6 +378,47 @@ class Config:
                 }
         return None
 
+    def get_failsafe_config(self) -> Optional[Dict[str, Any]]:
+        """Get failsafe configuration"""
+        data = self._read(MSPCommands.MSP_FAILSAFE_CONFIG)
+        if data:
+            if len(data) >= _FAILSAFE.size:
+                delay, off_delay, throttle, kill_switch = _FAILSAFE.unpack_from(data)
+                result = {
+                    'failsafe_delay': delay / 10.0,  # seconds
+                    'failsafe_off_delay': off_delay / 10.0,  # seconds
+                    'failsafe_throttle': throttle,
+                    'failsafe_kill_switch': bool(kill_switch)
+                }
+                
+                if len(data) >= _FAILSAFE.size + _FAILSAFE_LOW.size:
+                    low_delay, procedure = _FAILSAFE_LOW.unpack_from(data, _FAILSAFE.size)
+                    result['failsafe_throttle_low_delay'] = low_delay / 10.0
+                    result['failsafe_procedure'] = procedure
+                    
+                return result
+        return None
+
+    def get_motor_config(self) -> Optional[Dict[str, Any]]:
+        """Get motor output configuration"""
+        data = self._read(MSPCommands.MSP_MOTOR_CONFIG)
+        if data:
+            if len(data) >= _MOTOR_CONFIG.size:
+                min_throttle, max_throttle, min_command = _MOTOR_CONFIG.unpack_from(data)
+                result = {
+                    'min_throttle': min_throttle,
+                    'max_throttle': max_throttle,
+                    'min_command': min_command
+                }
+                
+                # Betaflight appends motor count and pole count
+                if len(data) >= 8:
+                    result['motor_count'] = data[6]
+                    result['motor_poles'] = data[7]
+                    
+                return result
+        return None
+
     def set_misc_settings(self, settings: Dict[str, Any]) -> bool:
         """Set miscellaneous settings"""
         try:
@@ -318,7 +431,7 @@ class Config:
             current.update(settings)
             
             # Pack data
-            data = struct.pack('<HHHHHBBBBBBHBBB',
+            data = _SET_MISC.pack(
                 current['mid_rc'],
                 current['min_throttle'],
                 current['max_throttle'],
@@ -337,32 +450,32 @@ class Config:
             )
             
             self.conn.send_msp(MSPCommands.MSP_SET_MISC, data)
+            self.invalidate_cache()
             logger.info("Misc settings updated")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set misc settings: {e}")
+            logger.error("Failed to set misc settings: %s", e)
             return False
 
     def get_box_names(self) -> Optional[List[str]]:
         """Get flight mode box names"""
-        self.conn.send_msp(MSPCommands.MSP_BOXNAMES)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_BOXNAMES and data:
+        data = self._read(MSPCommands.MSP_BOXNAMES)
+        if data:
             names_str = data.decode('ascii').rstrip('\x00')
             return names_str.split(';') if names_str else []
         return None
 
     def get_box_ids(self) -> Optional[List[int]]:
         """Get flight mode box IDs"""
-        self.conn.send_msp(MSPCommands.MSP_BOXIDS)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_BOXIDS and data:
+        data = self._read(MSPCommands.MSP_BOXIDS)
+        if data:
             return list(data)
         return None
 
     def backup_settings(self) -> Optional[Dict[str, Any]]:
         """Create a backup of current settings"""
+        self.prefetch(self.BACKUP_CODES)
         backup = {
             'timestamp': time.time(),
             'fc_type': self.fc_type.name,
@@ -370,6 +483,8 @@ class Config:
             'rc_tuning': self.get_rc_tuning(),
             'features': self.get_features(),
             'misc': self.get_misc_settings(),
+            'failsafe': self.get_failsafe_config(),
+            'motor': self.get_motor_config(),
             'box_names': self.get_box_names(),
             'box_ids': self.get_box_ids()
         }
@@ -401,19 +516,52 @@ class Config:
                 if self.set_misc_settings(backup['misc']):
                     success_count += 1
             
-            # Restore features
             if 'features' in backup and backup['features']:
-                for feature, enabled in backup['features'].items():
-                    self.set_feature(feature, enabled)
-                success_count += 1
+                if self.set_features(backup['features']):
+                    success_count += 1
             
             if success_count > 0:
-                logger.info(f"Settings restored ({success_count} categories)")
+                logger.info("Settings restored (%s categories)", success_count)
                 return True
             else:
                 logger.error("No settings were restored")
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to restore settings: {e}")
+            logger.error("Failed to restore settings: %s", e)
             return False
+
+    def verify_settings(self, backup: Dict[str, Any]) -> List[str]:
+        """Compare the FC's settings against a backup
+        
+        Reads every restorable section back in one pipelined burst and returns
+        the names of the sections that differ from the backup.
+        """
+        getters = {
+            'pids': (MSPCommands.MSP_PID, self.get_pid_values),
+            'rc_tuning': (MSPCommands.MSP_RC_TUNING, self.get_rc_tuning),
+            'features': (MSPCommands.MSP_FEATURE, self.get_features),
+            'misc': (MSPCommands.MSP_MISC, self.get_misc_settings),
+        }
+        sections = [name for name in getters if backup.get(name)]
+        
+        self.invalidate_cache()
+        self.prefetch(getters[name][0] for name in sections)
+        
+        mismatched = [name for name in sections
+                      if not _settings_match(backup[name], getters[name][1]())]
+        if mismatched:
+            logger.warning("Settings differ from backup: %s", ', '.join(mismatched))
+        return mismatched
+
+
+def _settings_match(expected: Any, actual: Any) -> bool:
+    """Check that every value in expected is present in actual"""
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _settings_match(value, actual[key])
+            for key, value in expected.items())
+    if isinstance(expected, float) or isinstance(actual, float):
+        # Values round-trip through the FC's fixed-point encodings
+        return actual is not None and abs(expected - actual) < 0.051
+    return expected == actual
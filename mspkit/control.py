@@ -6,6 +6,9 @@ from .msp_constants import MSPCommands, RC_CHANNELS, PWM_VALUES, FlightControlle
 
 logger = logging.getLogger(__name__)
 
+# MSP_SET_RAW_RC payload used by set_rc_override(): all 16 channels
+_RC_OVERRIDE = struct.Struct('<16H')
+
 class Control:
     """Enhanced control class with safety features and multi-FC support"""
     
@@ -19,7 +22,7 @@ class Control:
     def enable_safety(self, enabled: bool = True):
         """Enable/disable safety checks"""
         self._safety_enabled = enabled
-        logger.info(f"Safety checks {'enabled' if enabled else 'disabled'}")
+        logger.info("Safety checks %s", 'enabled' if enabled else 'disabled')
         
     def _validate_channel_value(self, value: int) -> int:
         """Validate and clamp PWM channel value"""
@@ -32,16 +35,13 @@ class Control:
             if isinstance(value, (int, float)):
                 validated.append(self._validate_channel_value(int(value)))
             else:
-                logger.warning(f"Invalid channel {i} value: {value}, using neutral")
+                logger.warning("Invalid channel %s value: %s, using neutral", i, value)
                 validated.append(PWM_VALUES['NEUTRAL'])
         return validated
     
     def _check_armed_state(self) -> bool:
         """Check if the aircraft is armed"""
-        # Import here to avoid circular import
-        from .telemetry import Telemetry
-        telem = Telemetry(self.conn)
-        status = telem.get_status()
+        status = self.conn.telemetry.get_status()
         if status:
             self._is_armed = status.get('armed', False)
             return self._is_armed
@@ -67,8 +67,14 @@ class Control:
                 
         return True
 
-    def send_rc(self, channels: List[int], validate: bool = True) -> bool:
-        """Send RC channel values with validation and safety checks"""
+    def send_rc(self, channels: List[int], validate: bool = True, wait_ack: bool = False) -> bool:
+        """Send RC channel values with validation and safety checks
+        
+        By default the update is fire-and-forget: the FC's acknowledgement is
+        left on the wire and collected later by flush_acks(), so a control
+        loop does not pay a round-trip per tick. With wait_ack=True the call
+        blocks until the FC acknowledges the update.
+        """
         if not self._safety_check('send_rc'):
             return False
             
@@ -85,14 +91,29 @@ class Control:
         try:
             # Pack up to 16 channels
             data = struct.pack(f'<{len(channels)}H', *channels)
-            self.conn.send_msp(MSPCommands.MSP_SET_RAW_RC, data)
+            if wait_ack:
+                self.flush_acks()
+                acked = self.conn.request(MSPCommands.MSP_SET_RAW_RC, data) is not None
+            else:
+                self.conn.send_msp(MSPCommands.MSP_SET_RAW_RC, data, expect_ack=True)
+                acked = True
             self._last_rc_values = channels.copy()
-            logger.debug(f"Sent RC channels: {channels[:8]}")
-            return True
+            logger.debug("Sent RC channels: %s", channels[:8])
+            if not acked:
+                logger.warning("RC update was not acknowledged")
+            return acked
         except Exception as e:
-            logger.error(f"Failed to send RC channels: {e}")
+            logger.error("Failed to send RC channels: %s", e)
             return False
 
+    def flush_acks(self, timeout: Optional[float] = None) -> int:
+        """Read back acknowledgements of fire-and-forget RC updates
+        
+        Returns the number of acknowledgements received; any still missing
+        after the timeout are treated as lost.
+        """
+        return self.conn.drain_acks(MSPCommands.MSP_SET_RAW_RC, timeout)
+
     def arm(self, throttle_check: bool = True) -> bool:
         """Arm the aircraft with safety checks"""
         if throttle_check and self._safety_enabled:
@@ -172,7 +193,8 @@ class Control:
         return self.send_rc(channels)
 
     def set_attitude(self, roll_percent: float = 0, pitch_percent: float = 0, 
-                    yaw_percent: float = 0, throttle_percent: Optional[float] = None) -> bool:
+                    yaw_percent: float = 0, throttle_percent: Optional[float] = None,
+                    wait_ack: bool = False) -> bool:
         """Set attitude control inputs as percentages (-100 to 100 for roll/pitch/yaw)"""
         if not self._safety_check('send_rc'):
             return False
@@ -199,17 +221,17 @@ class Control:
                               (PWM_VALUES['MAX'] - PWM_VALUES['MIN']))
             channels[RC_CHANNELS['THROTTLE']] = throttle_pwm
         
-        return self.send_rc(channels)
+        return self.send_rc(channels, wait_ack=wait_ack)
 
     def set_aux_channel(self, aux_number: int, value: int) -> bool:
         """Set auxiliary channel value"""
         if aux_number < 1 or aux_number > 8:
-            logger.error(f"Invalid AUX channel number: {aux_number}")
+            logger.error("Invalid AUX channel number: %s", aux_number)
             return False
             
         channel_index = RC_CHANNELS['AUX1'] + (aux_number - 1)
         if channel_index >= len(self._last_rc_values):
-            logger.error(f"AUX{aux_number} channel index out of range")
+            logger.error("AUX%s channel index out of range", aux_number)
             return False
             
         channels = self._last_rc_values.copy()
@@ -248,7 +270,7 @@ class Control:
             })
         
         if mode not in mode_mappings:
-            logger.error(f"Unknown flight mode: {mode}")
+            logger.error("Unknown flight mode: %s", mode)
             return False
             
         aux_name, aux_num = mode_mappings[mode]
@@ -308,8 +330,39 @@ class Control:
         """Get the last sent RC channel values"""
         return self._last_rc_values.copy()
     
-    def reset_rc_channels(self) -> bool:
+    def set_rc_override(self, roll: Optional[int] = None, pitch: Optional[int] = None,
+                        throttle: Optional[int] = None, yaw: Optional[int] = None) -> bool:
+        """Override individual stick channels, keeping the rest at their last values
+        
+        Meant to be called every tick of a control loop: the MSP_SET_RAW_RC
+        frame is packed in place into a buffer reused between calls, and the
+        acknowledgement is left for flush_acks() like send_rc().
+        """
+        if not self._safety_check('send_rc'):
+            return False
+            
+        channels = self._last_rc_values
+        if len(channels) < 16:
+            channels.extend([PWM_VALUES['NEUTRAL']] * (16 - len(channels)))
+        for name, value in (('ROLL', roll), ('PITCH', pitch), ('THROTTLE', throttle), ('YAW', yaw)):
+            if value is not None:
+                channels[RC_CHANNELS[name]] = self._validate_channel_value(int(value))
+                
+        try:
+            frame, offset = self.conn.frame_buffer(MSPCommands.MSP_SET_RAW_RC, _RC_OVERRIDE.size)
+            _RC_OVERRIDE.pack_into(frame, offset, *channels)
+            self.conn.send_frame(frame, expect_ack=True)
+            return True
+        except Exception as e:
+            logger.error("Failed to send RC channels: %s", e)
+            return False
+
+    def clear_rc_override(self) -> bool:
+        """Return all RC channels to neutral with throttle at minimum"""
+        return self.reset_rc_channels()
+
+    def reset_rc_channels(self, wait_ack: bool = False) -> bool:
         """Reset all RC channels to neutral/safe values"""
         channels = [PWM_VALUES['NEUTRAL']] * 16
         channels[RC_CHANNELS['THROTTLE']] = PWM_VALUES['MIN']  # Throttle to minimum
-        return self.send_rc(channels)
+        return self.send_rc(channels, wait_ack=wait_ack)
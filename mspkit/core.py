@@ -2,9 +2,13 @@ import serial
 import struct
 import time
 import logging
-from typing import Optional, Tuple, Union
+import queue
+import select
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
 from enum import IntEnum
-from .msp_constants import FlightController
+from .msp_constants import FlightController, MSPCommands
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +20,16 @@ MSP_V2_HEADER = b'$X<'
 MSP_V1_RESPONSE = b'$M>'
 MSP_V2_RESPONSE = b'$X>'
 MSP_ERROR = b'$M!'
+MSP_V2_ERROR = b'$X!'
+
+# Identification responses that cannot change while the FC stays connected
+STATIC_INFO_CODES = frozenset({
+    MSPCommands.MSP_API_VERSION,
+    MSPCommands.MSP_FC_VARIANT,
+    MSPCommands.MSP_FC_VERSION,
+    MSPCommands.MSP_BOARD_INFO,
+    MSPCommands.MSP_BUILD_INFO,
+})
 
 class MSPException(Exception):
     """Custom exception for MSP protocol errors"""
@@ -31,7 +45,34 @@ class ConnectionManager:
         self.timeout = timeout
         self.fc_type = fc_type
         self.ser: Optional[serial.Serial] = None
+        # Port descriptor for select(), where the platform provides one
+        self._fd: Optional[int] = None
         self.msp_v2_supported = False
+        # Payloads of STATIC_INFO_CODES, kept for the life of the connection
+        self._static_cache: Dict[int, bytes] = {}
+        # Background reader state, see start_reader()
+        self._rx_queue: Optional[queue.Queue] = None
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+        self._reader_poll = 0.05
+        # Held for a whole request/response exchange so threads sharing the
+        # connection never read each other's responses
+        self._transaction_lock = threading.RLock()
+        # Received bytes not yet parsed into frames
+        self._rx_buf = bytearray()
+        # Payload-less request frames keyed by (MSP version, code)
+        self._request_frames: Dict[Tuple[int, int], bytes] = {}
+        # Reusable request frames keyed by (MSP version, code, payload size)
+        self._frame_buffers: Dict[Tuple[int, int, int], Tuple[bytearray, int]] = {}
+        # Whether the FC answers MSP_MULTIPLE_MSP; None until first tried
+        self._multiple_msp: Optional[bool] = None
+        # Responses still owed to fire-and-forget requests, and those that
+        # arrived since the last drain_acks(), keyed by MSP code
+        self._unacked: Dict[int, int] = {}
+        self._acked: Dict[int, int] = {}
+        # Shared helpers, created on first use
+        self._telemetry = None
+        self._config = None
         self._connect()
         self._detect_msp_version()
         
@@ -39,19 +80,52 @@ class ConnectionManager:
         """Establish serial connection with error handling"""
         try:
             self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            self._fd = self._port_fd()
+            self._tune_port()
             time.sleep(2)  # Allow FC to initialize
-            logger.info(f"Connected to {self.port} at {self.baudrate} baud")
+            logger.info("Connected to %s at %s baud", self.port, self.baudrate)
         except serial.SerialException as e:
             raise MSPException(f"Failed to connect to {self.port}: {e}")
     
+    def _port_fd(self) -> Optional[int]:
+        """Get the port's file descriptor, or None if it cannot be selected on"""
+        try:
+            fd = self.ser.fileno()
+            select.select([fd], [], [], 0)
+            return fd
+        except (AttributeError, OSError, TypeError, ValueError, serial.SerialException):
+            return None
+
+    def _tune_port(self):
+        """Ask the driver for low-latency delivery of short MSP frames
+        
+        USB-serial adapters batch incoming bytes behind a latency timer
+        (16 ms by default on FTDI), which dominates every round-trip.
+        Only available on some platforms, so failures are ignored.
+        """
+        if hasattr(self.ser, 'set_low_latency_mode'):
+            # Linux: ASYNC_LOW_LATENCY via TIOCSSERIAL
+            try:
+                self.ser.set_low_latency_mode(True)
+                logger.debug("Serial low-latency mode enabled")
+            except (OSError, ValueError) as e:
+                logger.debug("Serial low-latency mode unavailable: %s", e)
+        if hasattr(self.ser, 'set_buffer_size'):
+            # Windows: enlarge the driver receive queue
+            try:
+                self.ser.set_buffer_size(rx_size=16384)
+            except (OSError, ValueError, serial.SerialException) as e:
+                logger.debug("Serial buffer size unchanged: %s", e)
+
     def _detect_msp_version(self):
         """Detect if MSP v2 is supported"""
         try:
             # Try MSP v2 API version command
             self.send_msp_v2(1, b'')
             code, data = self.read_response()
-            if code is not None:
+            if data is not None:
                 self.msp_v2_supported = True
+                self._remember_static({code: data})
                 logger.info("MSP v2 protocol detected")
             else:
                 logger.info("Using MSP v1 protocol")
@@ -78,21 +152,102 @@ class ConnectionManager:
                 crc &= 0xFF
         return crc
 
-    def send_msp_v1(self, code: int, data: bytes = b'') -> None:
-        """Send MSP v1 command"""
-        if not self.ser:
-            raise MSPException("Not connected")
-            
+    def _build_frame_v1(self, code: int, data: bytes = b'') -> bytes:
+        """Build an MSP v1 request frame"""
+        if not data:
+            frame = self._request_frames.get((1, code))
+            if frame is None:
+                frame = self._request_frames[(1, code)] = self._pack_frame_v1(code, data)
+            return frame
+        return self._pack_frame_v1(code, data)
+
+    def _pack_frame_v1(self, code: int, data: bytes) -> bytes:
+        """Encode an MSP v1 request frame"""
         size = len(data)
         if size > 255:
             raise MSPException("MSP v1 payload too large (max 255 bytes)")
             
         chk = self._calculate_checksum_v1(size, code, data)
-        packet = MSP_V1_HEADER + bytes([size, code]) + data + bytes([chk])
+        return MSP_V1_HEADER + bytes([size, code]) + data + bytes([chk])
+
+    def _build_frame_v2(self, code: int, data: bytes = b'') -> bytes:
+        """Build an MSP v2 request frame"""
+        if not data:
+            frame = self._request_frames.get((2, code))
+            if frame is None:
+                frame = self._request_frames[(2, code)] = self._pack_frame_v2(code, data)
+            return frame
+        return self._pack_frame_v2(code, data)
+
+    def _pack_frame_v2(self, code: int, data: bytes) -> bytes:
+        """Encode an MSP v2 request frame"""
+        size = len(data)
+        if size > 65535:
+            raise MSPException("MSP v2 payload too large (max 65535 bytes)")
+        
+        # MSP v2 header: $X< + flag + code(2) + size(2) + payload + crc
+        flag = 0  # Request flag
+        header_payload = struct.pack('<BHH', flag, code, size) + data
+        crc = self._calculate_crc_v2(header_payload)
+        return MSP_V2_HEADER + header_payload + bytes([crc])
+
+    def _build_frame(self, code: int, data: bytes = b'', force_v1: bool = False) -> bytes:
+        """Build a request frame using best available protocol version"""
+        if self.msp_v2_supported and not force_v1 and len(data) <= 65535:
+            return self._build_frame_v2(code, data)
+        return self._build_frame_v1(code, data)
+
+    def frame_buffer(self, code: int, size: int) -> Tuple[bytearray, int]:
+        """Get a reusable request frame and the offset of its payload
+        
+        Pack a size-byte payload into the frame in place (e.g. with
+        struct.Struct.pack_into) and send it with send_frame(). The same
+        buffer is returned on every call, so a control loop sending the same
+        command each tick does not build a new frame.
+        """
+        version = 2 if self.msp_v2_supported else 1
+        key = (version, code, size)
+        entry = self._frame_buffers.get(key)
+        if entry is None:
+            frame = bytearray(self._build_frame(code, bytes(size), force_v1=version == 1))
+            entry = self._frame_buffers[key] = (frame, 8 if version == 2 else 5)
+        return entry
+
+    def send_frame(self, frame: bytearray, expect_ack: bool = False) -> None:
+        """Update the checksum of a frame from frame_buffer() and send it
+        
+        With expect_ack the response is left on the wire for drain_acks().
+        """
+        if not self.ser:
+            raise MSPException("Not connected")
+            
+        body = memoryview(frame)[3:-1]
+        if frame[1] == MSP_V2_HEADER[1]:
+            frame[-1] = self._calculate_crc_v2(body)
+            code = frame[4] | frame[5] << 8
+        else:
+            frame[-1] = self._calculate_checksum_v1(frame[3], frame[4], body[2:])
+            code = frame[4]
+        body.release()
+        
+        with self._transaction_lock:
+            try:
+                self.ser.write(frame)
+            except serial.SerialException as e:
+                raise MSPException(f"Failed to send MSP command: {e}")
+            if expect_ack:
+                self._unacked[code] = self._unacked.get(code, 0) + 1
+
+    def send_msp_v1(self, code: int, data: bytes = b'') -> None:
+        """Send MSP v1 command"""
+        if not self.ser:
+            raise MSPException("Not connected")
+            
+        packet = self._build_frame_v1(code, data)
         
         try:
             self.ser.write(packet)
-            logger.debug(f"Sent MSP v1 command: {code}, size: {size}")
+            logger.debug("Sent MSP v1 command: %d, size: %d", code, len(data))
         except serial.SerialException as e:
             raise MSPException(f"Failed to send MSP command: {e}")
 
@@ -101,121 +256,465 @@ class ConnectionManager:
         if not self.ser:
             raise MSPException("Not connected")
             
-        size = len(data)
-        if size > 65535:
-            raise MSPException("MSP v2 payload too large (max 65535 bytes)")
-        
-        # MSP v2 header: $X< + flag + code(2) + size(2) + payload + crc
-        flag = 0  # Request flag
-        header_payload = struct.pack('<BHH', flag, code, size) + data
-        crc = self._calculate_crc_v2(header_payload)
-        packet = MSP_V2_HEADER + header_payload + bytes([crc])
+        packet = self._build_frame_v2(code, data)
         
         try:
             self.ser.write(packet)
-            logger.debug(f"Sent MSP v2 command: {code}, size: {size}")
+            logger.debug("Sent MSP v2 command: %d, size: %d", code, len(data))
         except serial.SerialException as e:
             raise MSPException(f"Failed to send MSP command: {e}")
 
-    def send_msp(self, code: int, data: bytes = b'', force_v1: bool = False) -> None:
-        """Send MSP command using best available protocol version"""
-        if self.msp_v2_supported and not force_v1 and len(data) <= 65535:
-            self.send_msp_v2(code, data)
-        else:
-            self.send_msp_v1(code, data)
+    def send_msp(self, code: int, data: bytes = b'', force_v1: bool = False,
+                 expect_ack: bool = False) -> None:
+        """Send MSP command using best available protocol version
+        
+        With expect_ack the response is not waited for: it is left on the
+        wire and counted by drain_acks() when it turns up.
+        """
+        with self._transaction_lock:
+            if self.msp_v2_supported and not force_v1 and len(data) <= 65535:
+                self.send_msp_v2(code, data)
+            else:
+                self.send_msp_v1(code, data)
+            if expect_ack:
+                self._unacked[code] = self._unacked.get(code, 0) + 1
 
-    def read_response(self, timeout: Optional[float] = None) -> Tuple[Optional[int], Optional[bytes]]:
-        """Read MSP response with timeout and error handling"""
+    def drain_acks(self, code: int, timeout: Optional[float] = None) -> int:
+        """Collect the responses owed to fire-and-forget requests of code
+        
+        Responses already read past by other requests are counted without
+        touching the port; the rest are waited for up to timeout and given
+        up as lost if they do not arrive. Returns how many arrived since the
+        last call.
+        """
+        with self._transaction_lock:
+            deadline = time.time() + (timeout or self.timeout)
+            while self._unacked.get(code):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                got, _ = self.read_response(timeout=remaining)
+                if got is None:
+                    break
+                if not self._settle_ack(got):
+                    logger.debug("Discarding unsolicited MSP response: %d", got)
+            self._unacked.pop(code, None)
+            return self._acked.pop(code, 0)
+
+    def _settle_ack(self, code: int) -> bool:
+        """Count a response against a fire-and-forget request, if one is owed
+        
+        Responses arrive in request order, so an owed response always comes
+        before the answer to a later request with the same code.
+        """
+        if not self._unacked.get(code):
+            return False
+        self._unacked[code] -= 1
+        self._acked[code] = self._acked.get(code, 0) + 1
+        return True
+
+    def request(self, code: int, data: bytes = b'',
+                timeout: Optional[float] = None) -> Optional[bytes]:
+        """Send an MSP command and return the payload of its response"""
+        if not data and code in self._static_cache:
+            return self._static_cache[code]
+            
+        with self._transaction_lock:
+            self.send_msp(code, data)
+            response = self._collect_responses([code], timeout).get(code)
+        if not data and response:
+            self._remember_static({code: response})
+        return response
+
+    def request_many(self, codes: Iterable[int],
+                     timeout: Optional[float] = None) -> Dict[int, bytes]:
+        """Pipeline several payload-less MSP requests in one write
+        
+        All request frames are written back-to-back before any response is
+        read, so the batch costs roughly one round-trip instead of one per
+        command. Returns the response payloads keyed by MSP code; commands
+        that were rejected or timed out are missing from the result.
+        """
         if not self.ser:
             raise MSPException("Not connected")
             
-        original_timeout = self.ser.timeout
-        if timeout:
-            self.ser.timeout = timeout
+        codes = list(dict.fromkeys(codes))
+        cached = {code: self._static_cache[code] for code in codes if code in self._static_cache}
+        codes = [code for code in codes if code not in cached]
+        if not codes:
+            return cached
             
-        try:
-            # Look for header
-            start_time = time.time()
-            while time.time() - start_time < (timeout or self.timeout):
-                byte = self.ser.read(1)
-                if not byte:
-                    continue
-                    
-                if byte == b'$':
-                    header = b'$' + self.ser.read(2)
-                    if header == MSP_V1_RESPONSE:
-                        return self._read_v1_response()
-                    elif header == MSP_V2_RESPONSE:
-                        return self._read_v2_response()
-                    elif header == MSP_ERROR:
-                        logger.warning("Received MSP error response")
-                        return None, None
-                        
-            logger.warning("MSP response timeout")
-            return None, None
+        packet = b''.join(self._build_frame(code) for code in codes)
+        with self._transaction_lock:
+            try:
+                self.ser.write(packet)
+                logger.debug("Sent %s pipelined MSP commands: %s", len(codes), codes)
+            except serial.SerialException as e:
+                raise MSPException(f"Failed to send MSP command: {e}")
+                
+            responses = self._collect_responses(codes, timeout)
+        self._remember_static(responses)
+        responses.update(cached)
+        return responses
+
+    def request_multiple(self, codes: Iterable[int],
+                         timeout: Optional[float] = None) -> Dict[int, bytes]:
+        """Read several payload-less MSP commands with one MSP_MULTIPLE_MSP request
+        
+        Betaflight answers the whole set in a single frame, so the batch costs
+        one request and one response frame. Commands it left out (to fit its
+        reply buffer) are read with request_many(), as is everything on
+        controllers without MSP_MULTIPLE_MSP. Returns payloads keyed by MSP
+        code, like request_many().
+        """
+        codes = list(dict.fromkeys(codes))
+        responses: Dict[int, bytes] = {}
+        bundle = [code for code in codes if code <= 0xFF and code not in self._static_cache]
+        
+        if (len(bundle) > 1 and self.fc_type == FlightController.BETAFLIGHT
+                and self._multiple_msp is not False):
+            rejected: Set[int] = set()
+            with self._transaction_lock:
+                self.send_msp(MSPCommands.MSP_MULTIPLE_MSP, bytes(bundle))
+                data = self._collect_responses([MSPCommands.MSP_MULTIPLE_MSP], timeout,
+                                               rejected).get(MSPCommands.MSP_MULTIPLE_MSP)
+            if data is not None:
+                self._multiple_msp = True
+            elif rejected:
+                # Only an error reply means the FC lacks it; a timeout is retried
+                self._multiple_msp = False
+            if data:
+                responses = self._split_multiple(bundle, data)
+                self._remember_static(responses)
+                
+        missing = [code for code in codes if code not in responses]
+        if missing:
+            responses.update(self.request_many(missing, timeout))
+        return responses
+
+    @staticmethod
+    def _split_multiple(codes: List[int], data: bytes) -> Dict[int, bytes]:
+        """Split an MSP_MULTIPLE_MSP reply into per-command payloads"""
+        responses: Dict[int, bytes] = {}
+        offset = 0
+        for code in codes:
+            if offset >= len(data):
+                break  # Reply was cut short to fit the FC's buffer
+            size = data[offset]
+            if size:
+                responses[code] = bytes(data[offset + 1:offset + 1 + size])
+            offset += 1 + size
+        return responses
+
+    def request_window(self, requests: Iterable[Tuple[int, bytes]], window: int = 8,
+                       timeout: Optional[float] = None) -> List[Optional[bytes]]:
+        """Stream MSP requests, keeping up to window of them unanswered
+
+        The FC answers in order, so each response is matched against the
+        oldest outstanding request. Unlike request_many() the requests may
+        carry payloads and repeat codes. Returns one entry per request, in
+        order: the response payload, or None if it was rejected or timed out.
+        """
+        if not self.ser:
+            raise MSPException("Not connected")
+
+        window = max(1, window)
+        results: List[Optional[bytes]] = []
+        in_flight: Deque[Tuple[int, int]] = deque()
+
+        with self._transaction_lock:
+            for code, data in requests:
+                if len(in_flight) >= window:
+                    self._await_oldest(in_flight, results, timeout)
+                in_flight.append((len(results), code))
+                results.append(None)
+                self.send_msp(code, data)
+            while in_flight:
+                self._await_oldest(in_flight, results, timeout)
+
+        return results
+
+    def _await_oldest(self, in_flight: Deque[Tuple[int, int]],
+                      results: List[Optional[bytes]], timeout: Optional[float]) -> None:
+        """Read until the oldest in-flight request is answered or gives up"""
+        index, expected = in_flight[0]
+        while True:
+            code, data = self.read_response(timeout)
+            if code is not None and self._settle_ack(code):
+                continue
+            if code == expected or code is None:
+                # Error replies, bad checksums and timeouts fail the request
+                results[index] = data
+                in_flight.popleft()
+                return
+            logger.debug("Discarding unsolicited MSP response: %d", code)
+
+    def _remember_static(self, responses: Dict[int, bytes]) -> None:
+        """Keep identification payloads so later requests skip the FC"""
+        for code, data in responses.items():
+            if code in STATIC_INFO_CODES and data:
+                self._static_cache[code] = data
+
+    def _collect_responses(self, codes: Iterable[int], timeout: Optional[float] = None,
+                           rejected: Optional[Set[int]] = None) -> Dict[int, bytes]:
+        """Read responses until each of codes is answered or time runs out
+        
+        Codes the FC answered with an error reply are added to rejected.
+        """
+        pending = set(codes)
+        frames_left = len(pending)
+        responses: Dict[int, bytes] = {}
+        deadline = time.time() + (timeout or self.timeout)
+        
+        while pending and frames_left > 0:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+                
+            code, data = self.read_response(timeout=remaining)
+            if code is not None and self._settle_ack(code):
+                continue
+            if code in pending:
+                if data is not None:
+                    responses[code] = data
+                elif rejected is not None:
+                    rejected.add(code)
+                pending.discard(code)
+                frames_left -= 1
+            elif code is None:
+                # Bad checksum or timeout - counts as an answer
+                frames_left -= 1
+            else:
+                logger.debug("Discarding unsolicited MSP response: %d", code)
+                
+        return responses
+
+    @property
+    def telemetry(self):
+        """Shared Telemetry instance for this connection"""
+        if self._telemetry is None:
+            # Import here to avoid circular import
+            from .telemetry import Telemetry
+            self._telemetry = Telemetry(self)
+        return self._telemetry
+
+    @property
+    def config(self):
+        """Shared Config instance for this connection"""
+        if self._config is None:
+            # Import here to avoid circular import
+            from .config import Config
+            self._config = Config(self)
+        return self._config
+
+    def start_reader(self, poll_interval: float = 0.05) -> None:
+        """Parse incoming frames on a background thread
+        
+        While the reader runs, response frames are read off the port as they
+        arrive and read_response() takes them from a queue, so decoding and
+        other Python work overlap with the serial transfer.
+        """
+        if not self.ser:
+            raise MSPException("Not connected")
+        if self._reader is not None and self._reader.is_alive():
+            return
             
+        self._reader_poll = poll_interval
+        self._rx_queue = queue.Queue()
+        self._reader_stop.clear()
+        self._reader = threading.Thread(target=self._reader_loop, args=(poll_interval,),
+                                        name="mspkit-reader", daemon=True)
+        self._reader.start()
+        logger.debug("Background MSP reader started")
+
+    def stop_reader(self) -> None:
+        """Stop the background reader and go back to blocking reads"""
+        if self._reader is None:
+            return
+            
+        self._reader_stop.set()
+        self._reader.join()
+        self._reader = None
+        self._rx_queue = None
+        logger.debug("Background MSP reader stopped")
+
+    def _reader_loop(self, poll_interval: float) -> None:
+        """Queue every frame read from the port until stop_reader()"""
+        original_timeout = self.ser.timeout
+        self.ser.timeout = poll_interval
+        try:
+            while not self._reader_stop.is_set():
+                frame = self._read_frame(poll_interval)
+                if frame is not None:
+                    self._rx_queue.put(frame)
         except serial.SerialException as e:
-            raise MSPException(f"Failed to read MSP response: {e}")
+            logger.error("Background MSP reader stopped: %s", e)
+        except Exception:
+            logger.exception("Background MSP reader failed")
         finally:
-            self.ser.timeout = original_timeout
+            if not self._reader_stop.is_set():
+                # Died on its own: read_response() goes back to blocking reads
+                self._rx_queue = None
+            if self.ser:
+                self.ser.timeout = original_timeout
 
-    def _read_v1_response(self) -> Tuple[Optional[int], Optional[bytes]]:
-        """Read MSP v1 response"""
+    def read_response(self, timeout: Optional[float] = None) -> Tuple[Optional[int], Optional[bytes]]:
+        """Read MSP response with timeout and error handling
+        
+        Returns (code, payload). An error reply from the FC comes back as
+        (code, None); timeouts and corrupt frames as (None, None).
+        """
         if not self.ser:
-            return None, None
+            raise MSPException("Not connected")
+            
+        rx_queue = self._rx_queue
+        if rx_queue is not None:
+            try:
+                return rx_queue.get(timeout=timeout or self.timeout)
+            except queue.Empty:
+                logger.warning("MSP response timeout")
+                return None, None
+            
+        # With a descriptor _read_frame() waits in select(); otherwise the
+        # port timeout bounds the wait. Setting it reconfigures the port
+        # (tcsetattr), so it is only touched when there is no other way.
+        original_timeout = self.ser.timeout
+        swap_timeout = bool(timeout) and self._fd is None and timeout != original_timeout
+        if swap_timeout:
+            self.ser.timeout = timeout
             
         try:
-            size = ord(self.ser.read(1))
-            code = ord(self.ser.read(1))
-            data = self.ser.read(size)
-            chk = ord(self.ser.read(1))
+            frame = self._read_frame(timeout or self.timeout)
+        except serial.SerialException as e:
+            raise MSPException(f"Failed to read MSP response: {e}")
+        finally:
+            if swap_timeout:
+                self.ser.timeout = original_timeout
             
-            # Verify checksum
-            expected_chk = self._calculate_checksum_v1(size, code, data)
-            if chk != expected_chk:
-                logger.warning("MSP v1 checksum mismatch")
-                return None, None
-                
-            return code, data
-        except (struct.error, TypeError) as e:
-            logger.error(f"MSP v1 response parsing error: {e}")
+        if frame is None:
+            logger.warning("MSP response timeout")
             return None, None
+        return frame
 
-    def _read_v2_response(self) -> Tuple[Optional[int], Optional[bytes]]:
-        """Read MSP v2 response"""
-        if not self.ser:
-            return None, None
+    def _read_frame(self, timeout: float) -> Optional[Tuple[Optional[int], Optional[bytes]]]:
+        """Wait for the next response frame; None if nothing arrived in time
+        
+        Bytes are pulled off the port in whole chunks (everything the driver
+        has queued, or one byte if it is empty) and frames are cut out of
+        _rx_buf, so a frame usually costs one read call instead of one per
+        header byte and field.
+        """
+        start_time = time.time()
+        while True:
+            frame = self._parse_frame()
+            if frame is not None:
+                return frame
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                return None
+                
+            waiting = self.ser.in_waiting
+            if not waiting and self._fd is not None:
+                if not select.select([self._fd], [], [], remaining)[0]:
+                    continue
+                waiting = self.ser.in_waiting
+            chunk = self.ser.read(waiting or 1)
+            if chunk:
+                self._rx_buf += chunk
+
+    def _parse_frame(self) -> Optional[Tuple[Optional[int], Optional[bytes]]]:
+        """Take one complete frame off the front of _rx_buf, if there is one"""
+        buf = self._rx_buf
+        while True:
+            start = buf.find(b'$')
+            if start < 0:
+                buf.clear()
+                return None
+            del buf[:start]
+            if len(buf) < 3:
+                return None
+                
+            header = bytes(buf[:3])
+            if header == MSP_V1_RESPONSE:
+                return self._parse_v1_response(buf)
+            elif header == MSP_V2_RESPONSE:
+                return self._parse_v2_response(buf)
+            elif header in (MSP_ERROR, MSP_V2_ERROR):
+                # Error frames share the response layout; consume all of it
+                if header == MSP_ERROR:
+                    frame = self._parse_v1_response(buf)
+                else:
+                    frame = self._parse_v2_response(buf)
+                if frame is None:
+                    return None
+                logger.warning("Received MSP error response for command %s", frame[0])
+                return frame[0], None
+                
+            # Stray '$' - resync on the next one
+            del buf[:1]
+
+    def _parse_v1_response(self, buf: bytearray) -> Optional[Tuple[Optional[int], Optional[bytes]]]:
+        """Parse MSP v1 response"""
+        if len(buf) < 5:
+            return None
+        size, code = buf[3], buf[4]
+        if len(buf) < 6 + size:
+            return None
             
-        try:
-            flag = ord(self.ser.read(1))
-            code, size = struct.unpack('<HH', self.ser.read(4))
-            data = self.ser.read(size)
-            crc = ord(self.ser.read(1))
+        data = bytes(buf[5:5 + size])
+        chk = buf[5 + size]
+        del buf[:6 + size]
+        
+        # Verify checksum
+        if chk != self._calculate_checksum_v1(size, code, data):
+            logger.warning("MSP v1 checksum mismatch")
+            return None, None
+        return code, data
+
+    def _parse_v2_response(self, buf: bytearray) -> Optional[Tuple[Optional[int], Optional[bytes]]]:
+        """Parse MSP v2 response"""
+        if len(buf) < 8:
+            return None
+        code, size = struct.unpack_from('<HH', buf, 4)
+        if len(buf) < 9 + size:
+            return None
             
-            # Verify CRC
-            header_payload = bytes([flag]) + struct.pack('<HH', code, size) + data
-            expected_crc = self._calculate_crc_v2(header_payload)
-            if crc != expected_crc:
-                logger.warning("MSP v2 CRC mismatch")
-                return None, None
-                
-            return code, data
-        except (struct.error, TypeError) as e:
-            logger.error(f"MSP v2 response parsing error: {e}")
+        header_payload = bytes(buf[3:8 + size])
+        crc = buf[8 + size]
+        del buf[:9 + size]
+        
+        # Verify CRC
+        if crc != self._calculate_crc_v2(header_payload):
+            logger.warning("MSP v2 CRC mismatch")
             return None, None
+        return code, header_payload[5:]
 
     def close(self):
         """Close connection"""
+        self.stop_reader()
         if self.ser:
             self.ser.close()
             self.ser = None
+            self._fd = None
+            self._rx_buf.clear()
+            self._static_cache.clear()
             logger.info("Connection closed")
 
     def flush(self):
-        """Flush serial buffers"""
-        if self.ser:
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
+        """Flush serial buffers
+        
+        A running background reader is stopped while the buffers are reset,
+        since it parses _rx_buf on its own thread, and restarted afterwards.
+        """
+        with self._transaction_lock:
+            restart = self._reader is not None and self._reader.is_alive()
+            self.stop_reader()
+            if self.ser:
+                self.ser.reset_input_buffer()
+                self.ser.reset_output_buffer()
+            self._rx_buf.clear()
+            if restart:
+                self.start_reader(self._reader_poll)
 
     def is_connected(self) -> bool:
         """Check if connection is active"""
@@ -0,0 +1,68 @@
+"""
+Geodetic helpers for converting local metric offsets to latitude/longitude
+"""
+import math
+from functools import lru_cache
+from typing import List, Tuple
+
+try:
+    from ._geom_numba import spiral_offsets as _spiral_offsets_jit
+except ImportError:
+    _spiral_offsets_jit = None
+
+# Meters per degree of latitude (spherical Earth approximation)
+METERS_PER_DEGREE = 111320.0
+
+# (cos, sin) of the cardinal headings: North, East, South, West
+ANGLES_LUT = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 90)
+)
+
+@lru_cache(maxsize=64)
+def geodetic_scales(lat_deg: float) -> Tuple[float, float]:
+    """Get degrees of (latitude, longitude) per meter at a given latitude"""
+    lat_scale = 1 / METERS_PER_DEGREE
+    lon_scale = 1 / (METERS_PER_DEGREE * math.cos(math.radians(lat_deg)))
+    return lat_scale, lon_scale
+
+class ENUFrame:
+    """Local east/north tangent plane anchored at a reference point
+
+    The degrees-per-meter scales are worked out once, so converting metric
+    offsets costs a multiply-add per coordinate. Offsets may be floats or
+    NumPy arrays of any shape.
+    """
+
+    def __init__(self, lat0: float, lon0: float):
+        self.lat0 = lat0
+        self.lon0 = lon0
+        self.lat_per_meter, self.lon_per_meter = geodetic_scales(lat0)
+
+    def to_geodetic(self, east, north):
+        """Convert east/north offsets in meters to (latitude, longitude)"""
+        return self.lat0 + north * self.lat_per_meter, self.lon0 + east * self.lon_per_meter
+
+
+def spiral_offsets(max_radius: float, radius_step: float = 20,
+                   angle_step: float = 30) -> List[Tuple[float, float]]:
+    """Get (east, north) offsets in meters of an expanding spiral search pattern
+
+    Each loop is radius_step further out than the last, with a point every
+    angle_step degrees starting due north. With numba installed the points
+    come from a compiled kernel; either way they are returned as a list of
+    tuples.
+    """
+    if _spiral_offsets_jit is not None:
+        points = _spiral_offsets_jit(float(max_radius), float(radius_step), float(angle_step))
+        return list(map(tuple, points.tolist()))
+
+    loops = int(max_radius // radius_step)
+    per_loop = math.ceil(360 / angle_step)
+    offsets = []
+    for i in range(1, loops + 1):
+        radius = i * radius_step
+        for j in range(per_loop):
+            angle = math.radians(j * angle_step)
+            offsets.append((radius * math.sin(angle), radius * math.cos(angle)))
+    return offsets
@@ -1,9 +1,16 @@
 import struct
 import time
 import math
+import json
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 from .msp_constants import MSPCommands, FlightController, NavState
+from .geo import ENUFrame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -74,20 +81,20 @@ class Mission:
     def validate_coordinates(self, lat: float, lon: float, alt: float) -> bool:
         """Validate coordinate values"""
         if not (-90 <= lat <= 90):
-            logger.error(f"Invalid latitude: {lat}")
+            logger.error("Invalid latitude: %s", lat)
             return False
         if not (-180 <= lon <= 180):
-            logger.error(f"Invalid longitude: {lon}")
+            logger.error("Invalid longitude: %s", lon)
             return False
         if not (-1000 <= alt <= 10000):  # Reasonable altitude limits in meters
-            logger.error(f"Invalid altitude: {alt}")
+            logger.error("Invalid altitude: %s", alt)
             return False
         return True
 
     def get_waypoint(self, wp_id: int) -> Optional[Waypoint]:
         """Get waypoint from flight controller"""
         if wp_id < 0 or wp_id >= self.MAX_WAYPOINTS:
-            logger.error(f"Invalid waypoint ID: {wp_id}")
+            logger.error("Invalid waypoint ID: %s", wp_id)
             return None
             
         try:
@@ -96,82 +103,93 @@ class Mission:
             code, response_data = self.conn.read_response()
             
             if code == MSPCommands.MSP_WP and response_data:
-                if len(response_data) >= 21:  # Extended waypoint format
-                    wp_id_resp, action, lat, lon, alt, param1, param2, param3, flag = struct.unpack('<BBiiihhhB', response_data[:21])
-                    
-                    if wp_id_resp == wp_id:
-                        return Waypoint(
-                            lat=lat / 1e7,
-                            lon=lon / 1e7,
-                            alt=alt / 100.0,
-                            action=action,
-                            param1=param1,
-                            param2=param2,
-                            param3=param3,
-                            flag=flag
-                        )
-                elif len(response_data) >= 12:  # Basic waypoint format
-                    lat, lon, alt = struct.unpack('<iii', response_data[0:12])
-                    return Waypoint(
-                        lat=lat / 1e7,
-                        lon=lon / 1e7,
-                        alt=alt / 100.0
-                    )
+                return self._unpack_waypoint(wp_id, response_data)
         except Exception as e:
-            logger.error(f"Failed to get waypoint {wp_id}: {e}")
+            logger.error("Failed to get waypoint %s: %s", wp_id, e)
+            
+        return None
+
+    @staticmethod
+    def _pack_waypoint(wp_id: int, waypoint: Waypoint) -> bytes:
+        """Encode an MSP_SET_WP payload (extended waypoint format)"""
+        return struct.pack('<BBiiihhhB',
+            wp_id,
+            waypoint.action,
+            int(waypoint.lat * 1e7),
+            int(waypoint.lon * 1e7),
+            int(waypoint.alt * 100),
+            waypoint.param1,
+            waypoint.param2,
+            waypoint.param3,
+            waypoint.flag
+        )
+
+    @staticmethod
+    def _unpack_waypoint(wp_id: int, data: bytes) -> Optional[Waypoint]:
+        """Decode an MSP_WP response; None if it is for another waypoint"""
+        if len(data) >= 21:  # Extended waypoint format
+            wp_id_resp, action, lat, lon, alt, param1, param2, param3, flag = struct.unpack('<BBiiihhhB', data[:21])
             
+            if wp_id_resp == wp_id:
+                return Waypoint(
+                    lat=lat / 1e7,
+                    lon=lon / 1e7,
+                    alt=alt / 100.0,
+                    action=action,
+                    param1=param1,
+                    param2=param2,
+                    param3=param3,
+                    flag=flag
+                )
+        elif len(data) >= 12:  # Basic waypoint format
+            lat, lon, alt = struct.unpack('<iii', data[0:12])
+            return Waypoint(
+                lat=lat / 1e7,
+                lon=lon / 1e7,
+                alt=alt / 100.0
+            )
         return None
 
+    @staticmethod
+    def _waypoint_matches(expected: Waypoint, actual: Optional[Waypoint]) -> bool:
+        """Check a read-back waypoint against the one that was written"""
+        return (actual is not None and
+                abs(actual.lat - expected.lat) <= 1e-6 and
+                abs(actual.lon - expected.lon) <= 1e-6 and
+                abs(actual.alt - expected.alt) <= 0.1)
+
     def set_waypoint(self, wp_id: int, waypoint: Waypoint, validate: bool = True) -> bool:
         """Set waypoint on flight controller"""
         if wp_id < 0 or wp_id >= self.MAX_WAYPOINTS:
-            logger.error(f"Invalid waypoint ID: {wp_id}")
+            logger.error("Invalid waypoint ID: %s", wp_id)
             return False
             
         if validate and not self.validate_coordinates(waypoint.lat, waypoint.lon, waypoint.alt):
             return False
         
         try:
-            # Extended waypoint format
-            data = struct.pack('<BBiiihhhB',
-                wp_id,
-                waypoint.action,
-                int(waypoint.lat * 1e7),
-                int(waypoint.lon * 1e7),
-                int(waypoint.alt * 100),
-                waypoint.param1,
-                waypoint.param2,
-                waypoint.param3,
-                waypoint.flag
-            )
-            
-            self.conn.send_msp(MSPCommands.MSP_SET_WP, data)
+            self.conn.send_msp(MSPCommands.MSP_SET_WP, self._pack_waypoint(wp_id, waypoint))
             time.sleep(0.1)  # Allow FC to process
             
             # Verify waypoint was set correctly
             if validate:
                 verification = self.get_waypoint(wp_id)
-                if verification:
-                    lat_diff = abs(verification.lat - waypoint.lat)
-                    lon_diff = abs(verification.lon - waypoint.lon)
-                    alt_diff = abs(verification.alt - waypoint.alt)
-                    
-                    if lat_diff > 1e-6 or lon_diff > 1e-6 or alt_diff > 0.1:
-                        logger.warning(f"Waypoint {wp_id} verification failed")
-                        return False
+                if verification and not self._waypoint_matches(waypoint, verification):
+                    logger.warning("Waypoint %s verification failed", wp_id)
+                    return False
             
-            logger.debug(f"Set waypoint {wp_id}: {waypoint.lat:.6f}, {waypoint.lon:.6f}, {waypoint.alt:.1f}m")
+            logger.debug("Set waypoint %s: %.6f, %.6f, %.1fm", wp_id, waypoint.lat, waypoint.lon, waypoint.alt)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set waypoint {wp_id}: {e}")
+            logger.error("Failed to set waypoint %s: %s", wp_id, e)
             return False
 
     def add_waypoint(self, lat: float, lon: float, alt: float, action: int = 1, 
                     param1: int = 0, param2: int = 0, param3: int = 0, flag: int = 0) -> bool:
         """Add waypoint to mission"""
         if len(self.waypoints) >= self.MAX_WAYPOINTS:
-            logger.error(f"Maximum waypoints ({self.MAX_WAYPOINTS}) reached")
+            logger.error("Maximum waypoints (%s) reached", self.MAX_WAYPOINTS)
             return False
             
         if not self.validate_coordinates(lat, lon, alt):
@@ -179,7 +197,28 @@ class Mission:
             
         waypoint = Waypoint(lat, lon, alt, action, param1, param2, param3, flag)
         self.waypoints.append(waypoint)
-        logger.info(f"Added waypoint {len(self.waypoints)}: {lat:.6f}, {lon:.6f}, {alt:.1f}m")
+        logger.info("Added waypoint %s: %.6f, %.6f, %.1fm", len(self.waypoints), lat, lon, alt)
+        return True
+
+    def add_waypoints(self, coords: List[Tuple[float, float]], alt: float, action: int = 1,
+                      param1: int = 0, param2: int = 0, param3: int = 0, flag: int = 0) -> bool:
+        """Add several waypoints sharing altitude and action
+        
+        coords is a sequence of (lat, lon) pairs. Nothing is added unless every
+        waypoint is valid and fits in the mission.
+        """
+        coords = list(coords)
+        if len(self.waypoints) + len(coords) > self.MAX_WAYPOINTS:
+            logger.error("Maximum waypoints (%s) reached", self.MAX_WAYPOINTS)
+            return False
+            
+        for lat, lon in coords:
+            if not self.validate_coordinates(lat, lon, alt):
+                return False
+                
+        self.waypoints.extend(Waypoint(lat, lon, alt, action, param1, param2, param3, flag)
+                              for lat, lon in coords)
+        logger.info("Added %s waypoints at %.1fm", len(coords), alt)
         return True
 
     def insert_waypoint(self, index: int, lat: float, lon: float, alt: float, 
@@ -187,11 +226,11 @@ class Mission:
                        param3: int = 0, flag: int = 0) -> bool:
         """Insert waypoint at specific index"""
         if index < 0 or index > len(self.waypoints):
-            logger.error(f"Invalid waypoint index: {index}")
+            logger.error("Invalid waypoint index: %s", index)
             return False
             
         if len(self.waypoints) >= self.MAX_WAYPOINTS:
-            logger.error(f"Maximum waypoints ({self.MAX_WAYPOINTS}) reached")
+            logger.error("Maximum waypoints (%s) reached", self.MAX_WAYPOINTS)
             return False
             
         if not self.validate_coordinates(lat, lon, alt):
@@ -199,17 +238,17 @@ class Mission:
             
         waypoint = Waypoint(lat, lon, alt, action, param1, param2, param3, flag)
         self.waypoints.insert(index, waypoint)
-        logger.info(f"Inserted waypoint at {index}: {lat:.6f}, {lon:.6f}, {alt:.1f}m")
+        logger.info("Inserted waypoint at %s: %.6f, %.6f, %.1fm", index, lat, lon, alt)
         return True
 
     def remove_waypoint(self, index: int) -> bool:
         """Remove waypoint at index"""
         if index < 0 or index >= len(self.waypoints):
-            logger.error(f"Invalid waypoint index: {index}")
+            logger.error("Invalid waypoint index: %s", index)
             return False
             
         removed = self.waypoints.pop(index)
-        logger.info(f"Removed waypoint {index}: {removed.lat:.6f}, {removed.lon:.6f}")
+        logger.info("Removed waypoint %s: %.6f, %.6f", index, removed.lat, removed.lon)
         return True
 
     def clear_mission(self) -> bool:
@@ -219,47 +258,61 @@ class Mission:
         logger.info("Mission cleared")
         return True
 
-    def upload_mission(self, validate: bool = True) -> bool:
-        """Upload complete mission to flight controller"""
+    def upload_mission(self, validate: bool = True, window: int = 8) -> bool:
+        """Upload complete mission to flight controller
+        
+        MSP_SET_WP frames are streamed with up to window of them awaiting an
+        ack, so the upload costs about len(waypoints) / window round-trips
+        instead of one per waypoint. With validate, the mission is read back
+        the same way and compared.
+        """
         if not self.waypoints:
             logger.error("No waypoints to upload")
             return False
             
-        success_count = 0
         total_waypoints = len(self.waypoints)
         
-        logger.info(f"Uploading mission with {total_waypoints} waypoints...")
+        if validate:
+            for i, waypoint in enumerate(self.waypoints):
+                if not self.validate_coordinates(waypoint.lat, waypoint.lon, waypoint.alt):
+                    logger.error("Failed to upload waypoint %s", i)
+                    return False
+        
+        logger.info("Uploading mission with %s waypoints...", total_waypoints)
         
         try:
-            # Upload waypoints
-            for i, waypoint in enumerate(self.waypoints):
-                if self.set_waypoint(i, waypoint, validate):
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to upload waypoint {i}")
-                    if validate:
-                        return False
-                
-                # Progress feedback
-                if (i + 1) % 10 == 0 or i == total_waypoints - 1:
-                    logger.info(f"Uploaded {i + 1}/{total_waypoints} waypoints")
+            # Upload waypoints, then clear a few stale slots on the FC
+            empty_wp = Waypoint(0, 0, 0, 0)  # Empty waypoint
+            slots = list(enumerate(self.waypoints))
+            slots += [(i, empty_wp) for i in range(total_waypoints, min(total_waypoints + 5, self.MAX_WAYPOINTS))]
+            acks = self.conn.request_window(
+                ((MSPCommands.MSP_SET_WP, self._pack_waypoint(i, wp)) for i, wp in slots),
+                window)
             
-            # Clear any remaining waypoints on FC
-            if success_count < self.MAX_WAYPOINTS:
-                empty_wp = Waypoint(0, 0, 0, 0)  # Empty waypoint
-                for i in range(success_count, min(success_count + 5, self.MAX_WAYPOINTS)):
-                    self.set_waypoint(i, empty_wp, validate=False)
+            failed = [i for i, ack in enumerate(acks[:total_waypoints]) if ack is None]
+            for i in failed:
+                logger.error("Failed to upload waypoint %s", i)
             
-            if success_count == total_waypoints:
+            if validate and not failed:
+                readback = self.conn.request_window(
+                    ((MSPCommands.MSP_WP, struct.pack('<B', i)) for i in range(total_waypoints)),
+                    window)
+                for i, (waypoint, data) in enumerate(zip(self.waypoints, readback)):
+                    if not self._waypoint_matches(waypoint, self._unpack_waypoint(i, data) if data else None):
+                        logger.warning("Waypoint %s verification failed", i)
+                        failed.append(i)
+            
+            success_count = total_waypoints - len(failed)
+            if not failed:
                 self._mission_loaded = True
-                logger.info(f"Mission upload successful: {success_count} waypoints")
+                logger.info("Mission upload successful: %s waypoints", success_count)
                 return True
             else:
-                logger.error(f"Mission upload partial: {success_count}/{total_waypoints} waypoints")
+                logger.error("Mission upload partial: %s/%s waypoints", success_count, total_waypoints)
                 return False
                 
         except Exception as e:
-            logger.error(f"Mission upload failed: {e}")
+            logger.error("Mission upload failed: %s", e)
             return False
 
     def download_mission(self) -> bool:
@@ -277,11 +330,11 @@ class Mission:
                     break  # No more waypoints
             
             self._mission_loaded = True
-            logger.info(f"Downloaded mission with {len(self.waypoints)} waypoints")
+            logger.info("Downloaded mission with %s waypoints", len(self.waypoints))
             return True
             
         except Exception as e:
-            logger.error(f"Mission download failed: {e}")
+            logger.error("Mission download failed: %s", e)
             return False
 
     def get_mission_info(self) -> Dict[str, Any]:
@@ -348,7 +401,7 @@ class Mission:
             self.add_waypoint(last_lat, last_lon, last_alt, 
                             action=self.WAYPOINT_ACTION_RTH)
         
-        logger.info(f"Created simple mission with {len(self.waypoints)} waypoints")
+        logger.info("Created simple mission with %s waypoints", len(self.waypoints))
         return True
 
     def create_survey_mission(self, center_lat: float, center_lon: float, 
@@ -357,9 +410,8 @@ class Mission:
         """Create a survey/mapping mission with parallel lines"""
         self.clear_mission()
         
-        # Convert meters to degrees (approximate)
-        lat_per_meter = 1 / 111320.0
-        lon_per_meter = 1 / (111320.0 * math.cos(math.radians(center_lat)))
+        # Lines are laid out in meters around the center
+        frame = ENUFrame(center_lat, center_lon)
         
         half_width = width_m / 2
         half_height = height_m / 2
@@ -368,10 +420,10 @@ class Mission:
         num_lines = int(width_m / line_spacing_m) + 1
         
         # Generate waypoints
+        coords = []
         for line in range(num_lines):
             # Calculate X offset for this line
             x_offset = -half_width + (line * line_spacing_m)
-            lon_offset = x_offset * lon_per_meter
             
             if line % 2 == 0:  # Even lines: bottom to top
                 y_positions = [-half_height, half_height]
@@ -379,26 +431,24 @@ class Mission:
                 y_positions = [half_height, -half_height]
             
             for y_pos in y_positions:
-                lat_offset = y_pos * lat_per_meter
-                wp_lat = center_lat + lat_offset
-                wp_lon = center_lon + lon_offset
-                
-                self.add_waypoint(wp_lat, wp_lon, altitude_m,
-                                action=self.WAYPOINT_ACTION_WAYPOINT,
-                                param1=speed)
+                coords.append(frame.to_geodetic(x_offset, y_pos))
+        
+        if not self.add_waypoints(coords, altitude_m,
+                                  action=self.WAYPOINT_ACTION_WAYPOINT,
+                                  param1=speed):
+            return False
         
         # Add RTH at center
         self.add_waypoint(center_lat, center_lon, altitude_m,
                         action=self.WAYPOINT_ACTION_RTH)
         
-        logger.info(f"Created survey mission: {width_m}x{height_m}m, {num_lines} lines, {len(self.waypoints)} waypoints")
+        logger.info("Created survey mission: %sx%sm, %s lines, %s waypoints",
+                    width_m, height_m, num_lines, len(self.waypoints))
         return True
 
     def save_mission_to_file(self, filename: str) -> bool:
         """Save mission to file"""
         try:
-            import json
-            
             mission_data = {
                 'version': '1.0',
                 'fc_type': self.fc_type.name,
@@ -407,23 +457,29 @@ class Mission:
                 'info': self.get_mission_info()
             }
             
-            with open(filename, 'w') as f:
-                json.dump(mission_data, f, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(mission_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(mission_data, f, indent=2)
             
-            logger.info(f"Mission saved to {filename}")
+            logger.info("Mission saved to %s", filename)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to save mission: {e}")
+            logger.error("Failed to save mission: %s", e)
             return False
 
     def load_mission_from_file(self, filename: str) -> bool:
         """Load mission from file"""
         try:
-            import json
-            
-            with open(filename, 'r') as f:
-                mission_data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    mission_data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    mission_data = json.load(f)
             
             self.clear_mission()
             
@@ -431,11 +487,11 @@ class Mission:
                 waypoint = Waypoint.from_dict(wp_data)
                 self.waypoints.append(waypoint)
             
-            logger.info(f"Mission loaded from {filename}: {len(self.waypoints)} waypoints")
+            logger.info("Mission loaded from %s: %s waypoints", filename, len(self.waypoints))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to load mission: {e}")
+            logger.error("Failed to load mission: %s", e)
             return False
 
     def get_waypoints(self) -> List[Dict[str, Any]]:
@@ -5,7 +5,7 @@ This module contains MSP command codes for both iNav and Betaflight,
 including MSP v1 and MSP v2 commands.
 """
 
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 
 class FlightController(IntEnum):
     """Supported flight controller types"""
@@ -31,6 +31,10 @@ class MSPCommands(IntEnum):
     MSP_SET_FEATURE = 37
     MSP_BEEPER_CONFIG = 162
     MSP_SET_BEEPER_CONFIG = 163
+    MSP_FAILSAFE_CONFIG = 75
+    MSP_SET_FAILSAFE_CONFIG = 76
+    MSP_MOTOR_CONFIG = 131
+    MSP_SET_MOTOR_CONFIG = 222
     
     # Telemetry
     MSP_RAW_IMU = 102
@@ -94,6 +98,9 @@ class MSPCommands(IntEnum):
     MSP_SET_OSD_CONFIG = 85
     MSP_OSD_CHAR_READ = 86
     MSP_OSD_CHAR_WRITE = 87
+    
+    # Request batching (Betaflight specific)
+    MSP_MULTIPLE_MSP = 230
 
 class MSPv2Commands(IntEnum):
     """MSP v2 specific commands"""
@@ -170,6 +177,24 @@ class SensorStatus(IntEnum):
     PITOT = 1 << 6
     TEMPERATURE = 1 << 7
 
+class TelemetrySection(IntFlag):
+    """Telemetry sections selectable in get_flight_data()"""
+    
+    ATTITUDE = 1 << 0
+    GPS = 1 << 1
+    ANALOG = 1 << 2
+    STATUS = 1 << 3
+    ALTITUDE = 1 << 4
+    BATTERY = 1 << 5
+    RC = 1 << 6
+    MOTORS = 1 << 7
+    NAVIGATION = 1 << 8
+    IMU = 1 << 9
+    
+    # Everything get_all_telemetry() returns
+    ALL = (ATTITUDE | GPS | ANALOG | STATUS | ALTITUDE |
+           BATTERY | RC | MOTORS | NAVIGATION)
+
 class GPSFixType(IntEnum):
     """GPS fix types"""
     
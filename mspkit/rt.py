@@ -0,0 +1,141 @@
+"""
+Timing helpers for fixed-rate control and monitoring loops
+"""
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import logging
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# mlockall() flags (Linux)
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+def sleep_until(deadline_ns: int) -> None:
+    """Sleep until an absolute time.monotonic_ns() deadline"""
+    remaining = deadline_ns - time.monotonic_ns()
+    if remaining > 0:
+        time.sleep(remaining / 1e9)
+
+
+def precise_sleep(seconds: float, spin_ns: int = 2_000_000) -> None:
+    """Sleep for seconds, busy-waiting through the last spin_ns nanoseconds
+
+    The OS can wake a sleeping thread several milliseconds late; spinning
+    through the end of the wait lands the wake-up within microseconds of the
+    deadline, at the cost of up to spin_ns of CPU time.
+    """
+    deadline = time.monotonic_ns() + int(seconds * 1e9)
+    sleep_until(deadline - spin_ns)
+    while time.monotonic_ns() < deadline:
+        pass
+
+
+def ticks(period: float, duration: Optional[float] = None) -> Iterator[float]:
+    """Yield every period seconds, returning the time elapsed since the first tick
+
+    Deadlines are absolute, counted from the first tick, so sleep latency does
+    not accumulate from one iteration to the next. If the loop body overruns,
+    the missed slots are dropped rather than run back-to-back.
+    """
+    period_ns = int(period * 1e9)
+    start = time.monotonic_ns()
+    end = start + int(duration * 1e9) if duration is not None else None
+    next_tick = start
+
+    while True:
+        yield (time.monotonic_ns() - start) / 1e9
+
+        next_tick += period_ns
+        now = time.monotonic_ns()
+        if now > next_tick:
+            next_tick += ((now - next_tick) // period_ns + 1) * period_ns
+        if end is not None and next_tick >= end:
+            return
+        sleep_until(next_tick)
+
+
+@contextmanager
+def realtime_priority(priority: int = 80, cpu: Optional[int] = None) -> Iterator[None]:
+    """Run the enclosed block under SCHED_FIFO, optionally pinned to one CPU
+
+    cpu defaults to the MSPKIT_RT_CPU environment variable, which should name
+    a core isolated with the isolcpus= boot parameter. Without permission for
+    SCHED_FIFO the niceness is raised instead; without that too the block
+    runs at normal priority. The previous settings are restored on exit.
+
+    Unprivileged users need real-time limits in /etc/security/limits.conf:
+
+        @realtime   -   rtprio    99
+        @realtime   -   memlock   unlimited
+    """
+    if cpu is None and os.environ.get('MSPKIT_RT_CPU'):
+        cpu = int(os.environ['MSPKIT_RT_CPU'])
+
+    saved_affinity = None
+    if cpu is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            saved_affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})
+        except OSError as e:
+            logger.warning("Could not pin to CPU %s: %s", cpu, e)
+            saved_affinity = None
+
+    saved_policy = None
+    nice_delta = 0
+    if hasattr(os, 'sched_setscheduler'):
+        try:
+            saved_policy = (os.sched_getscheduler(0), os.sched_getparam(0))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except OSError:
+            saved_policy = None
+            try:
+                nice_delta = os.nice(0) - os.nice(-20)
+            except OSError as e:
+                logger.warning("Could not raise scheduling priority: %s", e)
+
+    try:
+        yield
+    finally:
+        if saved_policy is not None:
+            os.sched_setscheduler(0, saved_policy[0], saved_policy[1])
+        if nice_delta:
+            os.nice(nice_delta)
+        if saved_affinity is not None:
+            os.sched_setaffinity(0, saved_affinity)
+
+
+def lock_memory() -> bool:
+    """Lock the process's current and future pages in RAM
+
+    Once locked, pages are populated when they are mapped, so allocations in a
+    timing-critical loop never stall on a page fault. Returns False if the
+    memory could not be locked (non-Linux system or RLIMIT_MEMLOCK too low).
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+
+    try:
+        import resource
+        resource.setrlimit(resource.RLIMIT_MEMLOCK,
+                           (resource.RLIM_INFINITY, resource.RLIM_INFINITY))
+    except (ImportError, ValueError, OSError):
+        pass  # Keep the configured limit
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            logger.warning("Could not lock memory: %s", os.strerror(ctypes.get_errno()))
+            return False
+    except (OSError, AttributeError) as e:
+        logger.warning("Could not lock memory: %s", e)
+        return False
+
+    logger.info("Process memory locked")
+    return True
@@ -1,3 +1,4 @@
+import math
 import struct
 import time
 import logging
@@ -6,6 +7,11 @@ from .msp_constants import MSPCommands, FlightController
 
 logger = logging.getLogger(__name__)
 
+def _magnitude(vector: Dict[str, int]) -> float:
+    """Length of an {x, y, z} sensor vector"""
+    x, y, z = vector['x'], vector['y'], vector['z']
+    return math.sqrt(x * x + y * y + z * z)
+
 class Sensors:
     """Enhanced sensor management and calibration"""
     
@@ -33,7 +39,7 @@ class Sensors:
             return True
             
         except Exception as e:
-            logger.error(f"Accelerometer calibration failed: {e}")
+            logger.error("Accelerometer calibration failed: %s", e)
             self._calibration_in_progress = False
             return False
 
@@ -57,7 +63,7 @@ class Sensors:
             return True
             
         except Exception as e:
-            logger.error(f"Magnetometer calibration failed: {e}")
+            logger.error("Magnetometer calibration failed: %s", e)
             self._calibration_in_progress = False
             return False
 
@@ -80,15 +86,13 @@ class Sensors:
             return True
             
         except Exception as e:
-            logger.error(f"Gyroscope calibration failed: {e}")
+            logger.error("Gyroscope calibration failed: %s", e)
             self._calibration_in_progress = False
             return False
 
     def get_sensor_status(self) -> Optional[Dict[str, Any]]:
         """Get detailed sensor status and health"""
-        from .telemetry import Telemetry
-        
-        telem = Telemetry(self.conn)
+        telem = self.conn.telemetry
         status = telem.get_status()
         
         if not status:
@@ -104,17 +108,17 @@ class Sensors:
         if imu_data:
             # Check accelerometer health
             acc = imu_data['accelerometer']
-            acc_magnitude = (acc['x']**2 + acc['y']**2 + acc['z']**2)**0.5
+            acc_magnitude = _magnitude(acc)
             health_status['accelerometer_healthy'] = 800 < acc_magnitude < 1200  # ~1g expected
             
             # Check gyroscope health (should be near zero when stationary)
             gyro = imu_data['gyroscope']
-            gyro_magnitude = (gyro['x']**2 + gyro['y']**2 + gyro['z']**2)**0.5
+            gyro_magnitude = _magnitude(gyro)
             health_status['gyroscope_healthy'] = gyro_magnitude < 100  # Low noise when stationary
             
             # Check magnetometer health
             mag = imu_data['magnetometer']
-            mag_magnitude = (mag['x']**2 + mag['y']**2 + mag['z']**2)**0.5
+            mag_magnitude = _magnitude(mag)
             health_status['magnetometer_healthy'] = 100 < mag_magnitude < 2000  # Reasonable range
         
         # GPS health
@@ -147,8 +151,7 @@ class Sensors:
             'tests': {}
         }
         
-        from .telemetry import Telemetry
-        telem = Telemetry(self.conn)
+        telem = self.conn.telemetry
         
         # Test 1: Basic connectivity
         status = telem.get_status()
@@ -169,7 +172,7 @@ class Sensors:
             mag = imu_data['magnetometer']
             
             # Accelerometer test
-            acc_mag = (acc['x']**2 + acc['y']**2 + acc['z']**2)**0.5
+            acc_mag = _magnitude(acc)
             acc_test = 'PASS' if 800 < acc_mag < 1200 else 'WARN'
             test_results['tests']['accelerometer'] = {
                 'status': acc_test,
@@ -179,7 +182,7 @@ class Sensors:
             }
             
             # Gyroscope test
-            gyro_mag = (gyro['x']**2 + gyro['y']**2 + gyro['z']**2)**0.5
+            gyro_mag = _magnitude(gyro)
             gyro_test = 'PASS' if gyro_mag < 200 else 'WARN'
             test_results['tests']['gyroscope'] = {
                 'status': gyro_test,
@@ -189,7 +192,7 @@ class Sensors:
             }
             
             # Magnetometer test
-            mag_mag = (mag['x']**2 + mag['y']**2 + mag['z']**2)**0.5
+            mag_mag = _magnitude(mag)
             mag_test = 'PASS' if 100 < mag_mag < 2000 else 'WARN'
             test_results['tests']['magnetometer'] = {
                 'status': mag_test,
@@ -267,7 +270,8 @@ class Sensors:
         elif warn_count > 0:
             test_results['overall_status'] = 'WARN'
         
-        logger.info(f"Sensor test completed: {test_results['overall_status']} ({fail_count} failures, {warn_count} warnings)")
+        logger.info("Sensor test completed: %s (%s failures, %s warnings)",
+                    test_results['overall_status'], fail_count, warn_count)
         return test_results
 
     def calibrate_all_sensors(self, include_mag: bool = True) -> bool:
@@ -311,7 +315,7 @@ class Sensors:
             logger.info("Full sensor calibration completed successfully")
             return True
         else:
-            logger.error(f"Sensor calibration partially failed: {success_count}/{total_steps} successful")
+            logger.error("Sensor calibration partially failed: %s/%s successful", success_count, total_steps)
             return False
 
     def get_calibration_status(self) -> Dict[str, Any]:
@@ -345,10 +349,9 @@ class Sensors:
 
     def wait_for_gps_fix(self, min_satellites: int = 6, timeout_seconds: int = 60) -> bool:
         """Wait for GPS to achieve good fix"""
-        logger.info(f"Waiting for GPS fix with {min_satellites}+ satellites...")
+        logger.info("Waiting for GPS fix with %s+ satellites...", min_satellites)
         
-        from .telemetry import Telemetry
-        telem = Telemetry(self.conn)
+        telem = self.conn.telemetry
         
         start_time = time.time()
         
@@ -359,22 +362,21 @@ class Sensors:
                 fix_type = gps_data['fix_type']
                 
                 if sats >= min_satellites and fix_type in ['FIX_3D']:
-                    logger.info(f"GPS fix achieved: {sats} satellites, {fix_type}")
+                    logger.info("GPS fix achieved: %s satellites, %s", sats, fix_type)
                     return True
                 
-                logger.info(f"GPS status: {sats} satellites, {fix_type}")
+                logger.info("GPS status: %s satellites, %s", sats, fix_type)
             
             time.sleep(2)
         
-        logger.warning(f"GPS fix timeout after {timeout_seconds} seconds")
+        logger.warning("GPS fix timeout after %s seconds", timeout_seconds)
         return False
 
     def sensor_warmup(self, duration_seconds: int = 30) -> bool:
         """Allow sensors to warm up and stabilize"""
-        logger.info(f"Sensor warmup period: {duration_seconds} seconds")
+        logger.info("Sensor warmup period: %s seconds", duration_seconds)
         
-        from .telemetry import Telemetry
-        telem = Telemetry(self.conn)
+        telem = self.conn.telemetry
         
         start_time = time.time()
         last_report = 0
@@ -385,13 +387,13 @@ class Sensors:
             # Report progress every 10 seconds
             if elapsed - last_report >= 10:
                 remaining = duration_seconds - elapsed
-                logger.info(f"Warmup in progress... {remaining:.0f} seconds remaining")
+                logger.info("Warmup in progress... %.0f seconds remaining", remaining)
                 last_report = elapsed
                 
                 # Check sensor status
                 status = telem.get_status()
                 if status:
-                    logger.debug(f"Sensors detected: {status.get('sensors_detected', {})}")
+                    logger.debug("Sensors detected: %s", status.get('sensors_detected', {}))
             
             time.sleep(1)
         
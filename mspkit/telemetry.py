@@ -1,219 +1,406 @@
 import struct
+import time
 import logging
-from typing import Dict, Any, Optional, List
-from .msp_constants import MSPCommands, MSPv2Commands, FlightController, SensorStatus, GPSFixType, NavState
+from typing import Dict, Any, Optional, List, Iterable, Callable, Tuple
+from .msp_constants import (
+    MSPCommands, MSPv2Commands, FlightController, SensorStatus, GPSFixType, NavState,
+    TelemetrySection
+)
 
 logger = logging.getLogger(__name__)
 
+# Precompiled layouts of the fixed-size telemetry payloads
+_U16 = struct.Struct('<H')
+_ATTITUDE = struct.Struct('<hhh')
+_RAW_IMU = struct.Struct('<9h')
+_GPS = struct.Struct('<BBiii')
+_GPS_MOTION = struct.Struct('<HH')
+_ALTITUDE = struct.Struct('<ih')
+_ANALOG = struct.Struct('<BHHh')
+_BATTERY_STATE = struct.Struct('<BHBHh')
+_STATUS = struct.Struct('<HHHIB')
+_NAV_STATUS = struct.Struct('<5Bh')
+
+class TelemetryView:
+    """Fixed-layout telemetry record, updated in place by Telemetry.read_*()
+    
+    Field names match the keys of the corresponding get_*() dicts.
+    """
+    __slots__ = ()
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Copy the current values into a dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class AttitudeView(TelemetryView):
+    """Attitude in degrees"""
+    __slots__ = ('roll', 'pitch', 'yaw')
+    
+    def __init__(self):
+        self.roll = 0.0
+        self.pitch = 0.0
+        self.yaw = 0
+
+class StatusView(TelemetryView):
+    """Flight controller status flags"""
+    __slots__ = ('cycle_time', 'i2c_errors', 'sensor_status',
+                 'flight_mode_flags', 'current_profile', 'armed')
+    
+    def __init__(self):
+        self.cycle_time = 0
+        self.i2c_errors = 0
+        self.sensor_status = 0
+        self.flight_mode_flags = 0
+        self.current_profile = 0
+        self.armed = False
+
+class AnalogView(TelemetryView):
+    """Battery voltage, consumption and RSSI"""
+    __slots__ = ('voltage', 'mah_drawn', 'rssi', 'amperage')
+    
+    def __init__(self):
+        self.voltage = 0.0
+        self.mah_drawn = 0
+        self.rssi = 0
+        self.amperage = 0.0
+
+class GPSView(TelemetryView):
+    """GPS position and motion; fix_type is a GPSFixType value"""
+    __slots__ = ('fix_type', 'num_satellites', 'latitude', 'longitude',
+                 'altitude', 'speed', 'ground_course')
+    
+    def __init__(self):
+        self.fix_type = 0
+        self.num_satellites = 0
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.altitude = 0.0
+        self.speed = 0.0
+        self.ground_course = 0.0
+
+class NavStatusView(TelemetryView):
+    """Navigation state (iNav); nav_state is a NavState value"""
+    __slots__ = ('nav_mode', 'nav_state', 'action', 'waypoint_number',
+                 'nav_error', 'heading_hold_target')
+    
+    def __init__(self):
+        self.nav_mode = 0
+        self.nav_state = 0
+        self.action = 0
+        self.waypoint_number = 0
+        self.nav_error = 0
+        self.heading_hold_target = 0
+
 class Telemetry:
     """Enhanced telemetry class supporting both iNav and Betaflight"""
     
-    def __init__(self, conn):
+    # Sections available through get_bundle(): MSP code -> (result key, decoder)
+    BUNDLE_SECTIONS = {
+        MSPCommands.MSP_ATTITUDE: ("attitude", "_decode_attitude"),
+        MSPCommands.MSP_RAW_IMU: ("imu", "_decode_raw_imu"),
+        MSPCommands.MSP_RAW_GPS: ("gps", "_decode_gps"),
+        MSPCommands.MSP_ALTITUDE: ("altitude", "_decode_altitude"),
+        MSPCommands.MSP_ANALOG: ("analog", "_decode_analog"),
+        MSPCommands.MSP_BATTERY_STATE: ("battery", "_decode_battery_state"),
+        MSPCommands.MSP_STATUS: ("status", "_decode_status"),
+        MSPCommands.MSP_RC: ("rc", "_decode_rc_channels"),
+        MSPCommands.MSP_MOTOR: ("motors", "_decode_motor_values"),
+        MSPCommands.MSP_NAV_STATUS: ("navigation", "_decode_nav_status"),
+    }
+
+    DEFAULT_BUNDLE = (
+        MSPCommands.MSP_ATTITUDE,
+        MSPCommands.MSP_RAW_GPS,
+        MSPCommands.MSP_ANALOG,
+        MSPCommands.MSP_RC,
+        MSPCommands.MSP_STATUS,
+    )
+
+    # MSP code behind each TelemetrySection flag, in result order
+    SECTION_CODES = {
+        TelemetrySection.ATTITUDE: MSPCommands.MSP_ATTITUDE,
+        TelemetrySection.GPS: MSPCommands.MSP_RAW_GPS,
+        TelemetrySection.ANALOG: MSPCommands.MSP_ANALOG,
+        TelemetrySection.STATUS: MSPCommands.MSP_STATUS,
+        TelemetrySection.ALTITUDE: MSPCommands.MSP_ALTITUDE,
+        TelemetrySection.BATTERY: MSPCommands.MSP_BATTERY_STATE,
+        TelemetrySection.RC: MSPCommands.MSP_RC,
+        TelemetrySection.MOTORS: MSPCommands.MSP_MOTOR,
+        TelemetrySection.NAVIGATION: MSPCommands.MSP_NAV_STATUS,
+        TelemetrySection.IMU: MSPCommands.MSP_RAW_IMU,
+    }
+    
+    def __init__(self, conn, cache_ttl: float = 0.05):
         self.conn = conn
         self.fc_type = conn.fc_type
+        self.cache_ttl = cache_ttl
+        # Raw response payloads keyed by MSP code: (read time, payload)
+        self._cache: Dict[int, Tuple[float, bytes]] = {}
+        # Records reused by the read_*() methods
+        self._attitude = AttitudeView()
+        self._status = StatusView()
+        self._analog = AnalogView()
+        self._gps = GPSView()
+        self._nav_status = NavStatusView()
+
+    def _request(self, code: int) -> Optional[bytes]:
+        """Request a payload-less MSP command and return the response payload
+        
+        Responses younger than cache_ttl are reused, so back-to-back calls for
+        the same data within one update tick cost a single round-trip.
+        """
+        cached = self._cache.get(code)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+            
+        data = self.conn.request(code)
+        if data:
+            self._cache[code] = (time.monotonic(), data)
+        return data
+
+    def _fetch(self, code: int, decoder: Callable[[bytes], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Request an MSP command and decode its response"""
+        data = self._request(code)
+        if data:
+            return decoder(data)
+        return None
+
+    def get_bundle(self, codes: Iterable[int] = DEFAULT_BUNDLE) -> Dict[str, Any]:
+        """Get several telemetry sections with one pipelined request burst
+        
+        All requests are written back-to-back before the responses are read,
+        so a bundle costs about one serial round-trip. Results are keyed like
+        get_all_telemetry() ("attitude", "gps", "analog", "rc", "status", ...);
+        sections that did not answer are left out.
+        """
+        codes = list(codes)
+        for code in codes:
+            if code not in self.BUNDLE_SECTIONS:
+                raise ValueError(f"Unsupported bundle command: {code}")
+                
+        if self.fc_type != FlightController.INAV:
+            codes = [code for code in codes if code != MSPCommands.MSP_NAV_STATUS]
+            
+        responses = self.conn.request_many(codes)
+        now = time.monotonic()
+        
+        bundle = {}
+        for code in codes:
+            data = responses.get(code)
+            if not data:
+                continue
+            self._cache[code] = (now, data)
+            key, decoder = self.BUNDLE_SECTIONS[code]
+            value = getattr(self, decoder)(data)
+            if value is not None:
+                bundle[key] = value
+        return bundle
         
     def get_api_version(self) -> Optional[Dict[str, Any]]:
         """Get flight controller API version"""
-        self.conn.send_msp(MSPCommands.MSP_API_VERSION)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_API_VERSION and data:
-            if len(data) >= 3:
-                version = f"{data[1]}.{data[2]}.{data[0]}"
-                return {"api_version": version, "protocol_version": data[0]}
+        return self._fetch(MSPCommands.MSP_API_VERSION, self._decode_api_version)
+
+    def _decode_api_version(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_API_VERSION response payload"""
+        if len(data) >= 3:
+            version = f"{data[1]}.{data[2]}.{data[0]}"
+            return {"api_version": version, "protocol_version": data[0]}
         return None
     
     def get_fc_variant(self) -> Optional[Dict[str, Any]]:
         """Get flight controller variant (INAV, BTFL, etc.)"""
-        self.conn.send_msp(MSPCommands.MSP_FC_VARIANT)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_FC_VARIANT and data:
-            variant = data.decode('ascii').rstrip('\x00')
-            return {"fc_variant": variant}
-        return None
+        return self._fetch(MSPCommands.MSP_FC_VARIANT, self._decode_fc_variant)
+
+    def _decode_fc_variant(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_FC_VARIANT response payload"""
+        variant = data.decode('ascii').rstrip('\x00')
+        return {"fc_variant": variant}
     
     def get_fc_version(self) -> Optional[Dict[str, Any]]:
         """Get flight controller version"""
-        self.conn.send_msp(MSPCommands.MSP_FC_VERSION)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_FC_VERSION and data:
-            if len(data) >= 3:
-                version = f"{data[0]}.{data[1]}.{data[2]}"
-                return {"fc_version": version}
+        return self._fetch(MSPCommands.MSP_FC_VERSION, self._decode_fc_version)
+
+    def _decode_fc_version(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_FC_VERSION response payload"""
+        if len(data) >= 3:
+            version = f"{data[0]}.{data[1]}.{data[2]}"
+            return {"fc_version": version}
         return None
     
     def get_board_info(self) -> Optional[Dict[str, Any]]:
         """Get board information"""
-        self.conn.send_msp(MSPCommands.MSP_BOARD_INFO)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_BOARD_INFO and data:
-            if len(data) >= 8:
-                board_id = data[:4].decode('ascii').rstrip('\x00')
-                hardware_revision = struct.unpack('<H', data[4:6])[0]
-                return {
-                    "board_identifier": board_id,
-                    "hardware_revision": hardware_revision
-                }
+        return self._fetch(MSPCommands.MSP_BOARD_INFO, self._decode_board_info)
+
+    def _decode_board_info(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_BOARD_INFO response payload"""
+        if len(data) >= 8:
+            board_id = data[:4].decode('ascii').rstrip('\x00')
+            hardware_revision = _U16.unpack_from(data, 4)[0]
+            return {
+                "board_identifier": board_id,
+                "hardware_revision": hardware_revision
+            }
         return None
 
     def get_attitude(self) -> Optional[Dict[str, float]]:
         """Get attitude (roll, pitch, yaw)"""
-        self.conn.send_msp(MSPCommands.MSP_ATTITUDE)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_ATTITUDE and data:
-            if len(data) >= 6:
-                roll, pitch, yaw = struct.unpack('<hhh', data[:6])
-                return {
-                    "roll": roll / 10.0,
-                    "pitch": pitch / 10.0, 
-                    "yaw": yaw
-                }
+        return self._fetch(MSPCommands.MSP_ATTITUDE, self._decode_attitude)
+
+    def _decode_attitude(self, data: bytes) -> Optional[Dict[str, float]]:
+        """Decode MSP_ATTITUDE response payload"""
+        if len(data) >= _ATTITUDE.size:
+            roll, pitch, yaw = _ATTITUDE.unpack_from(data)
+            return {
+                "roll": roll / 10.0,
+                "pitch": pitch / 10.0, 
+                "yaw": yaw
+            }
         return None
 
     def get_raw_imu(self) -> Optional[Dict[str, Any]]:
         """Get raw IMU data (accelerometer, gyroscope, magnetometer)"""
-        self.conn.send_msp(MSPCommands.MSP_RAW_IMU)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_RAW_IMU and data:
-            if len(data) >= 18:
-                acc_x, acc_y, acc_z = struct.unpack('<hhh', data[0:6])
-                gyro_x, gyro_y, gyro_z = struct.unpack('<hhh', data[6:12])
-                mag_x, mag_y, mag_z = struct.unpack('<hhh', data[12:18])
-                return {
-                    "accelerometer": {"x": acc_x, "y": acc_y, "z": acc_z},
-                    "gyroscope": {"x": gyro_x, "y": gyro_y, "z": gyro_z},
-                    "magnetometer": {"x": mag_x, "y": mag_y, "z": mag_z}
-                }
+        return self._fetch(MSPCommands.MSP_RAW_IMU, self._decode_raw_imu)
+
+    def _decode_raw_imu(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_RAW_IMU response payload"""
+        if len(data) >= _RAW_IMU.size:
+            (acc_x, acc_y, acc_z,
+             gyro_x, gyro_y, gyro_z,
+             mag_x, mag_y, mag_z) = _RAW_IMU.unpack_from(data)
+            return {
+                "accelerometer": {"x": acc_x, "y": acc_y, "z": acc_z},
+                "gyroscope": {"x": gyro_x, "y": gyro_y, "z": gyro_z},
+                "magnetometer": {"x": mag_x, "y": mag_y, "z": mag_z}
+            }
         return None
 
     def get_gps(self) -> Optional[Dict[str, Any]]:
         """Get GPS data"""
-        self.conn.send_msp(MSPCommands.MSP_RAW_GPS)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_RAW_GPS and data:
-            if len(data) >= 16:
-                fix_type = data[0]
-                num_sats = data[1] 
-                lat, lon, alt = struct.unpack('<iii', data[2:14])
-                speed, ground_course = struct.unpack('<HH', data[14:18]) if len(data) >= 18 else (0, 0)
-                
-                return {
-                    "fix_type": GPSFixType(fix_type).name,
-                    "num_satellites": num_sats,
-                    "latitude": lat / 1e7,
-                    "longitude": lon / 1e7,
-                    "altitude": alt / 100.0,
-                    "speed": speed / 100.0,  # m/s
-                    "ground_course": ground_course / 10.0  # degrees
-                }
+        return self._fetch(MSPCommands.MSP_RAW_GPS, self._decode_gps)
+
+    def _decode_gps(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_RAW_GPS response payload"""
+        if len(data) >= 16:
+            fix_type, num_sats, lat, lon, alt = _GPS.unpack_from(data)
+            speed, ground_course = _GPS_MOTION.unpack_from(data, _GPS.size) if len(data) >= 18 else (0, 0)
+            
+            return {
+                "fix_type": GPSFixType(fix_type).name,
+                "num_satellites": num_sats,
+                "latitude": lat / 1e7,
+                "longitude": lon / 1e7,
+                "altitude": alt / 100.0,
+                "speed": speed / 100.0,  # m/s
+                "ground_course": ground_course / 10.0  # degrees
+            }
         return None
 
     def get_altitude(self) -> Optional[Dict[str, Any]]:
         """Get altitude data"""
-        self.conn.send_msp(MSPCommands.MSP_ALTITUDE)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_ALTITUDE and data:
-            if len(data) >= 6:
-                altitude, vario = struct.unpack('<ih', data[:6])
-                return {
-                    "altitude": altitude / 100.0,  # meters
-                    "vertical_speed": vario  # cm/s
-                }
+        return self._fetch(MSPCommands.MSP_ALTITUDE, self._decode_altitude)
+
+    def _decode_altitude(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_ALTITUDE response payload"""
+        if len(data) >= _ALTITUDE.size:
+            altitude, vario = _ALTITUDE.unpack_from(data)
+            return {
+                "altitude": altitude / 100.0,  # meters
+                "vertical_speed": vario  # cm/s
+            }
         return None
 
     def get_analog(self) -> Optional[Dict[str, Any]]:
         """Get analog sensor data (battery, current, etc.)"""
-        self.conn.send_msp(MSPCommands.MSP_ANALOG)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_ANALOG and data:
-            if len(data) >= 7:
-                voltage = data[0] / 10.0  # Volts
-                mah_drawn = struct.unpack('<H', data[1:3])[0]  # mAh
-                rssi = struct.unpack('<H', data[3:5])[0]
-                amperage = struct.unpack('<h', data[5:7])[0] / 100.0  # Amps
-                
-                result = {
-                    "voltage": voltage,
-                    "mah_drawn": mah_drawn,
-                    "rssi": rssi,
-                    "amperage": amperage
-                }
+        return self._fetch(MSPCommands.MSP_ANALOG, self._decode_analog)
+
+    def _decode_analog(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_ANALOG response payload"""
+        if len(data) >= _ANALOG.size:
+            voltage, mah_drawn, rssi, amperage = _ANALOG.unpack_from(data)
+            
+            result = {
+                "voltage": voltage / 10.0,  # Volts
+                "mah_drawn": mah_drawn,  # mAh
+                "rssi": rssi,
+                "amperage": amperage / 100.0  # Amps
+            }
+            
+            # Extended data for newer firmware
+            if len(data) >= 9:
+                voltage_2 = _U16.unpack_from(data, 7)[0] / 100.0
+                result["voltage_2"] = voltage_2
                 
-                # Extended data for newer firmware
-                if len(data) >= 9:
-                    voltage_2 = struct.unpack('<H', data[7:9])[0] / 100.0
-                    result["voltage_2"] = voltage_2
-                    
-                return result
+            return result
         return None
 
     def get_battery_state(self) -> Optional[Dict[str, Any]]:
         """Get detailed battery state (if supported)"""
-        self.conn.send_msp(MSPCommands.MSP_BATTERY_STATE)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_BATTERY_STATE and data:
-            if len(data) >= 8:
-                cells = data[0]
-                capacity = struct.unpack('<H', data[1:3])[0]
-                voltage = data[3] / 10.0
-                mah_drawn = struct.unpack('<H', data[4:6])[0]
-                amperage = struct.unpack('<h', data[6:8])[0] / 100.0
-                
-                result = {
-                    "cell_count": cells,
-                    "capacity": capacity,
-                    "voltage": voltage,
-                    "mah_drawn": mah_drawn,
-                    "amperage": amperage
-                }
+        return self._fetch(MSPCommands.MSP_BATTERY_STATE, self._decode_battery_state)
+
+    def _decode_battery_state(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_BATTERY_STATE response payload"""
+        if len(data) >= _BATTERY_STATE.size:
+            cells, capacity, voltage, mah_drawn, amperage = _BATTERY_STATE.unpack_from(data)
+            
+            result = {
+                "cell_count": cells,
+                "capacity": capacity,
+                "voltage": voltage / 10.0,
+                "mah_drawn": mah_drawn,
+                "amperage": amperage / 100.0
+            }
+            
+            # Battery state flags (if available)
+            if len(data) >= 9:
+                state = data[8]
+                result["state"] = state
+                result["battery_ok"] = (state & 0x01) == 0
+                result["battery_warning"] = (state & 0x02) != 0
+                result["battery_critical"] = (state & 0x04) != 0
                 
-                # Battery state flags (if available)
-                if len(data) >= 9:
-                    state = data[8]
-                    result["state"] = state
-                    result["battery_ok"] = (state & 0x01) == 0
-                    result["battery_warning"] = (state & 0x02) != 0
-                    result["battery_critical"] = (state & 0x04) != 0
-                    
-                return result
+            return result
         return None
 
     def get_status(self) -> Optional[Dict[str, Any]]:
         """Get flight controller status"""
-        self.conn.send_msp(MSPCommands.MSP_STATUS)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_STATUS and data:
-            if len(data) >= 11:
-                cycle_time, i2c_errors, sensor, flags = struct.unpack('<HHHH', data[:8])
-                current_conf = data[8]
-                
-                # Parse sensor status
-                sensors_detected = {
-                    "accelerometer": bool(sensor & SensorStatus.ACC),
-                    "barometer": bool(sensor & SensorStatus.BARO), 
-                    "magnetometer": bool(sensor & SensorStatus.MAG),
-                    "gps": bool(sensor & SensorStatus.GPS),
-                    "sonar": bool(sensor & SensorStatus.SONAR),
-                    "optical_flow": bool(sensor & SensorStatus.OPTICAL_FLOW),
-                    "pitot": bool(sensor & SensorStatus.PITOT)
-                }
-                
-                return {
-                    "cycle_time": cycle_time,
-                    "i2c_errors": i2c_errors,
-                    "sensor_status": sensor,
-                    "sensors_detected": sensors_detected,
-                    "flight_mode_flags": flags,
-                    "current_profile": current_conf,
-                    "armed": bool(flags & (1 << 0)),
-                    "flight_modes": self._parse_flight_modes(flags)
-                }
+        return self._fetch(MSPCommands.MSP_STATUS, self._decode_status)
+
+    def _decode_status(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_STATUS response payload"""
+        if len(data) >= _STATUS.size:
+            cycle_time, i2c_errors, sensor, flags, current_conf = _STATUS.unpack_from(data)
+            
+            # Parse sensor status
+            sensors_detected = {
+                "accelerometer": bool(sensor & SensorStatus.ACC),
+                "barometer": bool(sensor & SensorStatus.BARO), 
+                "magnetometer": bool(sensor & SensorStatus.MAG),
+                "gps": bool(sensor & SensorStatus.GPS),
+                "sonar": bool(sensor & SensorStatus.SONAR),
+                "optical_flow": bool(sensor & SensorStatus.OPTICAL_FLOW),
+                "pitot": bool(sensor & SensorStatus.PITOT)
+            }
+            
+            return {
+                "cycle_time": cycle_time,
+                "i2c_errors": i2c_errors,
+                "sensor_status": sensor,
+                "sensors_detected": sensors_detected,
+                "flight_mode_flags": flags,
+                "current_profile": current_conf,
+                "armed": bool(flags & (1 << 0)),
+                "flight_modes": self._parse_flight_modes(flags)
+            }
         return None
 
     def get_status_ex(self) -> Optional[Dict[str, Any]]:
         """Get extended status (if supported)"""
-        self.conn.send_msp(MSPCommands.MSP_STATUS_EX)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_STATUS_EX and data:
+        data = self._request(MSPCommands.MSP_STATUS_EX)
+        if data:
             status = self.get_status()
             if status and len(data) >= 13:
                 # Additional data in STATUS_EX
@@ -221,7 +408,7 @@ class Telemetry:
                 status["current_pid_profile"] = current_pid_profile
                 
                 if len(data) >= 15:
-                    cpu_load = struct.unpack('<H', data[13:15])[0]
+                    cpu_load = _U16.unpack_from(data, 13)[0]
                     status["cpu_load"] = cpu_load
                     
                 return status
@@ -233,60 +420,49 @@ class Telemetry:
             logger.warning("Navigation status only available on iNav")
             return None
             
-        self.conn.send_msp(MSPCommands.MSP_NAV_STATUS)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_NAV_STATUS and data:
-            if len(data) >= 7:
-                nav_mode = data[0]
-                nav_state = data[1]
-                action = data[2]
-                wp_number = data[3]
-                nav_error = data[4]
-                heading_hold_target = struct.unpack('<h', data[5:7])[0]
-                
-                return {
-                    "nav_mode": nav_mode,
-                    "nav_state": NavState(nav_state).name if nav_state < len(NavState) else nav_state,
-                    "action": action,
-                    "waypoint_number": wp_number,
-                    "nav_error": nav_error,
-                    "heading_hold_target": heading_hold_target
-                }
-        return None
+        return self._fetch(MSPCommands.MSP_NAV_STATUS, self._decode_nav_status)
 
-    def get_rc_channels(self) -> Optional[Dict[str, Any]]:
-        """Get RC channel values"""
-        self.conn.send_msp(MSPCommands.MSP_RC)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_RC and data:
-            channels = []
-            for i in range(0, len(data), 2):
-                if i + 1 < len(data):
-                    channel = struct.unpack('<H', data[i:i+2])[0]
-                    channels.append(channel)
-                    
+    def _decode_nav_status(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_NAV_STATUS response payload"""
+        if len(data) >= 7:
+            (nav_mode, nav_state, action, wp_number,
+             nav_error, heading_hold_target) = _NAV_STATUS.unpack_from(data)
+            
             return {
-                "channels": channels,
-                "num_channels": len(channels)
+                "nav_mode": nav_mode,
+                "nav_state": NavState(nav_state).name if nav_state < len(NavState) else nav_state,
+                "action": action,
+                "waypoint_number": wp_number,
+                "nav_error": nav_error,
+                "heading_hold_target": heading_hold_target
             }
         return None
 
+    def get_rc_channels(self) -> Optional[Dict[str, Any]]:
+        """Get RC channel values"""
+        return self._fetch(MSPCommands.MSP_RC, self._decode_rc_channels)
+
+    def _decode_rc_channels(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_RC response payload"""
+        channels = list(struct.unpack_from(f'<{len(data) // 2}H', data))
+                
+        return {
+            "channels": channels,
+            "num_channels": len(channels)
+        }
+
     def get_motor_values(self) -> Optional[Dict[str, Any]]:
         """Get motor output values"""
-        self.conn.send_msp(MSPCommands.MSP_MOTOR)
-        code, data = self.conn.read_response()
-        if code == MSPCommands.MSP_MOTOR and data:
-            motors = []
-            for i in range(0, len(data), 2):
-                if i + 1 < len(data):
-                    motor = struct.unpack('<H', data[i:i+2])[0]
-                    motors.append(motor)
-                    
-            return {
-                "motors": motors,
-                "num_motors": len(motors)
-            }
-        return None
+        return self._fetch(MSPCommands.MSP_MOTOR, self._decode_motor_values)
+
+    def _decode_motor_values(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode MSP_MOTOR response payload"""
+        motors = list(struct.unpack_from(f'<{len(data) // 2}H', data))
+                
+        return {
+            "motors": motors,
+            "num_motors": len(motors)
+        }
 
     def _parse_flight_modes(self, flags: int) -> List[str]:
         """Parse flight mode flags into readable names"""
@@ -317,39 +493,99 @@ class Telemetry:
             
         return modes
 
-    def get_all_telemetry(self) -> Dict[str, Any]:
-        """Get comprehensive telemetry data"""
-        telemetry = {}
+    def prefetch(self, sections: TelemetrySection) -> None:
+        """Read the payloads of several sections in one pipelined burst
         
-        # Core telemetry
-        if attitude := self.get_attitude():
-            telemetry["attitude"] = attitude
-            
-        if gps := self.get_gps():
-            telemetry["gps"] = gps
-            
-        if analog := self.get_analog():
-            telemetry["analog"] = analog
-            
-        if status := self.get_status():
-            telemetry["status"] = status
-            
-        if altitude := self.get_altitude():
-            telemetry["altitude"] = altitude
-            
-        # Extended telemetry
-        if battery := self.get_battery_state():
-            telemetry["battery"] = battery
+        Sections missing from the cache are requested back-to-back with
+        request_many(), so the get_*() and read_*() calls that follow within
+        cache_ttl are answered from the cache instead of costing a
+        round-trip each.
+        """
+        now = time.monotonic()
+        stale = [code for flag, code in self.SECTION_CODES.items()
+                 if sections & flag and
+                 (code not in self._cache or now - self._cache[code][0] >= self.cache_ttl)]
+        if not stale:
+            return
             
-        if rc := self.get_rc_channels():
-            telemetry["rc"] = rc
-            
-        if motors := self.get_motor_values():
-            telemetry["motors"] = motors
+        responses = self.conn.request_many(stale)
+        now = time.monotonic()
+        for code, data in responses.items():
+            if data:
+                self._cache[code] = (now, data)
+
+    def read_attitude(self) -> Optional[AttitudeView]:
+        """Get attitude into a reused AttitudeView
+        
+        The read_*() methods decode straight into one record per Telemetry
+        instance instead of building a dict per call, which keeps fixed-rate
+        loops from churning the garbage collector. Each call overwrites the
+        previous values; use as_dict() to keep a copy.
+        """
+        data = self._request(MSPCommands.MSP_ATTITUDE)
+        if not data or len(data) < _ATTITUDE.size:
+            return None
+        view = self._attitude
+        roll, pitch, view.yaw = _ATTITUDE.unpack_from(data)
+        view.roll = roll / 10.0
+        view.pitch = pitch / 10.0
+        return view
+
+    def read_status(self) -> Optional[StatusView]:
+        """Get flight controller status into a reused StatusView"""
+        data = self._request(MSPCommands.MSP_STATUS)
+        if not data or len(data) < _STATUS.size:
+            return None
+        view = self._status
+        (view.cycle_time, view.i2c_errors, view.sensor_status,
+         view.flight_mode_flags, view.current_profile) = _STATUS.unpack_from(data)
+        view.armed = bool(view.flight_mode_flags & (1 << 0))
+        return view
+
+    def read_analog(self) -> Optional[AnalogView]:
+        """Get analog sensor data into a reused AnalogView"""
+        data = self._request(MSPCommands.MSP_ANALOG)
+        if not data or len(data) < _ANALOG.size:
+            return None
+        view = self._analog
+        voltage, view.mah_drawn, view.rssi, amperage = _ANALOG.unpack_from(data)
+        view.voltage = voltage / 10.0
+        view.amperage = amperage / 100.0
+        return view
+
+    def read_gps(self) -> Optional[GPSView]:
+        """Get GPS data into a reused GPSView"""
+        data = self._request(MSPCommands.MSP_RAW_GPS)
+        if not data or len(data) < 16:
+            return None
+        view = self._gps
+        view.fix_type, view.num_satellites, lat, lon, alt = _GPS.unpack_from(data)
+        speed, ground_course = _GPS_MOTION.unpack_from(data, _GPS.size) if len(data) >= 18 else (0, 0)
+        view.latitude = lat / 1e7
+        view.longitude = lon / 1e7
+        view.altitude = alt / 100.0
+        view.speed = speed / 100.0
+        view.ground_course = ground_course / 10.0
+        return view
+
+    def read_nav_status(self) -> Optional[NavStatusView]:
+        """Get navigation status into a reused NavStatusView (iNav specific)"""
+        if self.fc_type != FlightController.INAV:
+            logger.warning("Navigation status only available on iNav")
+            return None
             
-        # iNav specific
-        if self.fc_type == FlightController.INAV:
-            if nav := self.get_nav_status():
-                telemetry["navigation"] = nav
-                
-        return telemetry
+        data = self._request(MSPCommands.MSP_NAV_STATUS)
+        if not data or len(data) < _NAV_STATUS.size:
+            return None
+        view = self._nav_status
+        (view.nav_mode, view.nav_state, view.action, view.waypoint_number,
+         view.nav_error, view.heading_hold_target) = _NAV_STATUS.unpack_from(data)
+        return view
+
+    def get_sections(self, sections: TelemetrySection) -> Dict[str, Any]:
+        """Get the telemetry sections selected by a TelemetrySection mask"""
+        return self.get_bundle([code for flag, code in self.SECTION_CODES.items() if sections & flag])
+
+    def get_all_telemetry(self) -> Dict[str, Any]:
+        """Get comprehensive telemetry data"""
+        return self.get_sections(TelemetrySection.ALL)
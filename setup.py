@@ -44,6 +44,10 @@ setup(
         'examples': [
             'matplotlib>=3.0',
             'numpy>=1.19',
+        ],
+        'fast': [
+            'orjson>=3.0',
+            'numba>=0.50',
         ]
     },
     
@@ -2,9 +2,114 @@
 Pytest configuration and shared fixtures for MSPKit tests.
 """
 
+import struct
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock
 
+from mspkit.core import ConnectionManager
+
+
+class FakeSerial:
+    """In-memory serial port that answers MSP requests from a response table.
+
+    Request frames written to the port are parsed and, for every code found in
+    ``responses``, a response frame of the same protocol version is queued for
+    reading. Codes missing from the table get an MSP error frame.
+    """
+
+    def __init__(self, responses=None):
+        self.responses = dict(responses or {})
+        self.timeout = 0.2
+        self.is_open = True
+        self.writes = []
+        self.rx = bytearray()
+        self._rx_lock = threading.Lock()
+
+    @staticmethod
+    def crc8(data):
+        crc = 0
+        for byte in data:
+            crc ^= byte
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0xD5) if crc & 0x80 else (crc << 1)
+                crc &= 0xFF
+        return crc
+
+    def frame_v1(self, code, payload, direction=b'>'):
+        chk = len(payload) ^ code
+        for byte in payload:
+            chk ^= byte
+        return b'$M' + direction + bytes([len(payload), code]) + payload + bytes([chk])
+
+    def frame_v2(self, code, payload, direction=b'>'):
+        body = struct.pack('<BHH', 0, code, len(payload)) + payload
+        return b'$X' + direction + body + bytes([self.crc8(body)])
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        buf = bytes(data)
+        # Responses are queued in one step so a background reader never
+        # sees a partially written frame
+        out = bytearray()
+        i = 0
+        while i < len(buf):
+            if buf[i:i + 3] == b'$M<':
+                size, code = buf[i + 3], buf[i + 4]
+                out += self._answer(code, self.frame_v1)
+                i += 6 + size
+            elif buf[i:i + 3] == b'$X<':
+                code, size = struct.unpack('<HH', buf[i + 4:i + 8])
+                out += self._answer(code, self.frame_v2)
+                i += 9 + size
+            else:
+                i += 1
+        with self._rx_lock:
+            self.rx += out
+        return len(data)
+
+    def _answer(self, code, builder):
+        if code in self.responses:
+            return builder(code, self.responses[code])
+        return builder(code, b'', b'!')
+
+    def read(self, size=1):
+        with self._rx_lock:
+            chunk = bytes(self.rx[:size])
+            del self.rx[:size]
+        return chunk
+
+    @property
+    def in_waiting(self):
+        return len(self.rx)
+
+    def reset_input_buffer(self):
+        with self._rx_lock:
+            self.rx.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def fake_serial():
+    """Provide an in-memory serial port that answers MSP API_VERSION."""
+    return FakeSerial({1: bytes([0, 2, 5])})
+
+
+@pytest.fixture
+def msp_connection(fake_serial, monkeypatch):
+    """Provide a ConnectionManager talking MSP v2 to ``fake_serial``."""
+    monkeypatch.setattr('mspkit.core.serial.Serial', lambda *args, **kwargs: fake_serial)
+    monkeypatch.setattr('mspkit.core.time.sleep', lambda seconds: None)
+    conn = ConnectionManager('/dev/ttyFAKE', timeout=0.2)
+    fake_serial.writes.clear()
+    return conn
+
 
 @pytest.fixture
 def mock_serial():
@@ -0,0 +1,197 @@
+"""
+Tests for configuration management.
+These tests run against an in-memory serial port instead of hardware.
+"""
+
+import struct
+
+from mspkit import Config, FlightController, MSPCommands
+
+
+PIDS = bytes([40, 30, 23, 45, 35, 25, 85, 45, 0] + [0] * 21)
+
+SETTINGS = {
+    MSPCommands.MSP_PID: PIDS,
+    MSPCommands.MSP_FEATURE: struct.pack('<I', 1 << 1),
+    MSPCommands.MSP_RC_TUNING: bytes(20),
+    MSPCommands.MSP_MISC: bytes(32),
+    MSPCommands.MSP_FAILSAFE_CONFIG: struct.pack('<BBHBHB', 10, 20, 1000, 1, 100, 2),
+    MSPCommands.MSP_MOTOR_CONFIG: struct.pack('<HHH', 1070, 2000, 1000),
+    MSPCommands.MSP_BOXNAMES: b'ARM;ANGLE;',
+    MSPCommands.MSP_BOXIDS: bytes([0, 1]),
+}
+
+
+class TestConfigCache:
+    """Test caching of settings reads."""
+
+    def test_repeated_reads_use_cache(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_PID] = PIDS
+        config = Config(msp_connection)
+
+        first = config.get_pid_values()
+        second = config.get_pid_values()
+
+        assert first == second
+        assert first['ROLL'] == {'P': 40, 'I': 30, 'D': 23}
+        assert len(fake_serial.writes) == 1
+
+    def test_cached_results_are_independent(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_PID] = PIDS
+        config = Config(msp_connection)
+
+        config.get_pid_values()['ROLL']['P'] = 99
+
+        assert config.get_pid_values()['ROLL']['P'] == 40
+
+    def test_setter_writes_through_cache(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_FEATURE] = struct.pack('<I', 1 << 1)
+        config = Config(msp_connection)
+
+        assert config.set_feature('GPS', True)
+        fake_serial.writes.clear()
+        features = config.get_features()
+
+        assert features['GPS'] is True
+        assert features['VBAT'] is True
+        assert len(fake_serial.writes) == 0
+
+    def test_zero_ttl_disables_cache(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_PID] = PIDS
+        config = Config(msp_connection, cache_ttl=0)
+
+        config.get_pid_values()
+        config.get_pid_values()
+
+        assert len(fake_serial.writes) == 2
+
+    def test_backup_reads_settings_in_one_burst(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_PID: PIDS,
+            MSPCommands.MSP_FEATURE: struct.pack('<I', 1 << 1),
+            MSPCommands.MSP_RC_TUNING: bytes(20),
+            MSPCommands.MSP_MISC: bytes(32),
+            MSPCommands.MSP_FAILSAFE_CONFIG: struct.pack('<BBHBHB', 10, 20, 1000, 1, 100, 2),
+            MSPCommands.MSP_MOTOR_CONFIG: struct.pack('<HHH', 1070, 2000, 1000),
+            MSPCommands.MSP_BOXNAMES: b'ARM;ANGLE;',
+            MSPCommands.MSP_BOXIDS: bytes([0, 1]),
+        })
+        config = Config(msp_connection)
+
+        backup = config.backup_settings()
+
+        assert len(fake_serial.writes) == 1
+        assert backup['pids']['ROLL'] == {'P': 40, 'I': 30, 'D': 23}
+        assert backup['features']['VBAT'] is True
+        assert backup['failsafe']['failsafe_delay'] == 1.0
+        assert backup['failsafe']['failsafe_kill_switch'] is True
+        assert backup['motor'] == {'min_throttle': 1070, 'max_throttle': 2000, 'min_command': 1000}
+
+    def test_backup_uses_multiple_msp_on_betaflight(self, msp_connection, fake_serial):
+        msp_connection.fc_type = FlightController.BETAFLIGHT
+        fake_serial.responses.update(SETTINGS)
+        # PID and RC tuning fit in the reply; FEATURE is skipped, the rest cut off
+        fake_serial.responses[MSPCommands.MSP_MULTIPLE_MSP] = (
+            bytes([len(PIDS)]) + PIDS + bytes([20]) + bytes(20) + bytes([0]))
+        config = Config(msp_connection)
+
+        backup = config.backup_settings()
+
+        assert len(fake_serial.writes) == 2
+        assert fake_serial.writes[0][4] == MSPCommands.MSP_MULTIPLE_MSP
+        assert backup['pids']['ROLL'] == {'P': 40, 'I': 30, 'D': 23}
+        assert backup['features']['VBAT'] is True
+        assert backup['box_ids'] == [0, 1]
+
+    def test_multiple_msp_not_retried_when_unsupported(self, msp_connection, fake_serial):
+        msp_connection.fc_type = FlightController.BETAFLIGHT
+        fake_serial.responses.update(SETTINGS)
+        config = Config(msp_connection)
+
+        config.backup_settings()
+        assert len(fake_serial.writes) == 2
+
+        fake_serial.writes.clear()
+        config.invalidate_cache()
+        assert config.backup_settings()['pids']['ROLL']['P'] == 40
+        assert len(fake_serial.writes) == 1
+
+    def test_multiple_msp_retried_after_timeout(self, msp_connection, fake_serial):
+        msp_connection.fc_type = FlightController.BETAFLIGHT
+        fake_serial.responses.update(SETTINGS)
+        fake_serial.responses[MSPCommands.MSP_MULTIPLE_MSP] = bytes([len(PIDS)]) + PIDS
+        codes = [MSPCommands.MSP_PID, MSPCommands.MSP_RC_TUNING]
+        answer = fake_serial.write
+
+        def drop_first(data):
+            # The first bundle is lost on the wire
+            fake_serial.write = answer
+            fake_serial.writes.append(bytes(data))
+            return len(data)
+
+        fake_serial.write = drop_first
+        assert MSPCommands.MSP_PID in msp_connection.request_multiple(codes, timeout=0.05)
+
+        fake_serial.writes.clear()
+        assert msp_connection.request_multiple(codes)[MSPCommands.MSP_PID] == PIDS
+        assert fake_serial.writes[0][4] == MSPCommands.MSP_MULTIPLE_MSP
+
+
+class TestMiscSettings:
+    """Test decoding and writing MSP_MISC."""
+
+    MISC = struct.pack('<5H6Bh4B', 1500, 1070, 2000, 1000, 1000, 1, 2, 0, 0, 0, 0, -25, 110, 33, 43, 35)
+
+    def test_misc_round_trip_with_negative_declination(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_MISC] = self.MISC
+        config = Config(msp_connection)
+
+        misc = config.get_misc_settings()
+        assert misc['mag_declination'] == -2.5
+        assert misc['vbat_warning'] == 35
+
+        assert config.set_misc_settings({'vbat_min': 32})
+        written = fake_serial.writes[-1]
+        assert written[4] == MSPCommands.MSP_SET_MISC
+        assert written[8:-1] == self.MISC[:18] + bytes([110, 32, 43])
+
+
+class TestConfigRestore:
+    """Test restoring and verifying settings."""
+
+    def test_restore_writes_features_once(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_FEATURE] = struct.pack('<I', 0)
+        config = Config(msp_connection)
+
+        assert config.restore_settings({'features': {'VBAT': True, 'GPS': True, 'OSD': False}})
+
+        feature_writes = [w for w in fake_serial.writes if w[4:6] == bytes([MSPCommands.MSP_SET_FEATURE, 0])]
+        assert len(fake_serial.writes) == 2
+        assert len(feature_writes) == 1
+
+    def test_full_feature_restore_keeps_unknown_bits(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_FEATURE] = struct.pack('<I', 1 << 28 | 1 << 1)
+        fake_serial.responses[MSPCommands.MSP_SET_FEATURE] = b''
+        config = Config(msp_connection)
+        features = {name: name == 'GPS' for name in config._feature_bits()}
+
+        assert config.restore_settings({'features': features})
+
+        written = fake_serial.writes[-1]
+        assert written[4] == MSPCommands.MSP_SET_FEATURE
+        assert struct.unpack('<I', written[8:12])[0] == 1 << 28 | 1 << 7
+        assert len(fake_serial.writes) == 2
+
+    def test_verify_reads_back_in_one_burst(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_PID: PIDS,
+            MSPCommands.MSP_FEATURE: struct.pack('<I', 1 << 1),
+        })
+        config = Config(msp_connection)
+        backup = {
+            'pids': {'ROLL': {'P': 40, 'I': 30, 'D': 23}},
+            'features': {'VBAT': True, 'GPS': True},
+        }
+
+        assert config.verify_settings(backup) == ['features']
+        assert len(fake_serial.writes) == 1
@@ -0,0 +1,104 @@
+"""
+Tests for flight control features.
+These tests run against an in-memory serial port instead of hardware.
+"""
+
+import time
+
+from mspkit import Control, MSPCommands, RC_CHANNELS
+
+
+class TestRCAcknowledgements:
+    """Test fire-and-forget and acknowledged RC updates."""
+
+    def test_fire_and_forget_acks_are_flushed_together(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_RAW_RC] = b''
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        for _ in range(3):
+            assert control.reset_rc_channels()
+
+        assert len(fake_serial.writes) == 3
+        assert control.flush_acks() == 3
+        assert fake_serial.in_waiting == 0
+
+    def test_acks_read_past_by_other_requests_are_counted(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_RAW_RC] = b''
+        fake_serial.responses[MSPCommands.MSP_STATUS] = bytes(11)
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        assert control.reset_rc_channels()
+        assert msp_connection.telemetry.get_status() is not None
+
+        started = time.monotonic()
+        assert control.flush_acks() == 1
+        assert control.reset_rc_channels(wait_ack=True)
+        assert time.monotonic() - started < 0.1
+
+    def test_rejected_acks_do_not_answer_later_requests(self, msp_connection, fake_serial):
+        # No MSP_SET_RAW_RC entry: the FC answers the RC frame with an error
+        fake_serial.responses[MSPCommands.MSP_STATUS] = bytes(11)
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        assert control.reset_rc_channels()
+        assert msp_connection.telemetry.get_status() is not None
+
+        started = time.monotonic()
+        assert control.flush_acks() == 1
+        assert time.monotonic() - started < 0.1
+
+    def test_wait_ack_reports_rejection(self, msp_connection, fake_serial):
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        assert not control.set_attitude(wait_ack=True)
+
+        fake_serial.responses[MSPCommands.MSP_SET_RAW_RC] = b''
+        assert control.set_attitude(roll_percent=10, wait_ack=True)
+        assert control.get_last_rc_values()[0] == 1550
+
+
+class TestRCOverride:
+    """Test per-channel RC overrides."""
+
+    def test_override_matches_send_rc_frame(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_RAW_RC] = b''
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        assert control.set_rc_override(throttle=1200, roll=1600)
+        expected = [1500] * 16
+        expected[RC_CHANNELS['THROTTLE']] = 1200
+        expected[RC_CHANNELS['ROLL']] = 1600
+        assert control.get_last_rc_values() == expected
+
+        control.send_rc(list(expected))
+        assert fake_serial.writes[0] == fake_serial.writes[1]
+        assert control.flush_acks() == 2
+
+    def test_override_reuses_frame_buffer(self, msp_connection, fake_serial):
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        control.set_rc_override(throttle=1100)
+        first = msp_connection.frame_buffer(MSPCommands.MSP_SET_RAW_RC, 32)[0]
+        control.set_rc_override(throttle=3000, yaw=1400)
+
+        assert msp_connection.frame_buffer(MSPCommands.MSP_SET_RAW_RC, 32)[0] is first
+        assert control.get_last_rc_values()[RC_CHANNELS['THROTTLE']] == 2000
+        assert fake_serial.writes[0] != fake_serial.writes[1]
+
+    def test_override_over_msp_v1(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_RAW_RC] = b''
+        msp_connection.msp_v2_supported = False
+        control = Control(msp_connection)
+        control.enable_safety(False)
+
+        control.set_rc_override(pitch=1700)
+        control.send_rc(control.get_last_rc_values())
+
+        assert fake_serial.writes[0] == fake_serial.writes[1]
+        assert control.flush_acks() == 2
@@ -3,6 +3,10 @@ Basic tests for MSPKit core functionality.
 These tests use mocked connections to avoid requiring actual hardware.
 """
 
+import os
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 import mspkit
@@ -32,6 +36,181 @@ class TestConnectionManager:
             # Skip if implementation is not ready
             pytest.skip("Connection implementation not available")
 
+    def test_msp_v2_detected(self, msp_connection):
+        """Test that MSP v2 is used when the FC answers a v2 request."""
+        assert msp_connection.msp_v2_supported
+
+    def test_request_returns_payload(self, msp_connection, fake_serial):
+        """Test a single request/response round-trip."""
+        fake_serial.responses[108] = b'\x01\x00\x02\x00\x03\x00'
+        assert msp_connection.request(108) == b'\x01\x00\x02\x00\x03\x00'
+
+    def test_request_many_pipelines_frames(self, msp_connection, fake_serial):
+        """Test that batched requests go out in one write."""
+        fake_serial.responses.update({108: b'\x00' * 6, 110: b'\x7e' * 7})
+        responses = msp_connection.request_many([108, 110, 106])
+
+        assert len(fake_serial.writes) == 1
+        assert set(responses) == {108, 110}
+
+    def test_request_window_matches_responses_in_order(self, msp_connection, fake_serial):
+        """Test that streamed requests get one result each, in order."""
+        fake_serial.responses[209] = b''
+        fake_serial.rx += fake_serial.frame_v2(110, b'\x02' * 7)  # Unsolicited
+        requests = [(209, bytes([i]) * 21) for i in range(5)] + [(106, b'')]
+
+        results = msp_connection.request_window(requests, window=2)
+
+        assert results == [b''] * 5 + [None]
+        assert len(fake_serial.writes) == 6
+
+    def test_static_info_is_requested_once(self, msp_connection, fake_serial):
+        """Test that identification responses are cached per connection."""
+        fake_serial.responses[2] = b'INAV'
+
+        assert msp_connection.request(2) == b'INAV'
+        assert msp_connection.request_many([1, 2]) == {1: bytes([0, 2, 5]), 2: b'INAV'}
+        # API version was answered during v2 detection, variant by the first call
+        assert len(fake_serial.writes) == 1
+
+    def test_request_frames_are_reused(self, msp_connection, fake_serial):
+        """Test that payload-less request frames are encoded once."""
+        frame = msp_connection._build_frame(108)
+
+        assert msp_connection._build_frame(108) is frame
+        assert frame == b'$X<\x00l\x00\x00\x00' + bytes([fake_serial.crc8(b'\x00l\x00\x00\x00')])
+
+    def test_frames_split_from_one_chunk(self, msp_connection, fake_serial):
+        """Test that back-to-back frames behind line noise are parsed in order."""
+        fake_serial.rx += b'\x00$\xff' + fake_serial.frame_v1(108, b'\x01' * 6)
+        fake_serial.rx += fake_serial.frame_v2(110, b'\x02' * 7)
+
+        assert msp_connection.read_response() == (108, b'\x01' * 6)
+        assert msp_connection.read_response() == (110, b'\x02' * 7)
+        assert fake_serial.writes == []
+
+    def test_error_frames_are_consumed_whole(self, msp_connection, fake_serial):
+        # A '$' inside the error frame must not start a bogus frame
+        fake_serial.rx += fake_serial.frame_v1(36, b'$M>\x00', b'!')
+        fake_serial.rx += fake_serial.frame_v2(110, b'$X>', b'!')
+        fake_serial.rx += fake_serial.frame_v1(108, b'\x01' * 6)
+
+        assert msp_connection.read_response() == (36, None)
+        assert msp_connection.read_response() == (110, None)
+        assert msp_connection.read_response() == (108, b'\x01' * 6)
+        assert not msp_connection._rx_buf
+
+    def test_concurrent_requests_get_their_own_responses(self, msp_connection, fake_serial):
+        """Test that threads sharing a connection never swap responses."""
+        fake_serial.responses.update({108: b'\x01' * 6, 110: b'\x02' * 7})
+        results = []
+        fast_read = fake_serial.read
+
+        def slow_read(size=1):
+            # Give the other thread a chance to interleave its exchange
+            time.sleep(0.0005)
+            return fast_read(size)
+
+        fake_serial.read = slow_read
+
+        def worker(code):
+            for _ in range(20):
+                results.append((code, msp_connection.request(code)))
+
+        threads = [threading.Thread(target=worker, args=(code,)) for code in (108, 110)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 40
+        assert all(data == fake_serial.responses[code] for code, data in results)
+
+    def test_low_latency_mode_requested(self, fake_serial, monkeypatch):
+        """Test that the port is switched to low-latency mode when supported."""
+        fake_serial.set_low_latency_mode = Mock()
+        monkeypatch.setattr('mspkit.core.serial.Serial', lambda *args, **kwargs: fake_serial)
+        monkeypatch.setattr('mspkit.core.time.sleep', lambda seconds: None)
+
+        ConnectionManager('/dev/ttyFAKE', timeout=0.2)
+
+        fake_serial.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_descriptor_wait_leaves_port_timeout_alone(self, fake_serial, monkeypatch):
+        """Test that ports with a descriptor are not reconfigured on every read."""
+        read_fd, write_fd = os.pipe()
+        timeout_sets = []
+        monkeypatch.setattr(type(fake_serial), 'timeout',
+                            property(lambda self: 0.2, lambda self, value: timeout_sets.append(value)),
+                            raising=False)
+        fake_serial.fileno = lambda: read_fd
+        answer = fake_serial.write
+
+        def write(data):
+            written = answer(data)
+            os.write(write_fd, b'!')  # Make the descriptor readable
+            return written
+
+        fake_serial.write = write
+        fake_serial.responses[108] = b'\x00' * 6
+        monkeypatch.setattr('mspkit.core.serial.Serial', lambda *args, **kwargs: fake_serial)
+        monkeypatch.setattr('mspkit.core.time.sleep', lambda seconds: None)
+        try:
+            conn = ConnectionManager('/dev/ttyFAKE', timeout=0.2)
+            assert conn.request(108, timeout=0.1) == b'\x00' * 6
+
+            os.read(read_fd, 64)
+            start = time.time()
+            assert conn.read_response(timeout=0.05) == (None, None)
+            assert time.time() - start < 0.5
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert timeout_sets == []
+
+    def test_background_reader_feeds_responses(self, msp_connection, fake_serial):
+        """Test request_many while frames are parsed on the reader thread."""
+        fake_serial.responses.update({108: b'\x00' * 6, 110: b'\x7e' * 7})
+        msp_connection.start_reader(poll_interval=0.01)
+        try:
+            responses = msp_connection.request_many([108, 110, 106])
+        finally:
+            msp_connection.stop_reader()
+
+        assert responses == {108: b'\x00' * 6, 110: b'\x7e' * 7}
+        assert fake_serial.timeout == 0.2
+
+    def test_flush_restarts_background_reader(self, msp_connection, fake_serial):
+        fake_serial.responses[108] = b'\x00' * 6
+        msp_connection.start_reader(poll_interval=0.01)
+        try:
+            fake_serial.rx += b'$M>\x06'  # Half a frame the reader is waiting on
+            msp_connection.flush()
+            assert msp_connection._reader.is_alive()
+            assert msp_connection.request(108) == b'\x00' * 6
+        finally:
+            msp_connection.stop_reader()
+
+    def test_failed_reader_falls_back_to_blocking_reads(self, msp_connection, fake_serial, monkeypatch):
+        fake_serial.responses[108] = b'\x00' * 6
+        parse = msp_connection._parse_frame
+        failed = threading.Event()
+
+        def broken_parse():
+            failed.set()
+            raise IndexError("buffer changed under the parser")
+
+        monkeypatch.setattr(msp_connection, '_parse_frame', broken_parse)
+        msp_connection.start_reader(poll_interval=0.01)
+        assert failed.wait(1)
+        msp_connection._reader.join(1)
+        monkeypatch.setattr(msp_connection, '_parse_frame', parse)
+
+        assert msp_connection._rx_queue is None
+        assert msp_connection.request(108) == b'\x00' * 6
+        msp_connection.stop_reader()
+
     def test_flight_controller_types(self):
         """Test that flight controller types are defined."""
         assert hasattr(FlightController, 'INAV')
@@ -62,6 +241,33 @@ class TestPackageStructure:
             # Some classes might not be implemented yet
             pytest.skip("Some classes not yet implemented")
 
+    def test_lazy_exports(self):
+        """Test that lazily imported names resolve and unknown names still fail."""
+        from mspkit.mission import Mission
+        
+        assert mspkit.Mission is Mission
+        assert 'Mission' in dir(mspkit)
+        with pytest.raises(AttributeError):
+            mspkit.NoSuchThing
+
+
+class TestGeo:
+    """Test geodetic conversion helpers."""
+
+    def test_geodetic_scales(self):
+        from mspkit.geo import geodetic_scales
+
+        lat_scale, lon_scale = geodetic_scales(60.0)
+        assert lat_scale == pytest.approx(1 / 111320.0)
+        assert lon_scale == pytest.approx(2 / 111320.0)
+
+    def test_angles_lut_cardinal_headings(self):
+        from mspkit.geo import ANGLES_LUT
+
+        assert [tuple(round(v) for v in cs) for cs in ANGLES_LUT] == [
+            (1, 0), (0, 1), (-1, 0), (0, -1)
+        ]
+
 
 @pytest.mark.hardware
 class TestHardwareConnection:
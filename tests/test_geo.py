@@ -0,0 +1,54 @@
+"""
+Tests for geodetic helpers.
+"""
+
+import pytest
+
+from mspkit.geo import ENUFrame, geodetic_scales, spiral_offsets
+
+
+class TestENUFrame:
+    """Test local tangent plane conversions."""
+
+    def test_offsets_use_reference_scales(self):
+        frame = ENUFrame(37.7749, -122.4194)
+        lat_scale, lon_scale = geodetic_scales(37.7749)
+
+        lat, lon = frame.to_geodetic(100, -50)
+
+        assert lat == pytest.approx(37.7749 - 50 * lat_scale)
+        assert lon == pytest.approx(-122.4194 + 100 * lon_scale)
+        assert frame.to_geodetic(0, 0) == (37.7749, -122.4194)
+
+    def test_converts_arrays_in_one_call(self):
+        np = pytest.importorskip("numpy")
+        frame = ENUFrame(47.6, 8.5)
+        east = np.array([0.0, 10.0, 20.0])
+        north = np.array([5.0, 0.0, -5.0])
+
+        lats, lons = frame.to_geodetic(east, north)
+
+        expected = [frame.to_geodetic(e, n) for e, n in zip(east.tolist(), north.tolist())]
+        assert lats.tolist() == pytest.approx([lat for lat, _ in expected])
+        assert lons.tolist() == pytest.approx([lon for _, lon in expected])
+
+
+class TestSpiralOffsets:
+    """Test spiral search pattern generation."""
+
+    def test_loops_and_headings(self):
+        offsets = spiral_offsets(80, radius_step=20, angle_step=30)
+
+        assert len(offsets) == 4 * 12
+        assert offsets[0] == pytest.approx((0.0, 20.0))
+        assert offsets[3] == pytest.approx((20.0, 0.0), abs=1e-9)
+        assert offsets[-12] == pytest.approx((0.0, 80.0))
+
+    def test_compiled_kernel_matches_python(self, monkeypatch):
+        pytest.importorskip("numba")
+        compiled = spiral_offsets(150, 20, 45)
+        monkeypatch.setattr('mspkit.geo._spiral_offsets_jit', None)
+        python = spiral_offsets(150, 20, 45)
+
+        assert all(type(p) is tuple for p in compiled)
+        assert [c for p in compiled for c in p] == pytest.approx([c for p in python for c in p])
@@ -0,0 +1,86 @@
+"""
+Tests for mission planning.
+These tests run against an in-memory serial port instead of hardware.
+"""
+
+import struct
+
+from mspkit import Mission, MSPCommands
+
+
+class TestMissionFiles:
+    """Test saving and loading missions."""
+
+    def test_save_and_load_round_trip(self, msp_connection, tmp_path):
+        mission = Mission(msp_connection)
+        mission.add_waypoint(37.7749, -122.4194, 50, param1=300)
+        mission.add_waypoint(37.7758, -122.4194, 50, action=Mission.WAYPOINT_ACTION_RTH)
+        filename = str(tmp_path / "mission.json")
+
+        assert mission.save_mission_to_file(filename)
+
+        loaded = Mission(msp_connection)
+        assert loaded.load_mission_from_file(filename)
+        assert loaded.get_waypoints() == mission.get_waypoints()
+
+
+class TestMissionBuilding:
+    """Test building missions locally."""
+
+    def test_add_waypoints_in_bulk(self, msp_connection):
+        mission = Mission(msp_connection)
+        coords = [(37.7749 + i * 1e-4, -122.4194) for i in range(10)]
+
+        assert mission.add_waypoints(coords, 40, param1=300)
+        assert mission.get_waypoint_count() == 10
+        assert mission.get_waypoints()[3]['lat'] == coords[3][0]
+        assert mission.get_waypoints()[3]['param1'] == 300
+
+    def test_add_waypoints_is_all_or_nothing(self, msp_connection):
+        mission = Mission(msp_connection)
+
+        assert not mission.add_waypoints([(37.7749, -122.4194), (91.0, 0.0)], 40)
+        assert not mission.add_waypoints([(0.0, 0.0)] * (Mission.MAX_WAYPOINTS + 1), 40)
+        assert mission.get_waypoint_count() == 0
+
+
+class TestMissionUpload:
+    """Test streaming missions to the flight controller."""
+
+    def test_upload_streams_waypoints(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_WP] = b''
+        mission = Mission(msp_connection)
+        mission.add_waypoints([(37.7749 + i * 1e-4, -122.4194) for i in range(12)], 40)
+
+        assert mission.upload_mission(validate=False, window=4)
+        # 12 waypoints plus 5 cleared slots
+        assert len(fake_serial.writes) == 17
+        assert fake_serial.in_waiting == 0
+
+    def test_upload_fails_without_acks(self, msp_connection, fake_serial):
+        mission = Mission(msp_connection)
+        mission.add_waypoint(37.7749, -122.4194, 40)
+
+        assert not mission.upload_mission(validate=False)
+
+    def test_upload_verifies_read_back(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_SET_WP] = b''
+        fake_serial.responses[MSPCommands.MSP_WP] = struct.pack(
+            '<BBiiihhhB', 0, 1, 377749000, -1224194000, 4000, 0, 0, 0, 0)
+        mission = Mission(msp_connection)
+        mission.add_waypoint(37.7749, -122.4194, 40)
+
+        assert mission.upload_mission()
+
+        mission.waypoints[0].alt = 60
+        assert not mission.upload_mission()
+
+    def test_empty_read_back_fails_the_waypoint(self, msp_connection, fake_serial, caplog):
+        fake_serial.responses[MSPCommands.MSP_SET_WP] = b''
+        fake_serial.responses[MSPCommands.MSP_WP] = b''
+        mission = Mission(msp_connection)
+        mission.add_waypoint(37.7749, -122.4194, 40)
+
+        assert not mission.upload_mission()
+        assert "Waypoint 0 verification failed" in caplog.text
+        assert "Mission upload failed" not in caplog.text
@@ -0,0 +1,131 @@
+"""
+Tests for the fixed-rate loop helpers.
+These tests run against a simulated clock instead of real time.
+"""
+
+import resource
+
+import pytest
+
+from mspkit import rt
+
+
+class FakeClock:
+    """Monotonic clock that only moves when slept on or advanced."""
+
+    def __init__(self):
+        self.now_ns = 1_000_000_000
+        self.sleeps = []
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now_ns += int(seconds * 1e9)
+
+    def advance(self, seconds):
+        self.now_ns += int(seconds * 1e9)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock used by mspkit.rt."""
+    fake = FakeClock()
+    monkeypatch.setattr(rt, 'time', fake)
+    return fake
+
+
+class TestTicks:
+    """Test absolute-deadline loop timing."""
+
+    def test_latency_does_not_accumulate(self, clock):
+        elapsed = []
+        for t in rt.ticks(0.1, duration=1.0):
+            elapsed.append(t)
+            clock.advance(0.03)
+
+        assert len(elapsed) == 10
+        assert elapsed[-1] == pytest.approx(0.9)
+        assert all(s == pytest.approx(0.07) for s in clock.sleeps)
+
+    def test_overrun_skips_missed_slots(self, clock):
+        elapsed = []
+        for i, t in zip(range(3), rt.ticks(0.1)):
+            elapsed.append(t)
+            if i == 0:
+                clock.advance(0.25)
+
+        assert elapsed == pytest.approx([0.0, 0.3, 0.4])
+
+
+class TestPreciseSleep:
+    """Test the hybrid sleep/spin wait."""
+
+    def test_spins_through_the_end_of_the_wait(self, clock, monkeypatch):
+        reads = []
+
+        def monotonic_ns():
+            reads.append(clock.now_ns)
+            clock.now_ns += 100_000  # Every clock read costs 0.1 ms
+            return reads[-1]
+
+        monkeypatch.setattr(clock, 'monotonic_ns', monotonic_ns)
+        start = clock.now_ns
+
+        rt.precise_sleep(0.2, spin_ns=2_000_000)
+
+        assert len(clock.sleeps) == 1
+        assert clock.sleeps[0] == pytest.approx(0.198, abs=1e-3)
+        assert start + 200_000_000 <= reads[-1] < start + 200_200_000
+
+
+class TestRealtimePriority:
+    """Test scheduling changes are undone after the block."""
+
+    def test_falls_back_to_nice_and_restores(self, monkeypatch):
+        if not hasattr(rt.os, 'sched_setscheduler'):
+            pytest.skip("POSIX scheduling not available")
+
+        def deny(*args):
+            raise PermissionError("not permitted")
+
+        niceness = [0]
+
+        def nice(increment):
+            niceness[0] += increment
+            return niceness[0]
+
+        monkeypatch.setattr(rt.os, 'sched_setscheduler', deny)
+        monkeypatch.setattr(rt.os, 'nice', nice)
+
+        with rt.realtime_priority():
+            assert niceness[0] == -20
+        assert niceness[0] == 0
+
+    def test_pins_and_restores_affinity(self, monkeypatch):
+        if not hasattr(rt.os, 'sched_setaffinity'):
+            pytest.skip("CPU affinity not available")
+        monkeypatch.setattr(rt.os, 'sched_setscheduler', lambda *args: None)
+        original = rt.os.sched_getaffinity(0)
+        cpu = min(original)
+        monkeypatch.setenv('MSPKIT_RT_CPU', str(cpu))
+
+        with rt.realtime_priority():
+            assert rt.os.sched_getaffinity(0) == {cpu}
+        assert rt.os.sched_getaffinity(0) == original
+
+
+class TestLockMemory:
+    """Test memory locking reports failure instead of raising."""
+
+    def test_mlockall_failure_returns_false(self, monkeypatch):
+        class FakeLibc:
+            def mlockall(self, flags):
+                return -1
+
+        monkeypatch.setattr(rt.sys, 'platform', 'linux')
+        monkeypatch.setattr(rt.ctypes, 'CDLL', lambda *args, **kwargs: FakeLibc())
+        monkeypatch.setattr(resource, 'setrlimit', lambda *args: None)
+
+        assert rt.lock_memory() is False
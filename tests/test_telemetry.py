@@ -0,0 +1,183 @@
+"""
+Tests for telemetry data access.
+These tests run against an in-memory serial port instead of hardware.
+"""
+
+import struct
+
+import pytest
+
+from mspkit import Telemetry, MSPCommands, TelemetrySection, get_flight_data
+
+
+ATTITUDE = struct.pack('<hhh', 52, -21, 180)
+GPS = bytes([2, 9]) + struct.pack('<iiiHH', 476062000, -1223321000, 15000, 250, 900)
+ANALOG = bytes([126]) + struct.pack('<HHh', 1200, 512, 520)
+
+
+class TestTelemetryBundle:
+    """Test pipelined multi-section telemetry reads."""
+
+    def test_bundle_uses_single_write(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_ATTITUDE: ATTITUDE,
+            MSPCommands.MSP_RAW_GPS: GPS,
+            MSPCommands.MSP_ANALOG: ANALOG,
+        })
+        telem = Telemetry(msp_connection)
+
+        bundle = telem.get_bundle([
+            MSPCommands.MSP_ATTITUDE,
+            MSPCommands.MSP_RAW_GPS,
+            MSPCommands.MSP_ANALOG,
+        ])
+
+        assert len(fake_serial.writes) == 1
+        assert bundle['attitude'] == {'roll': 5.2, 'pitch': -2.1, 'yaw': 180}
+        assert bundle['gps']['num_satellites'] == 9
+        assert bundle['gps']['latitude'] == pytest.approx(47.6062)
+        assert bundle['analog']['voltage'] == pytest.approx(12.6)
+
+    def test_bundle_skips_rejected_sections(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_ATTITUDE] = ATTITUDE
+        telem = Telemetry(msp_connection)
+
+        bundle = telem.get_bundle([MSPCommands.MSP_RAW_GPS, MSPCommands.MSP_ATTITUDE])
+
+        assert set(bundle) == {'attitude'}
+
+    def test_bundle_rejects_unknown_commands(self, msp_connection):
+        with pytest.raises(ValueError):
+            Telemetry(msp_connection).get_bundle([MSPCommands.MSP_PID])
+
+    def test_single_getter_matches_bundle(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_RAW_GPS] = GPS
+        telem = Telemetry(msp_connection)
+
+        assert telem.get_gps() == telem.get_bundle([MSPCommands.MSP_RAW_GPS])['gps']
+
+    def test_all_telemetry_is_one_burst(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_ATTITUDE: ATTITUDE,
+            MSPCommands.MSP_ANALOG: ANALOG,
+        })
+        telem = Telemetry(msp_connection)
+
+        data = telem.get_all_telemetry()
+
+        assert len(fake_serial.writes) == 1
+        assert list(data) == ['attitude', 'analog']
+
+    def test_flight_data_requests_only_selected_sections(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_ATTITUDE: ATTITUDE,
+            MSPCommands.MSP_ANALOG: ANALOG,
+        })
+
+        data = get_flight_data(msp_connection, TelemetrySection.ATTITUDE | TelemetrySection.IMU)
+
+        assert set(data) == {'attitude'}
+        assert fake_serial.writes[0].count(b'$X<') == 2
+
+    def test_connection_shares_one_telemetry(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_ATTITUDE] = ATTITUDE
+
+        assert msp_connection.telemetry is msp_connection.telemetry
+        get_flight_data(msp_connection)
+        msp_connection.telemetry.get_attitude()
+
+        assert len(fake_serial.writes) == 1
+
+
+class TestTelemetryCache:
+    """Test reuse of fresh responses."""
+
+    def test_back_to_back_reads_share_a_request(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_RAW_GPS] = GPS
+        telem = Telemetry(msp_connection)
+
+        assert telem.get_gps() == telem.get_gps()
+        assert len(fake_serial.writes) == 1
+
+    def test_bundle_refreshes_cache(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_ATTITUDE] = ATTITUDE
+        telem = Telemetry(msp_connection)
+
+        telem.get_bundle([MSPCommands.MSP_ATTITUDE])
+        telem.get_attitude()
+
+        assert len(fake_serial.writes) == 1
+
+    def test_zero_ttl_always_requests(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_RAW_GPS] = GPS
+        telem = Telemetry(msp_connection, cache_ttl=0)
+
+        telem.get_gps()
+        telem.get_gps()
+
+        assert len(fake_serial.writes) == 2
+
+
+class TestTelemetryViews:
+    """Test decoding into reused records."""
+
+    def test_views_match_getters(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_ATTITUDE: ATTITUDE,
+            MSPCommands.MSP_RAW_GPS: GPS,
+        })
+        telem = Telemetry(msp_connection)
+
+        assert telem.read_attitude().as_dict() == telem.get_attitude()
+        gps = telem.read_gps().as_dict()
+        expected = telem.get_gps()
+        assert gps.pop('fix_type') == 2
+        assert expected.pop('fix_type') == 'FIX_2D'
+        assert gps == expected
+
+    def test_view_is_updated_in_place(self, msp_connection, fake_serial):
+        fake_serial.responses[MSPCommands.MSP_ATTITUDE] = ATTITUDE
+        telem = Telemetry(msp_connection, cache_ttl=0)
+
+        first = telem.read_attitude()
+        fake_serial.responses[MSPCommands.MSP_ATTITUDE] = struct.pack('<hhh', -10, 30, 90)
+        second = telem.read_attitude()
+
+        assert second is first
+        assert (second.roll, second.pitch, second.yaw) == (-1.0, 3.0, 90)
+        with pytest.raises(AttributeError):
+            second.altitude = 0
+
+    def test_prefetched_views_share_one_burst(self, msp_connection, fake_serial):
+        fake_serial.responses.update({
+            MSPCommands.MSP_ATTITUDE: ATTITUDE,
+            MSPCommands.MSP_RAW_GPS: GPS,
+            MSPCommands.MSP_ANALOG: ANALOG,
+        })
+        telem = Telemetry(msp_connection)
+
+        telem.prefetch(TelemetrySection.ATTITUDE | TelemetrySection.GPS | TelemetrySection.ANALOG)
+
+        assert telem.read_attitude().roll == pytest.approx(5.2)
+        assert telem.read_gps().num_satellites == 9
+        assert telem.read_analog().voltage == pytest.approx(12.6)
+        assert len(fake_serial.writes) == 1
+
+    def test_status_view_and_getter_accept_same_payloads(self, msp_connection, fake_serial):
+        status = struct.pack('<HHHIB', 1000, 0, 0b11, 1 << 0 | 1 << 20, 2)
+        fake_serial.responses[MSPCommands.MSP_STATUS] = status[:10]
+        telem = Telemetry(msp_connection, cache_ttl=0)
+
+        assert telem.read_status() is None
+        assert telem.get_status() is None
+
+        fake_serial.responses[MSPCommands.MSP_STATUS] = status
+        view = telem.read_status()
+        assert view.armed and view.current_profile == 2
+        assert view.as_dict() == {key: telem.get_status()[key] for key in view.as_dict()}
+
+    def test_missing_section_reads_none(self, msp_connection, fake_serial):
+        telem = Telemetry(msp_connection)
+
+        assert telem.read_status() is None
+        assert telem.read_analog() is None